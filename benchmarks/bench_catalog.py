@@ -0,0 +1,87 @@
+"""Benchmark aggregated catalog list latency for growing tool counts.
+
+Compares rebuilding the catalog on every request with serving the cached
+snapshot and answering a not-modified check.
+
+Usage:
+    python benchmarks/bench_catalog.py
+"""
+
+import statistics
+import time
+from collections.abc import Callable
+from functools import partial
+
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.value_objects import (
+    BackendConfig,
+    BackendSource,
+    BackendSourceType,
+)
+from mcp_server.presentation import CompositionRoot
+from mcp_server.presentation.capability_catalog import CapabilityCatalog
+
+TOOL_COUNTS = (100, 1_000, 10_000)
+TOOLS_PER_BACKEND = 100
+
+
+def build_catalog(tool_count: int) -> CapabilityCatalog:
+    repository = CompositionRoot("backends.yaml").backend_repository
+    for index in range(max(1, tool_count // TOOLS_PER_BACKEND)):
+        backend = Backend(
+            config=BackendConfig(
+                name=f"backend{index}",
+                source=BackendSource(
+                    source_type=BackendSourceType.HTTP,
+                    http_url=f"http://localhost:{9000 + index}",
+                ),
+                namespace=f"ns{index}",
+            )
+        )
+        backend.update_capabilities(
+            [
+                {
+                    "name": f"tool{i}",
+                    "description": f"Tool {i} of backend {index}",
+                    "inputSchema": {
+                        "type": "object",
+                        "properties": {"query": {"type": "string"}},
+                    },
+                }
+                for i in range(min(tool_count, TOOLS_PER_BACKEND))
+            ],
+            [],
+            [],
+        )
+        repository.add(backend)
+    return CapabilityCatalog(repository, enable_namespace_prefixing=True)
+
+
+def measure(fn: Callable[[], object], repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def main() -> None:
+    print(f"{'tools':>8} {'rebuild ms':>12} {'snapshot ms':>12} {'304 check ms':>13}")
+    for tool_count in TOOL_COUNTS:
+        catalog = build_catalog(tool_count)
+        backends = catalog.backend_repository.get_all()
+        version = catalog.snapshot().version
+        repeat = 20 if tool_count >= 10_000 else 200
+
+        rebuild = measure(partial(catalog._build, backends), repeat)
+        snapshot = measure(catalog.snapshot, repeat)
+        not_modified = measure(partial(catalog.is_current, version), repeat)
+
+        print(
+            f"{tool_count:>8} {rebuild:>12.3f} {snapshot:>12.4f} {not_modified:>13.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""Benchmark proxied prompt renders with and without the render cache.
+
+Renders a proxied prompt through an in-memory MCP client against a simulated
+backend with fixed latency, first with the render cache disabled and then
+enabled, and reports median latency and how many renders reached the backend.
+
+Usage:
+    python benchmarks/bench_prompts.py
+"""
+
+import asyncio
+import statistics
+import time
+from typing import Any
+
+from fastmcp import Client, FastMCP
+
+from mcp_server.application.ports import MCPClientPort
+from mcp_server.application.use_cases import ReadResource, RenderPrompt, RouteToolCall
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.value_objects import (
+    BackendConfig,
+    BackendSource,
+    BackendSourceType,
+)
+from mcp_server.infrastructure.repositories import InMemoryBackendRepository
+from mcp_server.presentation.capability_registrar import CapabilityRegistrar
+
+BACKEND_LATENCY_SECONDS = 0.005
+RENDERS = 200
+DISTINCT_ARGUMENTS = 10
+
+
+class SimulatedBackend(MCPClientPort):
+    def __init__(self) -> None:
+        self.renders = 0
+
+    async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
+        return None
+
+    async def get_resource(self, uri: str) -> str:
+        return ""
+
+    async def get_prompt(self, prompt_name: str, arguments: dict[str, Any]) -> str:
+        self.renders += 1
+        await asyncio.sleep(BACKEND_LATENCY_SECONDS)
+        return f"Review the {arguments.get('language')} change carefully."
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        return []
+
+    async def list_resources(self) -> list[dict[str, Any]]:
+        return []
+
+    async def list_prompts(self) -> list[dict[str, Any]]:
+        return []
+
+
+async def build_server(ttl_seconds: float) -> tuple[FastMCP, SimulatedBackend]:
+    backend_client = SimulatedBackend()
+    client_factory: dict[str, MCPClientPort] = {"alpha": backend_client}
+    repository = InMemoryBackendRepository()
+    backend = Backend(
+        config=BackendConfig(
+            name="alpha",
+            source=BackendSource(
+                source_type=BackendSourceType.HTTP,
+                http_url="http://localhost:9001",
+            ),
+            namespace="alpha",
+        )
+    )
+    backend.update_capabilities(
+        [], [], [{"name": "review", "arguments": [{"name": "language"}]}]
+    )
+    repository.add(backend)
+
+    server = FastMCP("bench-prompts")
+    registrar = CapabilityRegistrar(
+        server=server,
+        route_tool_call=RouteToolCall(repository, client_factory),
+        read_resource=ReadResource(repository, client_factory),
+        render_prompt=RenderPrompt(client_factory, ttl_seconds=ttl_seconds),
+        enable_namespace_prefixing=True,
+    )
+    await registrar.capabilities_changed(backend)
+    return server, backend_client
+
+
+async def measure(ttl_seconds: float) -> tuple[float, float, int]:
+    server, backend_client = await build_server(ttl_seconds)
+    samples = []
+    async with Client(server) as client:
+        for i in range(RENDERS):
+            arguments = {"language": f"lang{i % DISTINCT_ARGUMENTS}"}
+            started = time.perf_counter()
+            await client.get_prompt("alpha.review", arguments)
+            samples.append(time.perf_counter() - started)
+    samples.sort()
+    return (
+        statistics.median(samples) * 1000,
+        samples[int(len(samples) * 0.99) - 1] * 1000,
+        backend_client.renders,
+    )
+
+
+async def main() -> None:
+    print(f"{'cache':>8} {'p50 ms':>10} {'p99 ms':>10} {'backend renders':>16}")
+    for label, ttl_seconds in (("off", 0.0), ("on", 60.0)):
+        p50, p99, renders = await measure(ttl_seconds)
+        print(f"{label:>8} {p50:>10.3f} {p99:>10.3f} {renders:>16}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,236 @@
+"""Microbenchmark the pure routing layer against generated catalogs.
+
+Measures the cost of one routing decision for route_by_capability,
+route_by_path, route_by_fallback, the legacy RoutingEngine and
+InMemoryBackendRepository.get_with_tool. Catalog sizes are backends x total
+tools, with tools spread evenly over the backends.
+
+Usage:
+    python benchmarks/bench_routing.py                  # print results
+    python benchmarks/bench_routing.py --save-baseline  # record a new baseline
+    python benchmarks/bench_routing.py --check          # fail on regressions
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.services import (
+    route_by_capability,
+    route_by_fallback,
+    route_by_path,
+)
+from mcp_server.domain.value_objects import (
+    BackendConfig,
+    BackendSource,
+    BackendSourceType,
+    RoutePattern,
+)
+from mcp_server.presentation import CompositionRoot
+from mcp_server.routing import backends as legacy_backends
+from mcp_server.routing import models as legacy_models
+from mcp_server.routing.engine import RoutingEngine
+
+CATALOGS = ((10, 10), (50, 500), (100, 1_000), (250, 2_500), (500, 5_000))
+LOOKUPS = 256
+MIN_SECONDS = 0.2
+REPEAT = 5
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "routing.json"
+
+
+def tool_names(backend_count: int, tool_count: int) -> list[list[str]]:
+    per_backend = max(1, tool_count // backend_count)
+    return [
+        [f"b{b}_tool_{t}" for t in range(per_backend)] for b in range(backend_count)
+    ]
+
+
+def build_backends(names: list[list[str]]) -> list[Backend]:
+    backends = []
+    for index, tools in enumerate(names):
+        backend = Backend(
+            config=BackendConfig(
+                name=f"b{index}",
+                source=BackendSource(
+                    source_type=BackendSourceType.HTTP,
+                    http_url=f"http://localhost:{9000 + index}",
+                ),
+                namespace=f"b{index}",
+                priority=index % 10,
+                routes=(RoutePattern(pattern=f"b{index}_*", strategy="path"),),
+            )
+        )
+        backend.update_capabilities([{"name": name} for name in tools], [], [])
+        backends.append(backend)
+    return backends
+
+
+def build_legacy_backends(names: list[list[str]]) -> list[legacy_backends.Backend]:
+    backends = []
+    for index, tools in enumerate(names):
+        backend = legacy_backends.Backend(
+            config=legacy_models.BackendConfig(
+                name=f"b{index}",
+                url=f"http://localhost:{9000 + index}",
+                namespace=f"b{index}",
+                priority=index % 10,
+                routes=[
+                    legacy_models.RouteConfig(pattern=f"b{index}_*", strategy="path")
+                ],
+            ),
+            client=None,
+        )
+        backend.tools = [{"name": name} for name in tools]
+        backends.append(backend)
+    return backends
+
+
+def measure(fn: Callable[[str], object], lookups: list[str]) -> float:
+    iterations = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            for name in lookups:
+                fn(name)
+        elapsed = time.perf_counter() - started
+        if elapsed >= MIN_SECONDS:
+            break
+        iterations *= 2
+
+    best = elapsed
+    for _ in range(REPEAT - 1):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            for name in lookups:
+                fn(name)
+        best = min(best, time.perf_counter() - started)
+    return best / (iterations * len(lookups)) * 1e9
+
+
+def measure_async(
+    fn: Callable[[str], object], lookups: list[str], loop: asyncio.AbstractEventLoop
+) -> float:
+    async def batch(iterations: int) -> None:
+        for _ in range(iterations):
+            for name in lookups:
+                await fn(name)
+
+    iterations = 1
+    while True:
+        started = time.perf_counter()
+        loop.run_until_complete(batch(iterations))
+        elapsed = time.perf_counter() - started
+        if elapsed >= MIN_SECONDS:
+            break
+        iterations *= 2
+
+    best = elapsed
+    for _ in range(REPEAT - 1):
+        started = time.perf_counter()
+        loop.run_until_complete(batch(iterations))
+        best = min(best, time.perf_counter() - started)
+    return best / (iterations * len(lookups)) * 1e9
+
+
+def run_catalog(
+    backend_count: int, tool_count: int, loop: asyncio.AbstractEventLoop
+) -> dict[str, float]:
+    names = tool_names(backend_count, tool_count)
+    rng = random.Random(0)
+    lookups = [rng.choice(rng.choice(names)) for _ in range(LOOKUPS)]
+
+    backends = build_backends(names)
+    repository = CompositionRoot("backends.yaml").backend_repository
+    for backend in backends:
+        repository.add(backend)
+    legacy = build_legacy_backends(names)
+    engine = RoutingEngine()
+
+    return {
+        "route_by_capability": measure(
+            lambda name: route_by_capability(name, backends), lookups
+        ),
+        "route_by_path": measure(lambda name: route_by_path(name, backends), lookups),
+        "route_by_fallback": measure(
+            lambda name: route_by_fallback(name, backends), lookups
+        ),
+        "get_with_tool": measure(repository.get_with_tool, lookups),
+        "route_tool_call_lookup": measure(
+            lambda name: route_by_capability(name, repository.get_with_tool(name)),
+            lookups,
+        ),
+        "legacy_capability": measure_async(
+            lambda name: engine.route_by_capability(name, legacy), lookups, loop
+        ),
+        "legacy_path": measure_async(
+            lambda name: engine.route_by_path(name, legacy), lookups, loop
+        ),
+        "legacy_fallback": measure_async(
+            lambda name: engine.route_by_fallback(name, legacy), lookups, loop
+        ),
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for catalog, benchmarks in results.items():
+        for name, ns in benchmarks.items():
+            base = baseline.get(catalog, {}).get(name)
+            if base and ns > base * (1 + tolerance):
+                regressions.append(
+                    f"{catalog} {name}: {ns:.0f} ns > baseline {base:.0f} ns"
+                )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.3)
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    results: dict[str, dict[str, float]] = {}
+    try:
+        for backend_count, tool_count in CATALOGS:
+            catalog = f"{backend_count}x{tool_count}"
+            results[catalog] = {
+                name: round(ns, 1)
+                for name, ns in run_catalog(backend_count, tool_count, loop).items()
+            }
+            print(f"{catalog} backends x tools (ns per decision)", file=sys.stderr)
+            for name, ns in results[catalog].items():
+                print(f"  {name:<24}{ns:>14,.0f}", file=sys.stderr)
+    finally:
+        loop.close()
+
+    output = json.dumps(results, indent=2) + "\n"
+    print(output)
+    if args.output:
+        args.output.write_text(output)
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(output)
+        print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+
+    if args.check:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
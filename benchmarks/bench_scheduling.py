@@ -0,0 +1,133 @@
+"""Benchmark interactive tail latency while batch traffic saturates a backend.
+
+A simulated backend with fixed latency is capped at a few concurrent calls. A
+batch client keeps its queue full while an interactive client issues calls one
+after another. Interactive latency is reported with a single shared queue and
+with separate priority classes, along with how much batch work got through.
+
+Usage:
+    python benchmarks/bench_scheduling.py
+"""
+
+import asyncio
+import statistics
+import time
+from typing import Any
+
+from mcp_server.application.dtos import ToolCallRequest
+from mcp_server.application.ports import MCPClientPort
+from mcp_server.application.use_cases import RouteToolCall
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.value_objects import (
+    BackendConfig,
+    BackendSource,
+    BackendSourceType,
+    PriorityClass,
+    SchedulingSettings,
+)
+from mcp_server.infrastructure.adapters import FairRequestScheduler
+from mcp_server.infrastructure.repositories import InMemoryBackendRepository
+
+BACKEND_LATENCY_SECONDS = 0.01
+MAX_CONCURRENCY = 4
+BATCH_WORKERS = 64
+INTERACTIVE_CALLS = 100
+
+SCENARIOS = {
+    "shared queue": SchedulingSettings(max_concurrency=MAX_CONCURRENCY),
+    "priority classes": SchedulingSettings(
+        max_concurrency=MAX_CONCURRENCY,
+        classes=(
+            PriorityClass("interactive", weight=4, preemptive=True, clients=("ui",)),
+            PriorityClass("batch", weight=1, clients=("batch",)),
+        ),
+    ),
+}
+
+
+class SimulatedBackend(MCPClientPort):
+    async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
+        await asyncio.sleep(BACKEND_LATENCY_SECONDS)
+        return {}
+
+    async def get_resource(self, uri: str) -> str:
+        return ""
+
+    async def get_prompt(self, prompt_name: str, arguments: dict[str, Any]) -> str:
+        return ""
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        return []
+
+    async def list_resources(self) -> list[dict[str, Any]]:
+        return []
+
+    async def list_prompts(self) -> list[dict[str, Any]]:
+        return []
+
+
+def build_route(settings: SchedulingSettings) -> RouteToolCall:
+    repository = InMemoryBackendRepository()
+    backend = Backend(
+        config=BackendConfig(
+            name="alpha",
+            source=BackendSource(
+                source_type=BackendSourceType.HTTP,
+                http_url="http://localhost:9001",
+            ),
+            namespace="alpha",
+            scheduling=settings,
+        )
+    )
+    backend.update_capabilities([{"name": "work"}], [], [])
+    repository.add(backend)
+    return RouteToolCall(
+        repository, {"alpha": SimulatedBackend()}, scheduler=FairRequestScheduler()
+    )
+
+
+async def run(settings: SchedulingSettings) -> tuple[float, float, int]:
+    route = build_route(settings)
+    stop = asyncio.Event()
+    batch_done = 0
+
+    async def batch_worker() -> None:
+        nonlocal batch_done
+        while not stop.is_set():
+            await route.execute(
+                ToolCallRequest(tool_name="work", arguments={}, client_id="batch")
+            )
+            batch_done += 1
+
+    workers = [asyncio.create_task(batch_worker()) for _ in range(BATCH_WORKERS)]
+    await asyncio.sleep(BACKEND_LATENCY_SECONDS * 5)
+
+    samples = []
+    started_all = time.perf_counter()
+    for _ in range(INTERACTIVE_CALLS):
+        started = time.perf_counter()
+        await route.execute(
+            ToolCallRequest(tool_name="work", arguments={}, client_id="ui")
+        )
+        samples.append(time.perf_counter() - started)
+    elapsed = time.perf_counter() - started_all
+
+    stop.set()
+    await asyncio.gather(*workers)
+    samples.sort()
+    return (
+        statistics.median(samples) * 1000,
+        samples[int(len(samples) * 0.99) - 1] * 1000,
+        round(batch_done / elapsed),
+    )
+
+
+async def main() -> None:
+    print(f"{'scenario':>18} {'interactive p50 ms':>19} {'p99 ms':>8} {'batch/s':>8}")
+    for label, settings in SCENARIOS.items():
+        p50, p99, batch_rate = await run(settings)
+        print(f"{label:>18} {p50:>19.2f} {p99:>8.2f} {batch_rate:>8}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,243 @@
+"""Benchmark import time and router startup latency.
+
+Each module is imported in a fresh interpreter with ``-X importtime``. The
+benchmark reports the cumulative import time and the share spent in
+mcp_server's own modules. Startup is measured as the time from spawning a
+stdio router (with an empty backends file) or the template server until it
+answers an MCP ``initialize`` request.
+
+Every measurement has a regression budget of baseline * (1 + tolerance), and at
+least baseline + --slack-ms, so that millisecond-sized imports don't fail on
+noise.
+
+Usage:
+    python benchmarks/bench_startup.py                  # print results and budgets
+    python benchmarks/bench_startup.py --save-baseline  # record a new baseline
+    python benchmarks/bench_startup.py --check          # fail on regressions
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_PATH = Path(__file__).resolve().parent / "baselines" / "startup.json"
+
+MODULES = (
+    "mcp_server",
+    "mcp_server.config",
+    "mcp_server.server",
+    "mcp_server.domain",
+    "mcp_server.application",
+    "mcp_server.infrastructure",
+    "mcp_server.infrastructure.adapters.http_mcp_client",
+    "mcp_server.infrastructure.config.yaml_backend_config_repository",
+    "mcp_server.presentation.composition_root",
+    "mcp_server.presentation.server_factory",
+    "fastmcp",
+    "httpx",
+    "yaml",
+    "watchfiles",
+    "jsonschema",
+)
+
+STARTUP_TARGETS = {
+    "router_stdio": "from mcp_server.server import main_router; main_router()",
+    "template_stdio": "from mcp_server.server import main; main()",
+}
+
+INITIALIZE = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2025-06-18",
+        "capabilities": {},
+        "clientInfo": {"name": "bench-startup", "version": "0"},
+    },
+}
+
+
+def environment(config_path: Path) -> dict[str, str]:
+    return {
+        **os.environ,
+        "PYTHONPATH": str(ROOT / "src"),
+        "PYTHONWARNINGS": "ignore",
+        "MCP_BACKENDS_CONFIG": str(config_path),
+        "MCP_PORT": "0",
+        "MCP_LOOP_LAG_INTERVAL_MS": "0",
+        "FASTMCP_LOG_LEVEL": "WARNING",
+    }
+
+
+def parse_importtime(stderr: str, module: str) -> tuple[float, float]:
+    cumulative = 0.0
+    own = 0.0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        self_us, cumulative_us, name = fields
+        name = name.strip()
+        if name == "mcp_server" or name.startswith("mcp_server."):
+            own += int(self_us)
+        if name == module:
+            cumulative = int(cumulative_us)
+    return cumulative / 1000, own / 1000
+
+
+def measure_import(module: str, env: dict[str, str], repeat: int) -> dict[str, float]:
+    cumulative = []
+    own = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        total, own_ms = parse_importtime(result.stderr, module)
+        cumulative.append(total)
+        own.append(own_ms)
+    return {
+        "cumulative_ms": round(statistics.median(cumulative), 1),
+        "own_ms": round(statistics.median(own), 1),
+    }
+
+
+def measure_startup(code: str, env: dict[str, str], repeat: int) -> float:
+    samples = []
+    request = (json.dumps(INITIALIZE) + "\n").encode()
+    for _ in range(repeat):
+        started = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-c", code],
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            assert process.stdin and process.stdout
+            process.stdin.write(request)
+            process.stdin.flush()
+            line = process.stdout.readline()
+            elapsed = time.perf_counter() - started
+            if not line:
+                raise RuntimeError(f"Server exited without answering: {code}")
+            samples.append(elapsed * 1000)
+        finally:
+            process.kill()
+            process.wait()
+    return round(statistics.median(samples), 1)
+
+
+def budget(base: float, tolerance: float, slack_ms: float) -> float:
+    return max(base * (1 + tolerance), base + slack_ms)
+
+
+def flatten(results: dict) -> dict[str, float]:
+    flat = {}
+    for module, values in results["imports"].items():
+        flat[f"import {module}"] = values["cumulative_ms"]
+        if module.startswith("mcp_server"):
+            flat[f"import {module} (own)"] = values["own_ms"]
+    for target, ms in results["startup"].items():
+        flat[f"startup {target}"] = ms
+    return flat
+
+
+def report(
+    results: dict, baseline: dict | None, tolerance: float, slack_ms: float
+) -> list[str]:
+    current = flatten(results)
+    base = flatten(baseline) if baseline else {}
+    regressions = []
+    print(
+        f"{'measurement':<78}{'ms':>9}{'baseline':>10}{'budget':>10}",
+        file=sys.stderr,
+    )
+    for name, ms in current.items():
+        reference = base.get(name)
+        if reference is None:
+            print(f"{name:<78}{ms:>9.1f}{'-':>10}{'-':>10}", file=sys.stderr)
+            continue
+        limit = budget(reference, tolerance, slack_ms)
+        flag = ""
+        if ms > limit:
+            flag = "  REGRESSION"
+            regressions.append(f"{name}: {ms:.1f} ms > budget {limit:.1f} ms")
+        print(
+            f"{name:<78}{ms:>9.1f}{reference:>10.1f}{limit:>10.1f}{flag}",
+            file=sys.stderr,
+        )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--slack-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        config_path = Path(tmp) / "backends.yaml"
+        config_path.write_text("backends: []\n")
+        env = environment(config_path)
+        results = {
+            "host": {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "cpus": os.cpu_count(),
+            },
+            "imports": {
+                module: measure_import(module, env, args.repeat) for module in MODULES
+            },
+            "startup": {
+                f"{name}_first_response_ms": measure_startup(code, env, args.repeat)
+                for name, code in STARTUP_TARGETS.items()
+            },
+        }
+
+    baseline = None
+    if args.baseline.exists() and not args.save_baseline:
+        baseline = json.loads(args.baseline.read_text())
+    regressions = report(results, baseline, args.tolerance, args.slack_ms)
+
+    output = json.dumps(results, indent=2) + "\n"
+    print(output)
+    if args.output:
+        args.output.write_text(output)
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(output)
+        print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+
+    if args.check:
+        if baseline is None:
+            print(f"No baseline at {args.baseline}", file=sys.stderr)
+            return 1
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""Benchmark router-side tool argument validation.
+
+Measures the per-call cost of validating arguments against a precompiled
+JSON Schema validator for valid and invalid payloads.
+
+Usage:
+    python benchmarks/bench_validation.py
+"""
+
+import time
+
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.exceptions import InvalidToolArgumentsError
+from mcp_server.domain.value_objects import (
+    BackendConfig,
+    BackendSource,
+    BackendSourceType,
+)
+from mcp_server.presentation import CompositionRoot
+
+ITERATIONS = 20_000
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "query": {"type": "string", "minLength": 1},
+        "limit": {"type": "integer", "minimum": 1, "maximum": 100},
+        "filters": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["query"],
+}
+
+
+def main() -> None:
+    validator = CompositionRoot("backends.yaml").argument_validator
+    backend = Backend(
+        config=BackendConfig(
+            name="bench",
+            source=BackendSource(
+                source_type=BackendSourceType.HTTP,
+                http_url="http://localhost:9000",
+            ),
+            namespace="bench",
+        )
+    )
+    backend.update_capabilities([{"name": "search", "inputSchema": SCHEMA}], [], [])
+    validator.update_backend(backend)
+
+    valid = {"query": "router", "limit": 10, "filters": ["a", "b"]}
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        validator.validate("bench", "search", valid)
+    valid_us = (time.perf_counter() - started) / ITERATIONS * 1e6
+
+    invalid = {"limit": 0}
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        try:
+            validator.validate("bench", "search", invalid)
+        except InvalidToolArgumentsError:
+            pass
+    invalid_us = (time.perf_counter() - started) / ITERATIONS * 1e6
+
+    print(f"valid call:   {valid_us:.2f} us")
+    print(f"invalid call: {invalid_us:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Simulated backend for router load tests.
+
+Serves the HTTP endpoints HTTPMCPClient talks to (GET /tools, /resources,
+/prompts and POST /tools/{name}) with a configurable latency distribution,
+response payload size and error rate.
+
+Usage:
+    python benchmarks/fake_backend.py --port 9001 --tools 50 --latency-ms 5
+"""
+
+import argparse
+import asyncio
+import math
+import random
+from dataclasses import dataclass
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+
+@dataclass(frozen=True)
+class BackendProfile:
+    name: str = "bench"
+    tools: int = 10
+    latency_ms: float = 5.0
+    latency_sigma: float = 0.5
+    payload_bytes: int = 256
+    error_rate: float = 0.0
+    seed: int | None = None
+
+    @property
+    def tool_names(self) -> list[str]:
+        return [f"{self.name}_tool_{i}" for i in range(self.tools)]
+
+    def sample_latency(self, rng: random.Random) -> float:
+        if self.latency_ms <= 0:
+            return 0.0
+        median = self.latency_ms / 1000
+        if self.latency_sigma <= 0:
+            return median
+        return rng.lognormvariate(math.log(median), self.latency_sigma)
+
+
+def create_app(profile: BackendProfile) -> Starlette:
+    rng = random.Random(profile.seed)
+    payload = "x" * profile.payload_bytes
+    tools = [
+        {
+            "name": name,
+            "description": f"Simulated tool {name}",
+            "inputSchema": {
+                "type": "object",
+                "properties": {"n": {"type": "integer"}},
+            },
+        }
+        for name in profile.tool_names
+    ]
+    known = set(profile.tool_names)
+
+    async def list_tools(request: Request) -> Response:
+        return JSONResponse({"tools": tools})
+
+    async def list_empty(request: Request) -> Response:
+        key = request.url.path.strip("/")
+        return JSONResponse({key: []})
+
+    async def call_tool(request: Request) -> Response:
+        name = request.path_params["name"]
+        if name not in known:
+            return JSONResponse({"error": f"unknown tool {name}"}, status_code=404)
+        arguments = await request.json()
+        await asyncio.sleep(profile.sample_latency(rng))
+        if profile.error_rate and rng.random() < profile.error_rate:
+            return JSONResponse({"error": "simulated failure"}, status_code=500)
+        return JSONResponse({"tool": name, "arguments": arguments, "data": payload})
+
+    async def health(request: Request) -> Response:
+        return JSONResponse({"status": "ok"})
+
+    return Starlette(
+        routes=[
+            Route("/tools", list_tools, methods=["GET"]),
+            Route("/tools/{name}", call_tool, methods=["POST"]),
+            Route("/resources", list_empty, methods=["GET"]),
+            Route("/prompts", list_empty, methods=["GET"]),
+            Route("/health", health, methods=["GET"]),
+        ]
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, required=True)
+    parser.add_argument("--name", default="bench")
+    parser.add_argument("--tools", type=int, default=10)
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--payload-bytes", type=int, default=256)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    profile = BackendProfile(
+        name=args.name,
+        tools=args.tools,
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        payload_bytes=args.payload_bytes,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+    uvicorn.run(
+        create_app(profile),
+        host=args.host,
+        port=args.port,
+        log_level="warning",
+        access_log=False,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,407 @@
+"""End-to-end router load test against simulated backends.
+
+Starts fake backends (benchmarks/fake_backend.py) and the real router
+(create_router_server over streamable-http) as subprocesses, drives proxied
+tool calls through FastMCP clients and reports throughput, latency
+percentiles and router CPU and RSS for each scenario.
+
+Usage:
+    python benchmarks/load_test.py                      # run all scenarios
+    python benchmarks/load_test.py --scenario small     # run one scenario
+    python benchmarks/load_test.py --save-baseline      # record a new baseline
+    python benchmarks/load_test.py --check              # fail on regressions
+    python benchmarks/load_test.py --workers 4          # run the router with 4 workers
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import socket
+import sys
+import tempfile
+import time
+from contextlib import AsyncExitStack
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import httpx
+import yaml
+from fastmcp import Client
+
+ROOT = Path(__file__).resolve().parent.parent
+FAKE_BACKEND = ROOT / "benchmarks" / "fake_backend.py"
+BASELINE_PATH = ROOT / "benchmarks" / "baselines" / "load_test.json"
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    backends: int
+    tools_per_backend: int
+    concurrency: int
+    latency_ms: float = 2.0
+    payload_bytes: int = 256
+    error_rate: float = 0.0
+
+
+SCENARIOS = [
+    Scenario("small", backends=1, tools_per_backend=10, concurrency=1),
+    Scenario("concurrent", backends=1, tools_per_backend=10, concurrency=32),
+    Scenario("fanout", backends=10, tools_per_backend=50, concurrency=16),
+    Scenario("wide", backends=20, tools_per_backend=100, concurrency=32),
+    Scenario(
+        "large_payload",
+        backends=2,
+        tools_per_backend=10,
+        concurrency=16,
+        payload_bytes=64 * 1024,
+    ),
+    Scenario(
+        "flaky",
+        backends=4,
+        tools_per_backend=10,
+        concurrency=16,
+        error_rate=0.05,
+    ),
+]
+
+
+@dataclass
+class Result:
+    scenario: str
+    requests: int
+    errors: int
+    req_per_s: float
+    p50_ms: float
+    p99_ms: float
+    p999_ms: float
+    cpu_percent: float | None
+    client_cpu_percent: float
+    rss_mb: float | None
+    peak_rss_mb: float | None
+
+
+class ProcessSampler:
+    def __init__(self, pid: int) -> None:
+        self.pid = pid
+        self.ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+    def pids(self) -> list[int]:
+        try:
+            children = Path(f"/proc/{self.pid}/task/{self.pid}/children").read_text()
+        except OSError:
+            children = ""
+        return [self.pid, *(int(pid) for pid in children.split())]
+
+    def cpu_seconds(self) -> float | None:
+        total = None
+        for pid in self.pids():
+            try:
+                fields = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1]
+            except OSError:
+                continue
+            utime, stime = fields.split()[11:13]
+            total = (total or 0.0) + (int(utime) + int(stime)) / self.ticks
+        return total
+
+    def memory_mb(self) -> tuple[float | None, float | None]:
+        values: dict[str, float] = {}
+        for pid in self.pids():
+            try:
+                status = Path(f"/proc/{pid}/status").read_text()
+            except OSError:
+                continue
+            for line in status.splitlines():
+                key, _, value = line.partition(":")
+                if key in ("VmRSS", "VmHWM"):
+                    values[key] = values.get(key, 0.0) + int(value.split()[0]) / 1024
+        return values.get("VmRSS"), values.get("VmHWM")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def wait_for_http(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(timeout=1.0) as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get(url)
+                return
+            except httpx.HTTPError:
+                await asyncio.sleep(0.1)
+    raise TimeoutError(f"{url} did not become ready within {timeout}s")
+
+
+async def start_backends(
+    scenario: Scenario,
+) -> tuple[list[asyncio.subprocess.Process], list[dict]]:
+    processes = []
+    configs = []
+    for i in range(scenario.backends):
+        name = f"bench{i}"
+        port = free_port()
+        processes.append(
+            await asyncio.create_subprocess_exec(
+                sys.executable,
+                str(FAKE_BACKEND),
+                "--port",
+                str(port),
+                "--name",
+                name,
+                "--tools",
+                str(scenario.tools_per_backend),
+                "--latency-ms",
+                str(scenario.latency_ms),
+                "--payload-bytes",
+                str(scenario.payload_bytes),
+                "--error-rate",
+                str(scenario.error_rate),
+                "--seed",
+                str(i),
+            )
+        )
+        configs.append(
+            {"name": name, "url": f"http://127.0.0.1:{port}", "namespace": name}
+        )
+    await asyncio.gather(*(wait_for_http(f"{c['url']}/health") for c in configs))
+    return processes, configs
+
+
+async def start_router(
+    config_path: Path, port: int, workers: int = 1
+) -> asyncio.subprocess.Process:
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(ROOT / "src"),
+        "MCP_HOST": "127.0.0.1",
+        "MCP_PORT": str(port),
+        "MCP_WORKERS": str(workers),
+        "MCP_BACKENDS_CONFIG": str(config_path),
+        "MCP_HEALTH_CHECK_INTERVAL": "3600",
+        "MCP_MAX_RETRIES": "1",
+        "FASTMCP_LOG_LEVEL": "WARNING",
+    }
+    process = await asyncio.create_subprocess_exec(
+        sys.executable,
+        "-c",
+        "from mcp_server.server import main_router; main_router()",
+        env=env,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    await wait_for_http(f"http://127.0.0.1:{port}/metrics", timeout=60.0)
+    return process
+
+
+async def stop(processes: list[asyncio.subprocess.Process]) -> None:
+    for process in processes:
+        if process.returncode is None:
+            process.terminate()
+    for process in processes:
+        try:
+            await asyncio.wait_for(process.wait(), timeout=5.0)
+        except TimeoutError:
+            process.kill()
+            await process.wait()
+
+
+async def drive(
+    url: str,
+    tool_names: list[str],
+    concurrency: int,
+    duration: float,
+    warmup: float,
+    sampler: ProcessSampler,
+) -> tuple[list[float], int, tuple[float | None, float]]:
+    latencies: list[float] = []
+    errors = 0
+
+    async def worker(client: Client, seed: int) -> None:
+        nonlocal errors
+        rng = random.Random(seed)
+        while True:
+            started = time.perf_counter()
+            if started >= deadline:
+                return
+            try:
+                await client.call_tool(rng.choice(tool_names), {"n": seed})
+                failed = False
+            except Exception:
+                failed = True
+            if started >= measure_from:
+                latencies.append(time.perf_counter() - started)
+                errors += failed
+
+    async def measure_cpu() -> tuple[float | None, float]:
+        await asyncio.sleep(warmup)
+        before = sampler.cpu_seconds()
+        own_before = time.process_time()
+        await asyncio.sleep(duration)
+        after = sampler.cpu_seconds()
+        own_percent = (time.process_time() - own_before) / duration * 100
+        if before is None or after is None:
+            return None, own_percent
+        return (after - before) / duration * 100, own_percent
+
+    async with AsyncExitStack() as stack:
+        clients = []
+        for _ in range(concurrency):
+            client = await stack.enter_async_context(Client(url))
+            await client.list_tools()
+            clients.append(client)
+        measure_from = time.perf_counter() + warmup
+        deadline = measure_from + duration
+        cpu, *_ = await asyncio.gather(
+            measure_cpu(), *(worker(c, i) for i, c in enumerate(clients))
+        )
+    return latencies, errors, cpu
+
+
+async def run_scenario(
+    scenario: Scenario, duration: float, warmup: float, workers: int = 1
+) -> Result:
+    backends, configs = await start_backends(scenario)
+    router = None
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            config_path = Path(tmp) / "backends.yaml"
+            config_path.write_text(yaml.safe_dump({"backends": configs}))
+            port = free_port()
+            router = await start_router(config_path, port, workers)
+            url = f"http://127.0.0.1:{port}/mcp"
+
+            tool_names = [
+                f"{c['name']}.{c['name']}_tool_{j}"
+                for c in configs
+                for j in range(scenario.tools_per_backend)
+            ]
+            sampler = ProcessSampler(router.pid)
+            latencies, errors, (cpu_percent, client_cpu_percent) = await drive(
+                url, tool_names, scenario.concurrency, duration, warmup, sampler
+            )
+            rss_mb, peak_rss_mb = sampler.memory_mb()
+    finally:
+        await stop(([router] if router else []) + backends)
+
+    latencies.sort()
+    return Result(
+        scenario=scenario.name,
+        requests=len(latencies),
+        errors=errors,
+        req_per_s=round(len(latencies) / duration, 1),
+        p50_ms=round(percentile(latencies, 0.50) * 1000, 3),
+        p99_ms=round(percentile(latencies, 0.99) * 1000, 3),
+        p999_ms=round(percentile(latencies, 0.999) * 1000, 3),
+        cpu_percent=None if cpu_percent is None else round(cpu_percent, 1),
+        client_cpu_percent=round(client_cpu_percent, 1),
+        rss_mb=None if rss_mb is None else round(rss_mb, 1),
+        peak_rss_mb=None if peak_rss_mb is None else round(peak_rss_mb, 1),
+    )
+
+
+def compare(results: list[Result], baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for result in results:
+        base = baseline.get(result.scenario)
+        if not base:
+            continue
+        if result.req_per_s < base["req_per_s"] * (1 - tolerance):
+            regressions.append(
+                f"{result.scenario}: {result.req_per_s} req/s "
+                f"< baseline {base['req_per_s']}"
+            )
+        if result.p99_ms > base["p99_ms"] * (1 + tolerance):
+            regressions.append(
+                f"{result.scenario}: p99 {result.p99_ms}ms "
+                f"> baseline {base['p99_ms']}ms"
+            )
+    return regressions
+
+
+def host_info() -> dict[str, str | int | None]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def print_table(results: list[Result]) -> None:
+    header = (
+        f"{'scenario':<15}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}"
+        f"{'p999 ms':>10}{'errors':>8}{'cpu %':>8}{'client %':>10}{'rss MB':>8}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r.scenario:<15}{r.req_per_s:>10}{r.p50_ms:>10}{r.p99_ms:>10}"
+            f"{r.p999_ms:>10}{r.errors:>8}{r.cpu_percent or '-':>8}"
+            f"{r.client_cpu_percent:>10}"
+            f"{r.rss_mb or '-':>8}"
+        )
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", action="append", dest="scenarios")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+
+    selected = [s for s in SCENARIOS if not args.scenarios or s.name in args.scenarios]
+    results = []
+    for scenario in selected:
+        print(f"Running {scenario.name}: {scenario}", file=sys.stderr)
+        results.append(
+            await run_scenario(scenario, args.duration, args.warmup, args.workers)
+        )
+
+    print_table(results)
+    data = {r.scenario: asdict(r) for r in results}
+    if args.output:
+        args.output.write_text(json.dumps(data, indent=2) + "\n")
+
+    if args.save_baseline:
+        baseline = (
+            json.loads(args.baseline.read_text())
+            if args.baseline.exists()
+            else {"scenarios": {}}
+        )
+        baseline["host"] = host_info()
+        baseline["scenarios"].update(data)
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"Saved baseline to {args.baseline}")
+
+    if args.check:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(results, baseline["scenarios"], args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
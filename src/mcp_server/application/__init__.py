@@ -1,3 +1,13 @@
-from mcp_server.application import dtos, ports, use_cases
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from mcp_server.application import dtos, ports, use_cases
 
 __all__ = ["use_cases", "ports", "dtos"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_module(f"{__name__}.{name}")
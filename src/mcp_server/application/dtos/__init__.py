@@ -1,12 +1,21 @@
+from mcp_server.application.dtos.access_log_entry import AccessLogEntry
 from mcp_server.application.dtos.backend_registration import (
     BackendRegistrationRequest,
     BackendRegistrationResponse,
 )
+from mcp_server.application.dtos.resource_fetch import CachedResource, ResourceFetch
+from mcp_server.application.dtos.startup_timeline import BackendStartupTimeline
 from mcp_server.application.dtos.tool_call import ToolCallRequest, ToolCallResponse
+from mcp_server.application.dtos.warm_process import WarmProcess
 
 __all__ = [
+    "AccessLogEntry",
     "BackendRegistrationRequest",
     "BackendRegistrationResponse",
+    "BackendStartupTimeline",
+    "CachedResource",
+    "ResourceFetch",
     "ToolCallRequest",
     "ToolCallResponse",
+    "WarmProcess",
 ]
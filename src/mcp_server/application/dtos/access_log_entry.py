@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class AccessLogEntry:
+    tool_name: str
+    arguments: dict[str, Any]
+    timestamp: float
+    strategy: str
+    backend_name: str | None = None
+    attempts: int = 0
+    latency_seconds: float = 0.0
+    outcome: str = "error"
+    error: str | None = None
+    result: Any = None
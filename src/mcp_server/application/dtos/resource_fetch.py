@@ -0,0 +1,32 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class ResourceFetch:
+    content: str | None
+    etag: str | None = None
+    last_modified: str | None = None
+    max_age_seconds: float | None = None
+    stale_while_revalidate_seconds: float | None = None
+    no_store: bool = False
+
+    @property
+    def not_modified(self) -> bool:
+        return self.content is None
+
+
+@dataclass(frozen=True)
+class CachedResource:
+    content: str
+    etag: str | None
+    last_modified: str | None
+    fresh_until: float
+    stale_until: float
+
+    @property
+    def has_validators(self) -> bool:
+        return bool(self.etag or self.last_modified)
+
+    @property
+    def size(self) -> int:
+        return len(self.content.encode())
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class BackendStartupTimeline:
+    backend_name: str
+    spawned_seconds: float | None = None
+    ready_seconds: float | None = None
+    discovered_seconds: float | None = None
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
@@ -7,6 +7,8 @@ class ToolCallRequest:
     tool_name: str
     arguments: dict[str, Any]
     strategy: str | None = None
+    client_id: str | None = None
+    session_id: str | None = None
 
     def __post_init__(self) -> None:
         if not self.tool_name:
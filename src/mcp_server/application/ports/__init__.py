@@ -1,5 +1,39 @@
+from mcp_server.application.ports.access_log_port import AccessLogPort
+from mcp_server.application.ports.argument_validator_port import (
+    ArgumentValidatorPort,
+)
+from mcp_server.application.ports.capability_listener_port import (
+    CapabilityListenerPort,
+)
+from mcp_server.application.ports.capability_snapshot_port import (
+    CapabilitySnapshot,
+    CapabilitySnapshotPort,
+)
+from mcp_server.application.ports.leader_lease_port import LeaderLeasePort
 from mcp_server.application.ports.mcp_client_port import MCPClientPort
+from mcp_server.application.ports.metrics_port import MetricsPort
 from mcp_server.application.ports.port_allocator_port import PortAllocatorPort
 from mcp_server.application.ports.process_manager_port import ProcessManagerPort
+from mcp_server.application.ports.process_pool_port import ProcessPoolPort
+from mcp_server.application.ports.rate_limiter_port import RateLimiterPort
+from mcp_server.application.ports.request_scheduler_port import RequestSchedulerPort
+from mcp_server.application.ports.resource_cache_port import ResourceCachePort
+from mcp_server.application.ports.tracer_port import TracerPort
 
-__all__ = ["MCPClientPort", "ProcessManagerPort", "PortAllocatorPort"]
+__all__ = [
+    "AccessLogPort",
+    "ArgumentValidatorPort",
+    "CapabilityListenerPort",
+    "CapabilitySnapshot",
+    "CapabilitySnapshotPort",
+    "LeaderLeasePort",
+    "MCPClientPort",
+    "MetricsPort",
+    "ProcessManagerPort",
+    "PortAllocatorPort",
+    "ProcessPoolPort",
+    "RateLimiterPort",
+    "RequestSchedulerPort",
+    "ResourceCachePort",
+    "TracerPort",
+]
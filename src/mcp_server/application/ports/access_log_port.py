@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from mcp_server.application.dtos import AccessLogEntry
+
+
+class AccessLogPort(ABC):
+    @abstractmethod
+    def record(self, entry: AccessLogEntry) -> None:
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
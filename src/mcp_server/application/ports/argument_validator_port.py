@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+from mcp_server.domain.entities import Backend
+
+
+class ArgumentValidatorPort(ABC):
+    @abstractmethod
+    def update_backend(self, backend: Backend) -> None:
+        pass
+
+    @abstractmethod
+    def remove_backend(self, backend_name: str) -> None:
+        pass
+
+    @abstractmethod
+    def validate(
+        self, backend_name: str, tool_name: str, arguments: dict[str, Any]
+    ) -> None:
+        pass
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+
+from mcp_server.domain.entities import Backend
+
+
+class CapabilityListenerPort(ABC):
+    @abstractmethod
+    async def capabilities_changed(self, backend: Backend) -> None:
+        pass
+
+    @abstractmethod
+    async def backend_removed(self, backend_name: str) -> None:
+        pass
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
+from typing import Any
+
+CapabilitySnapshot = dict[str, dict[str, Any]]
+
+
+class CapabilitySnapshotPort(ABC):
+    @abstractmethod
+    async def load(self) -> CapabilitySnapshot:
+        pass
+
+    @abstractmethod
+    async def save(self, snapshot: CapabilitySnapshot) -> None:
+        pass
+
+    @abstractmethod
+    async def watch_changes(self) -> AsyncIterator[CapabilitySnapshot]:
+        pass
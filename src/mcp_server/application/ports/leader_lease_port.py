@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+
+class LeaderLeasePort(ABC):
+    @property
+    @abstractmethod
+    def is_leader(self) -> bool:
+        pass
+
+    @abstractmethod
+    async def renew(self) -> bool:
+        pass
+
+    @abstractmethod
+    def release(self) -> None:
+        pass
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+from mcp_server.application.dtos import ResourceFetch
+
 
 class MCPClientPort(ABC):
     @abstractmethod
@@ -11,6 +13,14 @@ class MCPClientPort(ABC):
     async def get_resource(self, uri: str) -> str:
         pass
 
+    async def fetch_resource(
+        self,
+        uri: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> ResourceFetch:
+        return ResourceFetch(content=await self.get_resource(uri))
+
     @abstractmethod
     async def get_prompt(self, prompt_name: str, arguments: dict[str, Any]) -> str:
         pass
@@ -0,0 +1,67 @@
+from abc import ABC, abstractmethod
+
+
+class MetricsPort(ABC):
+    @abstractmethod
+    def request_started(self, backend_name: str) -> None:
+        pass
+
+    @abstractmethod
+    def request_finished(
+        self,
+        backend_name: str,
+        tool_name: str,
+        duration_seconds: float,
+        outcome: str,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def record_retry(self, backend_name: str, tool_name: str) -> None:
+        pass
+
+    @abstractmethod
+    def record_circuit_transition(self, backend_name: str, state: str) -> None:
+        pass
+
+    @abstractmethod
+    def record_discovery(
+        self, backend_name: str, duration_seconds: float, outcome: str
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def record_cache_lookup(self, cache_name: str, hit: bool) -> None:
+        pass
+
+    @abstractmethod
+    def record_process_restart(self, backend_name: str) -> None:
+        pass
+
+    @abstractmethod
+    def record_queue_wait(
+        self, backend_name: str, priority_class: str, wait_seconds: float
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def set_queue_depth(
+        self, backend_name: str, priority_class: str, depth: int
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def record_rate_limited(self, backend_name: str, scope: str) -> None:
+        pass
+
+    @abstractmethod
+    def record_loop_lag(self, lag_seconds: float) -> None:
+        pass
+
+    @abstractmethod
+    def record_loop_stall(self, duration_seconds: float) -> None:
+        pass
+
+    @abstractmethod
+    def render(self) -> str:
+        pass
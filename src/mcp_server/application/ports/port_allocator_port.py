@@ -9,3 +9,11 @@ class PortAllocatorPort(ABC):
     @abstractmethod
     async def release_port(self, port: int) -> None:
         pass
+
+    @abstractmethod
+    def listen_fd(self, port: int) -> int | None:
+        pass
+
+    @abstractmethod
+    def unbind_port(self, port: int) -> None:
+        pass
@@ -8,6 +8,10 @@ class ProcessManagerPort(ABC):
     async def start_process(self, config: ProcessConfig) -> int:
         pass
 
+    @abstractmethod
+    async def wait_until_ready(self, pid: int, timeout: float = 30.0) -> None:
+        pass
+
     @abstractmethod
     async def stop_process(self, pid: int) -> None:
         pass
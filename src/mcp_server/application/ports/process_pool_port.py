@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+
+from mcp_server.application.dtos import WarmProcess
+from mcp_server.domain.value_objects import ProcessConfig
+
+
+class ProcessPoolPort(ABC):
+    @abstractmethod
+    async def acquire(self, config: ProcessConfig) -> WarmProcess | None:
+        pass
+
+    @abstractmethod
+    async def prewarm(self, config: ProcessConfig) -> None:
+        pass
+
+    @abstractmethod
+    async def shutdown(self) -> None:
+        pass
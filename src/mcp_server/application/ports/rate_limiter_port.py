@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+from mcp_server.domain.value_objects import RateLimitRule
+
+
+class RateLimiterPort(ABC):
+    @abstractmethod
+    def acquire(
+        self,
+        backend_name: str,
+        rules: tuple[RateLimitRule, ...],
+        tool_name: str,
+        client_id: str | None,
+    ) -> None:
+        pass
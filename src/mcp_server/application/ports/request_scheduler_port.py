@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+
+from mcp_server.domain.value_objects import PriorityClass, SchedulingSettings
+
+
+class RequestSchedulerPort(ABC):
+    @abstractmethod
+    async def acquire(
+        self,
+        backend_name: str,
+        settings: SchedulingSettings,
+        priority_class: PriorityClass,
+    ) -> Callable[[], None]:
+        pass
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+
+from mcp_server.application.dtos import CachedResource
+
+
+class ResourceCachePort(ABC):
+    @abstractmethod
+    async def get(self, backend_name: str, uri: str) -> CachedResource | None:
+        pass
+
+    @abstractmethod
+    async def put(self, backend_name: str, uri: str, entry: CachedResource) -> None:
+        pass
+
+    @abstractmethod
+    async def invalidate(
+        self, backend_name: str | None = None, uri: str | None = None
+    ) -> int:
+        pass
@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
+from typing import Any
+
+
+class TracerPort(ABC):
+    @abstractmethod
+    def span(self, name: str, **attributes: Any) -> AbstractContextManager[Any]:
+        pass
+
+    @abstractmethod
+    async def flush(self) -> None:
+        pass
@@ -3,17 +3,23 @@ from mcp_server.application.use_cases.discover_capabilities import DiscoverCapab
 from mcp_server.application.use_cases.monitor_backend_processes import (
     MonitorBackendProcesses,
 )
+from mcp_server.application.use_cases.read_resource import ReadResource
 from mcp_server.application.use_cases.register_backend import RegisterBackend
 from mcp_server.application.use_cases.reload_backends_config import ReloadBackendsConfig
+from mcp_server.application.use_cases.render_prompt import RenderPrompt
 from mcp_server.application.use_cases.route_tool_call import RouteToolCall
+from mcp_server.application.use_cases.start_backend_process import StartBackendProcess
 from mcp_server.application.use_cases.unregister_backend import UnregisterBackend
 
 __all__ = [
     "RouteToolCall",
+    "ReadResource",
+    "RenderPrompt",
     "DiscoverCapabilities",
     "CheckBackendHealth",
     "RegisterBackend",
     "UnregisterBackend",
     "ReloadBackendsConfig",
     "MonitorBackendProcesses",
+    "StartBackendProcess",
 ]
@@ -1,3 +1,5 @@
+from mcp_server.application.ports import MetricsPort
+from mcp_server.domain.entities import Backend
 from mcp_server.domain.repositories import BackendRepository
 from mcp_server.domain.services import (
     should_attempt_half_open,
@@ -6,22 +8,36 @@ from mcp_server.domain.services import (
 
 
 class CheckBackendHealth:
-    def __init__(self, backend_repository: BackendRepository) -> None:
+    def __init__(
+        self,
+        backend_repository: BackendRepository,
+        metrics: MetricsPort | None = None,
+    ) -> None:
         self.backend_repository = backend_repository
+        self.metrics = metrics
 
     async def execute(self) -> None:
         backends = self.backend_repository.get_all()
 
         for backend in backends:
-            if should_attempt_half_open(
-                backend.health_status,
-                backend.config.circuit_breaker,
-            ):
-                backend.half_open_circuit()
-
-            if backend.health_status.error_count == 0:
-                if should_close_circuit(
-                    success_count=1,
-                    settings=backend.config.circuit_breaker,
-                ):
-                    backend.close_circuit()
+            previous = backend.health_status.circuit_state
+            await self.backend_repository.update_health(backend, _advance_circuit)
+
+            state = backend.health_status.circuit_state
+            if self.metrics and state != previous:
+                self.metrics.record_circuit_transition(backend.name, state.value)
+
+
+def _advance_circuit(backend: Backend) -> None:
+    if should_attempt_half_open(
+        backend.health_status,
+        backend.config.circuit_breaker,
+    ):
+        backend.half_open_circuit()
+
+    if backend.health_status.error_count == 0:
+        if should_close_circuit(
+            success_count=1,
+            settings=backend.config.circuit_breaker,
+        ):
+            backend.close_circuit()
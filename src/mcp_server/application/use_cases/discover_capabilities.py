@@ -1,4 +1,15 @@
-from mcp_server.application.ports import MCPClientPort
+import asyncio
+import time
+from typing import Any
+
+from mcp_server.application.ports import (
+    ArgumentValidatorPort,
+    CapabilityListenerPort,
+    CapabilitySnapshot,
+    CapabilitySnapshotPort,
+    MCPClientPort,
+    MetricsPort,
+)
 from mcp_server.domain.entities import Backend
 from mcp_server.domain.repositories import BackendRepository
 
@@ -8,36 +19,82 @@ class DiscoverCapabilities:
         self,
         backend_repository: BackendRepository,
         client_factory: dict[str, MCPClientPort],
+        capability_listener: CapabilityListenerPort | None = None,
+        argument_validator: ArgumentValidatorPort | None = None,
+        metrics: MetricsPort | None = None,
+        capability_snapshot: CapabilitySnapshotPort | None = None,
     ) -> None:
         self.backend_repository = backend_repository
         self.client_factory = client_factory
+        self.capability_listener = capability_listener
+        self.argument_validator = argument_validator
+        self.metrics = metrics
+        self.capability_snapshot = capability_snapshot
 
     async def execute(self) -> None:
-        backends = self.backend_repository.get_all()
-
-        for backend in backends:
+        discoveries = []
+        for backend in self.backend_repository.get_all():
             client = self.client_factory.get(backend.name)
-            if not client:
-                continue
-
-            try:
-                tools = await client.list_tools()
-                resources = await client.list_resources()
-                prompts = await client.list_prompts()
-
-                backend.update_capabilities(tools, resources, prompts)
-                backend.record_success()
+            if client:
+                discoveries.append(self.execute_for_backend(backend, client))
 
-            except Exception as e:
-                backend.record_failure(str(e))
+        await asyncio.gather(*discoveries)
 
     async def execute_for_backend(self, backend: Backend, client: MCPClientPort) -> None:
-        try:
-            tools = await client.list_tools()
-            resources = await client.list_resources()
-            prompts = await client.list_prompts()
+        if self.capability_snapshot:
+            await self.apply_snapshot(backend, await self.capability_snapshot.load())
+            return
 
-            backend.update_capabilities(tools, resources, prompts)
-            backend.record_success()
+        started = time.perf_counter()
+        try:
+            tools, resources, prompts = await asyncio.gather(
+                client.list_tools(),
+                client.list_resources(),
+                client.list_prompts(),
+            )
         except Exception as e:
-            backend.record_failure(str(e))
+            error = str(e)
+            await self.backend_repository.update_health(
+                backend, lambda b: b.record_failure(error)
+            )
+            self._record_discovery(backend, started, "error")
+            return
+
+        self._record_discovery(backend, started, "success")
+        await self.backend_repository.update_health(backend, Backend.record_success)
+        await self.apply(backend, tools, resources, prompts)
+
+    async def apply_snapshot(
+        self, backend: Backend, snapshot: CapabilitySnapshot
+    ) -> None:
+        capabilities = snapshot.get(backend.name)
+        if capabilities is None:
+            return
+        await self.apply(
+            backend,
+            capabilities.get("tools", []),
+            capabilities.get("resources", []),
+            capabilities.get("prompts", []),
+        )
+
+    async def apply(
+        self,
+        backend: Backend,
+        tools: list[dict[str, Any]],
+        resources: list[dict[str, Any]],
+        prompts: list[dict[str, Any]],
+    ) -> None:
+        changed = backend.update_capabilities(tools, resources, prompts)
+
+        if not changed:
+            return
+        if self.argument_validator:
+            self.argument_validator.update_backend(backend)
+        if self.capability_listener:
+            await self.capability_listener.capabilities_changed(backend)
+
+    def _record_discovery(self, backend: Backend, started: float, outcome: str) -> None:
+        if self.metrics:
+            self.metrics.record_discovery(
+                backend.name, time.perf_counter() - started, outcome
+            )
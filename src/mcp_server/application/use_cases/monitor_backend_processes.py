@@ -1,15 +1,25 @@
-from mcp_server.application.ports import ProcessManagerPort
+from typing import TYPE_CHECKING
+
+from mcp_server.application.ports import MetricsPort, ProcessManagerPort
+from mcp_server.domain.entities import Backend
 from mcp_server.domain.repositories import BackendRepository
 
+if TYPE_CHECKING:
+    from mcp_server.application.use_cases import StartBackendProcess
+
 
 class MonitorBackendProcesses:
     def __init__(
         self,
         backend_repository: BackendRepository,
         process_manager: ProcessManagerPort,
+        start_backend_process: "StartBackendProcess",
+        metrics: MetricsPort | None = None,
     ) -> None:
         self.backend_repository = backend_repository
         self.process_manager = process_manager
+        self.start_backend_process = start_backend_process
+        self.metrics = metrics
 
     async def execute(self) -> None:
         backends = self.backend_repository.get_all()
@@ -21,11 +31,15 @@ class MonitorBackendProcesses:
             alive = await self.process_manager.is_process_alive(backend.process_id)
 
             if not alive and backend.config.auto_start:
+                if self.metrics:
+                    self.metrics.record_process_restart(backend.name)
                 try:
-                    new_pid = await self.process_manager.start_process(
-                        backend.config.source.process_config
+                    await self.start_backend_process.restart(backend)
+                    await self.backend_repository.update_health(
+                        backend, Backend.record_success
                     )
-                    backend.process_id = new_pid
-                    backend.record_success()
                 except Exception as e:
-                    backend.record_failure(f"Failed to restart process: {e}")
+                    error = f"Failed to restart process: {e}"
+                    await self.backend_repository.update_health(
+                        backend, lambda b, error=error: b.record_failure(error)
+                    )
@@ -0,0 +1,156 @@
+import asyncio
+import logging
+import time
+
+from mcp_server.application.dtos import CachedResource, ResourceFetch
+from mcp_server.application.ports import MCPClientPort, MetricsPort, ResourceCachePort
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.exceptions import BackendNotFoundError
+from mcp_server.domain.repositories import BackendRepository
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[str, str]
+
+
+class ReadResource:
+    def __init__(
+        self,
+        backend_repository: BackendRepository,
+        client_factory: dict[str, MCPClientPort],
+        cache: ResourceCachePort | None = None,
+        metrics: MetricsPort | None = None,
+    ) -> None:
+        self.backend_repository = backend_repository
+        self.client_factory = client_factory
+        self.cache = cache
+        self.metrics = metrics
+        self._inflight: dict[CacheKey, asyncio.Task[str]] = {}
+        self._invalidations = 0
+
+    async def execute(self, backend_name: str, uri: str) -> str:
+        client = self.client_factory.get(backend_name)
+        if not client:
+            raise BackendNotFoundError(backend_name)
+        if not self.cache:
+            return await client.get_resource(uri)
+
+        cached = await self.cache.get(backend_name, uri)
+        now = time.time()
+        if cached and now < cached.fresh_until:
+            self._record_lookup(True)
+            return cached.content
+        if cached and now < cached.stale_until:
+            self._record_lookup(True)
+            self._refresh(backend_name, uri, client, cached)
+            return cached.content
+
+        self._record_lookup(False)
+        return await asyncio.shield(self._refresh(backend_name, uri, client, cached))
+
+    async def invalidate(
+        self, backend_name: str | None = None, uri: str | None = None
+    ) -> int:
+        if not self.cache:
+            return 0
+        self._invalidations += 1
+        for key in list(self._inflight):
+            if (backend_name is None or key[0] == backend_name) and (
+                uri is None or key[1] == uri
+            ):
+                del self._inflight[key]
+        return await self.cache.invalidate(backend_name, uri)
+
+    def _refresh(
+        self,
+        backend_name: str,
+        uri: str,
+        client: MCPClientPort,
+        cached: CachedResource | None,
+    ) -> asyncio.Task[str]:
+        key = (backend_name, uri)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(backend_name, uri, client, cached))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return task
+
+    def _finish(self, key: CacheKey, task: asyncio.Task[str]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception():
+            logger.debug(f"Resource refresh failed for {key}: {task.exception()}")
+
+    async def _fetch(
+        self,
+        backend_name: str,
+        uri: str,
+        client: MCPClientPort,
+        cached: CachedResource | None,
+    ) -> str:
+        assert self.cache is not None
+        invalidations = self._invalidations
+        if cached and cached.has_validators:
+            fetched = await client.fetch_resource(
+                uri, etag=cached.etag, last_modified=cached.last_modified
+            )
+        else:
+            fetched = await client.fetch_resource(uri)
+
+        if fetched.not_modified:
+            if not cached:
+                fetched = await client.fetch_resource(uri)
+            else:
+                fetched = ResourceFetch(
+                    content=cached.content,
+                    etag=fetched.etag or cached.etag,
+                    last_modified=fetched.last_modified or cached.last_modified,
+                    max_age_seconds=fetched.max_age_seconds,
+                    stale_while_revalidate_seconds=(
+                        fetched.stale_while_revalidate_seconds
+                    ),
+                )
+        assert fetched.content is not None
+
+        if invalidations != self._invalidations:
+            return fetched.content
+
+        backend = self.backend_repository.get(backend_name)
+        entry = _cache_entry(backend, uri, fetched)
+        if entry:
+            await self.cache.put(backend_name, uri, entry)
+        elif cached:
+            await self.cache.invalidate(backend_name, uri)
+        return fetched.content
+
+    def _record_lookup(self, hit: bool) -> None:
+        if self.metrics:
+            self.metrics.record_cache_lookup("resource", hit)
+
+
+def _cache_entry(
+    backend: Backend | None, uri: str, fetched: ResourceFetch
+) -> CachedResource | None:
+    if fetched.no_store or fetched.content is None:
+        return None
+
+    rule = backend.config.resource_cache_rule(uri) if backend else None
+    if rule:
+        ttl = rule.ttl_seconds
+        stale = rule.stale_while_revalidate_seconds
+    else:
+        ttl = fetched.max_age_seconds or 0.0
+        stale = fetched.stale_while_revalidate_seconds or 0.0
+
+    if not ttl and not (fetched.etag or fetched.last_modified):
+        return None
+
+    fresh_until = time.time() + ttl
+    return CachedResource(
+        content=fetched.content,
+        etag=fetched.etag,
+        last_modified=fetched.last_modified,
+        fresh_until=fresh_until,
+        stale_until=fresh_until + stale,
+    )
@@ -1,4 +1,3 @@
-import asyncio
 from typing import TYPE_CHECKING
 
 from mcp_server.application.dtos import (
@@ -25,7 +24,10 @@ from mcp_server.domain.value_objects import (
 from mcp_server.infrastructure.adapters import HTTPMCPClient
 
 if TYPE_CHECKING:
-    from mcp_server.application.use_cases import DiscoverCapabilities
+    from mcp_server.application.use_cases import (
+        DiscoverCapabilities,
+        StartBackendProcess,
+    )
 
 
 class RegisterBackend:
@@ -37,6 +39,7 @@ class RegisterBackend:
         port_allocator: PortAllocatorPort,
         client_factory: dict[str, MCPClientPort],
         discover_capabilities: "DiscoverCapabilities",
+        start_backend_process: "StartBackendProcess",
     ) -> None:
         self.backend_repository = backend_repository
         self.config_repository = config_repository
@@ -44,6 +47,7 @@ class RegisterBackend:
         self.port_allocator = port_allocator
         self.client_factory = client_factory
         self.discover_capabilities = discover_capabilities
+        self.start_backend_process = start_backend_process
 
     async def execute(
         self, request: BackendRegistrationRequest
@@ -52,13 +56,6 @@ class RegisterBackend:
         namespace = request.namespace or NamespaceGenerator.generate(source)
         name = request.name or self._generate_name(source, namespace)
 
-        if self.backend_repository.exists(name):
-            raise BackendAlreadyExistsError(name)
-
-        if source.process_config:
-            port = await self.port_allocator.allocate_port()
-            source = self._update_source_with_port(source, port)
-
         config = BackendConfig(
             name=name,
             source=source,
@@ -67,15 +64,26 @@ class RegisterBackend:
             auto_start=request.auto_start,
             health_check=HealthCheckSettings(enabled=request.health_check_enabled),
         )
+        return await self.execute_config(config)
+
+    async def execute_config(
+        self, config: BackendConfig, persist: bool = True
+    ) -> BackendRegistrationResponse:
+        name = config.name
+        if self.backend_repository.exists(name):
+            raise BackendAlreadyExistsError(name)
+
+        process_config = config.source.process_config
+        if process_config and not process_config.port:
+            config = config.with_port(await self.port_allocator.allocate_port())
 
         backend = Backend(config=config)
 
         started = False
         if config.source.process_config and config.auto_start:
-            pid = await self.process_manager.start_process(config.source.process_config)
-            backend.process_id = pid
+            await self.start_backend_process.execute(backend)
+            config = backend.config
             started = True
-            await self._wait_for_ready(config.url)
 
         client = HTTPMCPClient(base_url=config.url, timeout=30)
         self.client_factory[name] = client
@@ -83,11 +91,12 @@ class RegisterBackend:
         await self.discover_capabilities.execute_for_backend(backend, client)
 
         self.backend_repository.add(backend)
-        await self.config_repository.save_config(config)
+        if persist:
+            await self.config_repository.save_config(config)
 
         return BackendRegistrationResponse(
             backend_name=name,
-            namespace=namespace,
+            namespace=config.namespace,
             url=config.url,
             started=started,
             message=f"Backend '{name}' registered successfully",
@@ -129,35 +138,3 @@ class RegisterBackend:
         if source.package_name:
             return source.package_name.split("/")[-1].lower().replace("-", "_")
         return namespace
-
-    def _update_source_with_port(self, source: BackendSource, port: int) -> BackendSource:
-        if not source.process_config:
-            return source
-
-        new_process_config = ProcessConfig(
-            command=source.process_config.command,
-            args=source.process_config.args,
-            port=port,
-            env={**source.process_config.env, "PORT": str(port)},
-        )
-
-        return BackendSource(
-            source_type=source.source_type,
-            http_url=source.http_url,
-            github_spec=source.github_spec,
-            package_name=source.package_name,
-            process_config=new_process_config,
-        )
-
-    async def _wait_for_ready(self, url: str, timeout: int = 30) -> None:
-        import httpx
-
-        for _ in range(timeout):
-            try:
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(f"{url}/health", timeout=1.0)
-                    if response.status_code < 500:
-                        return
-            except Exception:
-                pass
-            await asyncio.sleep(1)
@@ -1,11 +1,21 @@
+import asyncio
+import logging
 from typing import TYPE_CHECKING, Any
 
-from mcp_server.application.dtos import BackendRegistrationRequest
+from mcp_server.application.ports import CapabilityListenerPort
 from mcp_server.domain.repositories import BackendRepository, ConfigRepository
+from mcp_server.domain.services import (
+    affects_capabilities,
+    diff_backend_configs,
+    requires_restart,
+)
+from mcp_server.domain.value_objects import BackendConfig
 
 if TYPE_CHECKING:
     from mcp_server.application.use_cases import RegisterBackend, UnregisterBackend
 
+logger = logging.getLogger(__name__)
+
 
 class ReloadBackendsConfig:
     def __init__(
@@ -14,14 +24,42 @@ class ReloadBackendsConfig:
         config_repository: ConfigRepository,
         register_backend: "RegisterBackend",
         unregister_backend: "UnregisterBackend",
+        capability_listener: CapabilityListenerPort | None = None,
     ) -> None:
         self.backend_repository = backend_repository
         self.config_repository = config_repository
         self.register_backend = register_backend
         self.unregister_backend = unregister_backend
+        self.capability_listener = capability_listener
+        self._running: asyncio.Future[dict[str, Any]] | None = None
+        self._rerun = False
+        self._configs: list[BackendConfig] | None = None
+
+    async def execute(
+        self, configs: list[BackendConfig] | None = None
+    ) -> dict[str, Any]:
+        self._configs = configs
+        if self._running is None:
+            self._running = asyncio.ensure_future(self._run())
+        else:
+            self._rerun = True
+            logger.debug("Reload already running, coalescing request")
+        return await asyncio.shield(self._running)
+
+    async def _run(self) -> dict[str, Any]:
+        try:
+            while True:
+                self._rerun = False
+                results = await self._reconcile()
+                if not self._rerun:
+                    return results
+        finally:
+            self._running = None
 
-    async def execute(self) -> dict[str, Any]:
-        new_configs = await self.config_repository.load_configs()
+    async def _reconcile(self) -> dict[str, Any]:
+        new_configs, self._configs = self._configs, None
+        if new_configs is None:
+            new_configs = await self.config_repository.load_configs()
         new_names = {cfg.name for cfg in new_configs}
 
         current_backends = self.backend_repository.get_all()
@@ -31,59 +69,59 @@ class ReloadBackendsConfig:
         to_add = new_names - current_names
         to_update = current_names & new_names
 
-        results = {
+        results: dict[str, Any] = {
             "added": [],
             "removed": [],
             "updated": [],
+            "restarted": [],
             "errors": [],
         }
 
-        for name in to_remove:
-            try:
-                await self.unregister_backend.execute(name)
-                results["removed"].append(name)
-            except Exception as e:
-                results["errors"].append(f"Error removing {name}: {e}")
-
-        for config in new_configs:
-            if config.name in to_add:
-                try:
-                    request = self._config_to_request(config)
-                    await self.register_backend.execute(request)
-                    results["added"].append(config.name)
-                except Exception as e:
-                    results["errors"].append(f"Error adding {config.name}: {e}")
-
-        for config in new_configs:
-            if config.name in to_update:
-                current = self.backend_repository.get(config.name)
-                if current and current.config != config:
-                    try:
-                        await self.unregister_backend.execute(config.name)
-                        request = self._config_to_request(config)
-                        await self.register_backend.execute(request)
-                        results["updated"].append(config.name)
-                    except Exception as e:
-                        results["errors"].append(f"Error updating {config.name}: {e}")
+        await asyncio.gather(
+            *(self._remove(name, results) for name in sorted(to_remove)),
+            *(self._add(cfg, results) for cfg in new_configs if cfg.name in to_add),
+            *(
+                self._update(cfg, results)
+                for cfg in new_configs
+                if cfg.name in to_update
+            ),
+        )
 
         return results
 
-    def _config_to_request(self, config) -> BackendRegistrationRequest:
-        source_str = ""
-        if config.source.http_url:
-            source_str = config.source.http_url
-        elif config.source.github_spec:
-            source_str = (
-                f"github:{config.source.github_spec.owner}/{config.source.github_spec.repo}"
-            )
-        elif config.source.package_name:
-            source_str = config.source.package_name
-
-        return BackendRegistrationRequest(
-            source=source_str,
-            name=config.name,
-            namespace=config.namespace,
-            priority=config.priority,
-            auto_start=config.auto_start,
-            health_check_enabled=config.health_check.enabled,
-        )
+    async def _remove(self, name: str, results: dict[str, Any]) -> None:
+        try:
+            await self.unregister_backend.execute(name, persist=False)
+            results["removed"].append(name)
+        except Exception as e:
+            results["errors"].append(f"Error removing {name}: {e}")
+
+    async def _add(self, config: BackendConfig, results: dict[str, Any]) -> None:
+        try:
+            await self.register_backend.execute_config(config, persist=False)
+            results["added"].append(config.name)
+        except Exception as e:
+            results["errors"].append(f"Error adding {config.name}: {e}")
+
+    async def _update(self, config: BackendConfig, results: dict[str, Any]) -> None:
+        backend = self.backend_repository.get(config.name)
+        if not backend:
+            return
+
+        changed = diff_backend_configs(backend.declared_config, config)
+        if not changed:
+            return
+
+        try:
+            if requires_restart(changed):
+                await self.unregister_backend.execute(config.name, persist=False)
+                await self.register_backend.execute_config(config, persist=False)
+                results["restarted"].append(config.name)
+            else:
+                backend.reconfigure(config)
+                if self.capability_listener and affects_capabilities(changed):
+                    await self.capability_listener.capabilities_changed(backend)
+                results["updated"].append(config.name)
+            logger.info(f"Reloaded {config.name}: {', '.join(sorted(changed))}")
+        except Exception as e:
+            results["errors"].append(f"Error updating {config.name}: {e}")
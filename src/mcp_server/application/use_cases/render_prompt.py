@@ -0,0 +1,102 @@
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+from mcp_server.application.ports import MCPClientPort, MetricsPort
+from mcp_server.domain.exceptions import BackendNotFoundError
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[str, str]
+
+
+class RenderPrompt:
+    def __init__(
+        self,
+        client_factory: dict[str, MCPClientPort],
+        ttl_seconds: float = 60.0,
+        max_entries: int = 1024,
+        metrics: MetricsPort | None = None,
+    ) -> None:
+        self.client_factory = client_factory
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.metrics = metrics
+        self._cache: OrderedDict[CacheKey, tuple[float, str]] = OrderedDict()
+        self._inflight: dict[CacheKey, asyncio.Task[str]] = {}
+        self._invalidations = 0
+
+    async def execute(
+        self, backend_name: str, prompt_name: str, arguments: dict[str, Any]
+    ) -> str:
+        client = self.client_factory.get(backend_name)
+        if not client:
+            raise BackendNotFoundError(backend_name)
+        if self.ttl_seconds <= 0:
+            return await client.get_prompt(prompt_name, arguments)
+
+        key = (backend_name, render_key(prompt_name, arguments))
+        cached = self._cache.get(key)
+        if cached and time.monotonic() < cached[0]:
+            self._cache.move_to_end(key)
+            self._record_lookup(True)
+            return cached[1]
+
+        self._record_lookup(False)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._render(key, client, prompt_name, arguments)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def invalidate(self, backend_name: str | None = None) -> int:
+        self._invalidations += 1
+        keys = [
+            key for key in self._cache if backend_name is None or key[0] == backend_name
+        ]
+        for key in keys:
+            del self._cache[key]
+        for key in list(self._inflight):
+            if backend_name is None or key[0] == backend_name:
+                del self._inflight[key]
+        return len(keys)
+
+    async def _render(
+        self,
+        key: CacheKey,
+        client: MCPClientPort,
+        prompt_name: str,
+        arguments: dict[str, Any],
+    ) -> str:
+        invalidations = self._invalidations
+        rendered = await client.get_prompt(prompt_name, arguments)
+        if invalidations == self._invalidations:
+            self._cache[key] = (time.monotonic() + self.ttl_seconds, rendered)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+        return rendered
+
+    def _finish(self, key: CacheKey, task: asyncio.Task[str]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled() and task.exception():
+            logger.debug(f"Prompt render failed for {key[0]}: {task.exception()}")
+
+    def _record_lookup(self, hit: bool) -> None:
+        if self.metrics:
+            self.metrics.record_cache_lookup("prompt", hit)
+
+
+def render_key(prompt_name: str, arguments: dict[str, Any]) -> str:
+    content = json.dumps(
+        [prompt_name, arguments], sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
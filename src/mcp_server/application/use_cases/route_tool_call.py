@@ -1,15 +1,36 @@
 import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import AbstractContextManager, asynccontextmanager, nullcontext
 from typing import Any
 
-from mcp_server.application.dtos import ToolCallRequest, ToolCallResponse
-from mcp_server.application.ports import MCPClientPort
-from mcp_server.domain.exceptions import BackendNotFoundError
+from mcp_server.application.dtos import (
+    AccessLogEntry,
+    ToolCallRequest,
+    ToolCallResponse,
+)
+from mcp_server.application.ports import (
+    AccessLogPort,
+    ArgumentValidatorPort,
+    MCPClientPort,
+    MetricsPort,
+    RateLimiterPort,
+    RequestSchedulerPort,
+    TracerPort,
+)
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.exceptions import (
+    BackendNotFoundError,
+    InvalidToolArgumentsError,
+    RateLimitExceededError,
+)
 from mcp_server.domain.repositories import BackendRepository
 from mcp_server.domain.services import (
     route_by_capability,
     route_by_fallback,
     route_by_path,
 )
+from mcp_server.domain.value_objects import CircuitState
 
 
 class RouteToolCall:
@@ -20,44 +41,126 @@ class RouteToolCall:
         max_retry_attempts: int = 3,
         retry_backoff_multiplier: float = 2.0,
         max_retry_backoff: int = 10,
+        argument_validator: ArgumentValidatorPort | None = None,
+        metrics: MetricsPort | None = None,
+        tracer: TracerPort | None = None,
+        access_log: AccessLogPort | None = None,
+        scheduler: RequestSchedulerPort | None = None,
+        rate_limiter: RateLimiterPort | None = None,
     ) -> None:
         self.backend_repository = backend_repository
         self.client_factory = client_factory
         self.max_retry_attempts = max_retry_attempts
         self.retry_backoff_multiplier = retry_backoff_multiplier
         self.max_retry_backoff = max_retry_backoff
+        self.argument_validator = argument_validator
+        self.metrics = metrics
+        self.tracer = tracer
+        self.access_log = access_log
+        self.scheduler = scheduler
+        self.rate_limiter = rate_limiter
 
     async def execute(self, request: ToolCallRequest) -> ToolCallResponse:
-        backends = self.backend_repository.get_with_tool(request.tool_name)
-
-        strategy = request.strategy or "capability"
-        if strategy == "capability":
-            decision = route_by_capability(request.tool_name, backends)
-        elif strategy == "path":
-            decision = route_by_path(request.tool_name, backends)
-        elif strategy == "fallback":
-            decision = route_by_fallback(request.tool_name, backends)
-        else:
-            raise ValueError(f"Unknown routing strategy: {strategy}")
-
-        backend = self.backend_repository.get(decision.backend_name)
-        if not backend:
-            raise BackendNotFoundError(decision.backend_name)
-
-        backend.ensure_available()
-
-        client = self.client_factory.get(backend.name)
-        if not client:
-            raise BackendNotFoundError(backend.name)
-
-        result = await self._call_with_retry(
-            client.call_tool,
-            request.tool_name,
-            request.arguments,
-            backend.name,
+        if not self.access_log:
+            with self._span("route_tool_call", tool=request.tool_name):
+                return await self._execute(request)
+
+        entry = AccessLogEntry(
+            tool_name=request.tool_name,
+            arguments=request.arguments,
+            timestamp=time.time(),
+            strategy=request.strategy or "capability",
         )
-
-        backend.record_success()
+        started = time.perf_counter()
+        try:
+            with self._span("route_tool_call", tool=request.tool_name):
+                response = await self._execute(request, entry)
+            entry.result = response.result
+            return response
+        except Exception as e:
+            entry.error = str(e) or type(e).__name__
+            raise
+        finally:
+            entry.latency_seconds = time.perf_counter() - started
+            self.access_log.record(entry)
+
+    async def _execute(
+        self, request: ToolCallRequest, entry: AccessLogEntry | None = None
+    ) -> ToolCallResponse:
+        strategy = request.strategy or "capability"
+        with self._span("routing_decision", strategy=strategy):
+            backends = self.backend_repository.get_with_tool(request.tool_name)
+
+            if strategy == "capability":
+                decision = route_by_capability(request.tool_name, backends)
+            elif strategy == "path":
+                decision = route_by_path(request.tool_name, backends)
+            elif strategy == "fallback":
+                decision = route_by_fallback(request.tool_name, backends)
+            else:
+                raise ValueError(f"Unknown routing strategy: {strategy}")
+
+            backend = self.backend_repository.get(decision.backend_name)
+            if not backend:
+                raise BackendNotFoundError(decision.backend_name)
+
+            if entry:
+                entry.backend_name = backend.name
+                entry.strategy = decision.strategy_used
+            backend.ensure_available()
+            if self.rate_limiter:
+                try:
+                    self.rate_limiter.acquire(
+                        backend.name,
+                        backend.config.rate_limits,
+                        request.tool_name,
+                        request.client_id or request.session_id,
+                    )
+                except RateLimitExceededError:
+                    if entry:
+                        entry.outcome = "rate_limited"
+                    raise
+
+        if self.metrics:
+            self.metrics.request_started(backend.name)
+        started = time.perf_counter()
+        outcome = "error"
+        try:
+            if self.argument_validator:
+                with self._span("validate_arguments"):
+                    self.argument_validator.validate(
+                        backend.name, request.tool_name, request.arguments
+                    )
+
+            client = self.client_factory.get(backend.name)
+            if not client:
+                raise BackendNotFoundError(backend.name)
+
+            async with self._dispatch_slot(backend, request):
+                result = await self._call_with_retry(
+                    client.call_tool,
+                    request.tool_name,
+                    request.arguments,
+                    backend.name,
+                    entry,
+                )
+            outcome = "success"
+        except InvalidToolArgumentsError:
+            outcome = "invalid_arguments"
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            if entry:
+                entry.outcome = outcome
+            if self.metrics:
+                self.metrics.request_finished(
+                    backend.name,
+                    request.tool_name,
+                    elapsed,
+                    outcome,
+                )
+
+        await self._record_success(backend, elapsed)
 
         return ToolCallResponse(
             result=result,
@@ -65,30 +168,82 @@ class RouteToolCall:
             strategy_used=decision.strategy_used,
         )
 
+    @asynccontextmanager
+    async def _dispatch_slot(
+        self, backend: Backend, request: ToolCallRequest
+    ) -> AsyncIterator[None]:
+        if not self.scheduler:
+            yield
+            return
+
+        settings = backend.config.scheduling
+        priority_class = settings.classify(
+            request.client_id, request.session_id, request.tool_name
+        )
+        with self._span("queue_wait", priority_class=priority_class.name):
+            release = await self.scheduler.acquire(
+                backend.name, settings, priority_class
+            )
+        try:
+            yield
+        finally:
+            release()
+
     async def _call_with_retry(
         self,
         func: Any,
         tool_name: str,
         arguments: dict[str, Any],
         backend_name: str,
+        entry: AccessLogEntry | None = None,
     ) -> Any:
         last_error = None
         backoff_time = 1.0
 
         for attempt in range(self.max_retry_attempts):
+            if entry:
+                entry.attempts = attempt + 1
+            if attempt and self.metrics:
+                self.metrics.record_retry(backend_name, tool_name)
             try:
-                result = await func(tool_name, arguments)
-                return result
+                with self._span("attempt", backend=backend_name, attempt=attempt + 1):
+                    with self._span("backend_request", backend=backend_name):
+                        return await func(tool_name, arguments)
 
             except Exception as e:
                 last_error = e
                 backend = self.backend_repository.get(backend_name)
                 if backend:
-                    backend.record_failure(str(e))
+                    await self._record_failure(backend, str(e))
 
                 if attempt < self.max_retry_attempts - 1:
                     sleep_time = min(backoff_time, self.max_retry_backoff)
-                    await asyncio.sleep(sleep_time)
+                    with self._span("backoff", seconds=sleep_time):
+                        await asyncio.sleep(sleep_time)
                     backoff_time *= self.retry_backoff_multiplier
 
         raise last_error or Exception("Unknown error during retry")
+
+    async def _record_success(self, backend: Backend, latency_seconds: float) -> None:
+        previous = backend.health_status.circuit_state
+        await self.backend_repository.update_health(
+            backend, lambda b: b.record_success(latency_seconds)
+        )
+        self._track_circuit(backend, previous)
+
+    async def _record_failure(self, backend: Backend, error_message: str) -> None:
+        previous = backend.health_status.circuit_state
+        await self.backend_repository.update_health(
+            backend, lambda b: b.record_failure(error_message)
+        )
+        self._track_circuit(backend, previous)
+
+    def _track_circuit(self, backend: Backend, previous: CircuitState) -> None:
+        state = backend.health_status.circuit_state
+        if self.metrics and state != previous:
+            self.metrics.record_circuit_transition(backend.name, state.value)
+
+    def _span(self, name: str, **attributes: Any) -> AbstractContextManager[Any]:
+        if self.tracer is None:
+            return nullcontext()
+        return self.tracer.span(name, **attributes)
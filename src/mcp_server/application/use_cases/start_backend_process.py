@@ -0,0 +1,87 @@
+from mcp_server.application.ports import (
+    MCPClientPort,
+    MetricsPort,
+    PortAllocatorPort,
+    ProcessManagerPort,
+    ProcessPoolPort,
+)
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.exceptions import ProcessManagementError
+from mcp_server.infrastructure.adapters import HTTPMCPClient
+
+
+class StartBackendProcess:
+    def __init__(
+        self,
+        process_manager: ProcessManagerPort,
+        port_allocator: PortAllocatorPort,
+        client_factory: dict[str, MCPClientPort],
+        process_pool: ProcessPoolPort | None = None,
+        request_timeout: int = 30,
+        readiness_timeout: float = 30.0,
+        metrics: MetricsPort | None = None,
+    ) -> None:
+        self.process_manager = process_manager
+        self.port_allocator = port_allocator
+        self.client_factory = client_factory
+        self.process_pool = process_pool
+        self.request_timeout = request_timeout
+        self.readiness_timeout = readiness_timeout
+        self.metrics = metrics
+
+    async def execute(self, backend: Backend) -> bool:
+        from_pool = await self.spawn(backend)
+        if not from_pool:
+            await self.wait_until_ready(backend)
+        return from_pool
+
+    async def spawn(self, backend: Backend) -> bool:
+        process_config = backend.config.source.process_config
+        if not process_config:
+            raise ProcessManagementError(f"Backend {backend.name} is not managed")
+
+        spare = None
+        if self.process_pool:
+            spare = await self.process_pool.acquire(process_config)
+            if self.metrics:
+                self.metrics.record_cache_lookup("warm_pool", spare is not None)
+
+        if not spare:
+            backend.process_id = await self.process_manager.start_process(
+                process_config
+            )
+            return False
+
+        backend.move_to_port(spare.port)
+        backend.process_id = spare.pid
+        if backend.name in self.client_factory:
+            self.client_factory[backend.name] = HTTPMCPClient(
+                base_url=backend.config.url,
+                timeout=self.request_timeout,
+            )
+        if process_config.port:
+            await self.port_allocator.release_port(process_config.port)
+        return True
+
+    async def wait_until_ready(self, backend: Backend) -> None:
+        if not backend.process_id:
+            raise ProcessManagementError(f"Backend {backend.name} is not running")
+        try:
+            await self.process_manager.wait_until_ready(
+                backend.process_id, self.readiness_timeout
+            )
+        except Exception:
+            await self.process_manager.stop_process(backend.process_id)
+            backend.process_id = None
+            raise
+
+    async def restart(self, backend: Backend) -> bool:
+        process_config = backend.config.source.process_config
+        if backend.process_id:
+            await self.process_manager.stop_process(backend.process_id)
+
+        from_pool = await self.execute(backend)
+
+        if self.process_pool and process_config:
+            await self.process_pool.prewarm(process_config)
+        return from_pool
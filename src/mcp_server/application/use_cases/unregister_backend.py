@@ -1,4 +1,6 @@
 from mcp_server.application.ports import (
+    ArgumentValidatorPort,
+    CapabilityListenerPort,
     MCPClientPort,
     PortAllocatorPort,
     ProcessManagerPort,
@@ -15,14 +17,18 @@ class UnregisterBackend:
         process_manager: ProcessManagerPort,
         port_allocator: PortAllocatorPort,
         client_factory: dict[str, MCPClientPort],
+        capability_listener: CapabilityListenerPort | None = None,
+        argument_validator: ArgumentValidatorPort | None = None,
     ) -> None:
         self.backend_repository = backend_repository
         self.config_repository = config_repository
         self.process_manager = process_manager
         self.port_allocator = port_allocator
         self.client_factory = client_factory
+        self.capability_listener = capability_listener
+        self.argument_validator = argument_validator
 
-    async def execute(self, backend_name: str) -> None:
+    async def execute(self, backend_name: str, persist: bool = True) -> None:
         backend = self.backend_repository.get(backend_name)
         if not backend:
             raise BackendNotFoundError(backend_name)
@@ -37,4 +43,9 @@ class UnregisterBackend:
 
         self.client_factory.pop(backend_name, None)
         self.backend_repository.remove(backend_name)
-        await self.config_repository.remove_config(backend_name)
+        if self.argument_validator:
+            self.argument_validator.remove_backend(backend_name)
+        if self.capability_listener:
+            await self.capability_listener.backend_removed(backend_name)
+        if persist:
+            await self.config_repository.remove_config(backend_name)
@@ -43,6 +43,50 @@ class RouterConfig:
     circuit_breaker_failure_threshold: int = 5
     circuit_breaker_timeout: int = 60  # seconds
     circuit_breaker_half_open_attempts: int = 3
+    # Process settings
+    warm_pool_size: int = 0
+    readiness_timeout: int = 30  # seconds
+    startup_concurrency: int = 8
+    port_range_start: int = 8100  # 0 uses OS-assigned ephemeral ports
+    port_range_end: int = 8200
+    config_debounce_ms: int = 300
+    # Tool exposure: "direct" lists every proxied tool, "search" lists meta tools
+    tool_exposure: str = "direct"
+    # Prometheus metrics served on /metrics
+    metrics_enabled: bool = True
+    # Tracing: share of calls traced (0 disables), exporter "jsonl" or "otlp"
+    trace_sample_rate: float = 0.0
+    trace_exporter: str = "jsonl"
+    trace_jsonl_path: str = "~/.mcp/traces.jsonl"
+    trace_otlp_endpoint: str = "http://localhost:4318/v1/traces"
+    # Output directory for on-demand CPU and heap profiles
+    profile_dir: str = "~/.mcp/profiles"
+    # Event loop lag sampling interval and slow-step threshold
+    loop_lag_interval_ms: int = 100
+    slow_callback_ms: int = 100
+    # Access log: file path ("-" for stderr, empty disables), success sample rate
+    access_log_path: str = ""
+    access_log_sample_rate: float = 1.0
+    access_log_slow_ms: int = 1000
+    # HTTP worker processes sharing the listening socket (0 uses one per CPU)
+    workers: int = 1
+    # Capabilities discovered by the supervisor, loaded by workers instead of
+    # discovering again
+    capability_snapshot_path: str = ""
+    # SQLite file for health and circuit state shared by router processes
+    # (empty keeps state per process); a lease elects the process running checks
+    state_db_path: str = ""
+    leader_lease_seconds: int = 15
+    # Resource read cache: memory budget (0 disables), optional disk tier
+    resource_cache_mb: int = 32
+    resource_cache_dir: str = ""
+    resource_cache_disk_mb: int = 256
+    # Seconds a rendered prompt is reused for the same name and arguments
+    # (0 disables the render cache)
+    prompt_cache_seconds: float = 60.0
+    # Bearer token backends send with resource notifications (empty accepts
+    # notifications from loopback clients only)
+    notification_token: str = ""
 
     @classmethod
     def from_env(cls) -> "RouterConfig":
@@ -71,4 +115,36 @@ class RouterConfig:
             max_retry_attempts=int(os.getenv("MCP_MAX_RETRIES", "3")),
             retry_backoff_multiplier=float(os.getenv("MCP_RETRY_BACKOFF", "2.0")),
             max_retry_backoff=int(os.getenv("MCP_MAX_BACKOFF", "10")),
+            warm_pool_size=int(os.getenv("MCP_WARM_POOL_SIZE", "0")),
+            readiness_timeout=int(os.getenv("MCP_READINESS_TIMEOUT", "30")),
+            startup_concurrency=int(os.getenv("MCP_STARTUP_CONCURRENCY", "8")),
+            port_range_start=int(os.getenv("MCP_PORT_RANGE_START", "8100")),
+            port_range_end=int(os.getenv("MCP_PORT_RANGE_END", "8200")),
+            config_debounce_ms=int(os.getenv("MCP_CONFIG_DEBOUNCE_MS", "300")),
+            tool_exposure=os.getenv("MCP_TOOL_EXPOSURE", "direct").lower(),
+            metrics_enabled=os.getenv("MCP_METRICS_ENABLED", "true").lower() == "true",
+            trace_sample_rate=float(os.getenv("MCP_TRACE_SAMPLE_RATE", "0.0")),
+            trace_exporter=os.getenv("MCP_TRACE_EXPORTER", "jsonl").lower(),
+            trace_jsonl_path=os.getenv("MCP_TRACE_JSONL_PATH", "~/.mcp/traces.jsonl"),
+            trace_otlp_endpoint=os.getenv(
+                "MCP_TRACE_OTLP_ENDPOINT",
+                "http://localhost:4318/v1/traces",
+            ),
+            profile_dir=os.getenv("MCP_PROFILE_DIR", "~/.mcp/profiles"),
+            loop_lag_interval_ms=int(os.getenv("MCP_LOOP_LAG_INTERVAL_MS", "100")),
+            slow_callback_ms=int(os.getenv("MCP_SLOW_CALLBACK_MS", "100")),
+            access_log_path=os.getenv("MCP_ACCESS_LOG_PATH", ""),
+            access_log_sample_rate=float(
+                os.getenv("MCP_ACCESS_LOG_SAMPLE_RATE", "1.0")
+            ),
+            access_log_slow_ms=int(os.getenv("MCP_ACCESS_LOG_SLOW_MS", "1000")),
+            workers=int(os.getenv("MCP_WORKERS", "1")),
+            capability_snapshot_path=os.getenv("MCP_CAPABILITY_SNAPSHOT", ""),
+            state_db_path=os.getenv("MCP_STATE_DB", ""),
+            leader_lease_seconds=int(os.getenv("MCP_LEADER_LEASE_SECONDS", "15")),
+            resource_cache_mb=int(os.getenv("MCP_RESOURCE_CACHE_MB", "32")),
+            resource_cache_dir=os.getenv("MCP_RESOURCE_CACHE_DIR", ""),
+            resource_cache_disk_mb=int(os.getenv("MCP_RESOURCE_CACHE_DISK_MB", "256")),
+            prompt_cache_seconds=float(os.getenv("MCP_PROMPT_CACHE_SECONDS", "60")),
+            notification_token=os.getenv("MCP_NOTIFICATION_TOKEN", ""),
         )
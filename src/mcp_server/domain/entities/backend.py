@@ -1,4 +1,6 @@
-from dataclasses import dataclass, field
+import hashlib
+import json
+from dataclasses import dataclass, field, replace
 from typing import Any
 
 from mcp_server.domain.exceptions import CircuitBreakerOpenError
@@ -6,6 +8,7 @@ from mcp_server.domain.value_objects import (
     BackendConfig,
     CircuitState,
     HealthStatus,
+    LatencyStats,
 )
 
 
@@ -13,13 +16,20 @@ from mcp_server.domain.value_objects import (
 class Backend:
     config: BackendConfig
     health_status: HealthStatus = field(init=False)
+    latency: LatencyStats = field(init=False, default_factory=LatencyStats)
     tools: list[dict[str, Any]] = field(default_factory=list)
     resources: list[dict[str, Any]] = field(default_factory=list)
     prompts: list[dict[str, Any]] = field(default_factory=list)
     process_id: int | None = None
+    capabilities_hash: str = field(init=False)
+    declared_config: BackendConfig = field(init=False)
 
     def __post_init__(self) -> None:
+        self.declared_config = self.config
         self.health_status = HealthStatus(backend_name=self.config.name)
+        self.capabilities_hash = _hash_capabilities(
+            self.tools, self.resources, self.prompts
+        )
 
     @property
     def name(self) -> str:
@@ -50,8 +60,10 @@ class Backend:
     def has_prompt(self, prompt_name: str) -> bool:
         return any(p.get("name") == prompt_name for p in self.prompts)
 
-    def record_success(self) -> None:
+    def record_success(self, latency_seconds: float | None = None) -> None:
         self.health_status = self.health_status.with_success()
+        if latency_seconds is not None:
+            self.latency = self.latency.with_sample(latency_seconds)
 
     def record_failure(self, error_message: str) -> None:
         self.health_status = self.health_status.with_failure(error_message)
@@ -71,6 +83,17 @@ class Backend:
             CircuitState.HALF_OPEN
         )
 
+    def reconfigure(self, config: BackendConfig) -> None:
+        self.declared_config = config
+        self.config = replace(config, source=self.config.source)
+
+        threshold = config.circuit_breaker.failure_threshold
+        if not self.is_circuit_open and self.health_status.error_count >= threshold:
+            self.open_circuit()
+
+    def move_to_port(self, port: int) -> None:
+        self.config = self.config.with_port(port)
+
     def ensure_available(self) -> None:
         if self.is_circuit_open:
             raise CircuitBreakerOpenError(self.name)
@@ -80,7 +103,24 @@ class Backend:
         tools: list[dict[str, Any]],
         resources: list[dict[str, Any]],
         prompts: list[dict[str, Any]],
-    ) -> None:
+    ) -> bool:
+        capabilities_hash = _hash_capabilities(tools, resources, prompts)
+        if capabilities_hash == self.capabilities_hash:
+            return False
+
         self.tools = tools
         self.resources = resources
         self.prompts = prompts
+        self.capabilities_hash = capabilities_hash
+        return True
+
+
+def _hash_capabilities(
+    tools: list[dict[str, Any]],
+    resources: list[dict[str, Any]],
+    prompts: list[dict[str, Any]],
+) -> str:
+    payload = json.dumps(
+        [tools, resources, prompts], sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
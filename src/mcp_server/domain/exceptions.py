@@ -25,6 +25,26 @@ class CircuitBreakerOpenError(DomainException):
         self.backend_name = backend_name
 
 
+class InvalidToolArgumentsError(DomainException):
+    def __init__(self, tool_name: str, errors: list[str]) -> None:
+        super().__init__(f"Invalid arguments for tool {tool_name}: {'; '.join(errors)}")
+        self.tool_name = tool_name
+        self.errors = errors
+
+
+class RateLimitExceededError(DomainException):
+    def __init__(
+        self, backend_name: str, scope: str, retry_after_seconds: float
+    ) -> None:
+        super().__init__(
+            f"Rate limit exceeded for backend {backend_name} ({scope}); "
+            f"retry after {retry_after_seconds:.2f}s"
+        )
+        self.backend_name = backend_name
+        self.scope = scope
+        self.retry_after_seconds = retry_after_seconds
+
+
 class InvalidConfigurationError(DomainException):
     pass
 
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 
 from mcp_server.domain.entities import Backend
 
@@ -31,3 +32,11 @@ class BackendRepository(ABC):
     @abstractmethod
     def exists(self, name: str) -> bool:
         pass
+
+    async def update_health(
+        self, backend: Backend, change: Callable[[Backend], None]
+    ) -> None:
+        change(backend)
+
+    def close(self) -> None:
+        return None
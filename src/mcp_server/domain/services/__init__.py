@@ -1,14 +1,21 @@
+from mcp_server.domain.services.config_diff import (
+    affects_capabilities,
+    diff_backend_configs,
+    requires_restart,
+)
 from mcp_server.domain.services.health_policy import (
     is_healthy,
     should_attempt_half_open,
     should_close_circuit,
     should_open_circuit,
 )
+from mcp_server.domain.services.resource_uri_trie import ResourceUriTrie
 from mcp_server.domain.services.routing_strategies import (
     route_by_capability,
     route_by_fallback,
     route_by_path,
 )
+from mcp_server.domain.services.tool_search_index import ToolSearchIndex
 
 __all__ = [
     "route_by_capability",
@@ -18,4 +25,9 @@ __all__ = [
     "should_attempt_half_open",
     "should_close_circuit",
     "is_healthy",
+    "diff_backend_configs",
+    "requires_restart",
+    "affects_capabilities",
+    "ToolSearchIndex",
+    "ResourceUriTrie",
 ]
@@ -0,0 +1,51 @@
+from dataclasses import fields, replace
+
+from mcp_server.domain.value_objects import BackendConfig, BackendSource, ProcessConfig
+
+RESTART_FIELDS = frozenset({"source", "auto_start"})
+CAPABILITY_FIELDS = frozenset({"namespace"})
+
+
+def diff_backend_configs(current: BackendConfig, new: BackendConfig) -> frozenset[str]:
+    changed = {
+        f.name
+        for f in fields(BackendConfig)
+        if f.name != "source" and getattr(current, f.name) != getattr(new, f.name)
+    }
+    if _source_changed(current.source, new.source):
+        changed.add("source")
+    return frozenset(changed)
+
+
+def requires_restart(changed_fields: frozenset[str]) -> bool:
+    return bool(changed_fields & RESTART_FIELDS)
+
+
+def affects_capabilities(changed_fields: frozenset[str]) -> bool:
+    return bool(changed_fields & CAPABILITY_FIELDS)
+
+
+def _source_changed(current: BackendSource, new: BackendSource) -> bool:
+    if not current.process_config or not new.process_config:
+        return current != new
+
+    without_process = replace(current, process_config=None)
+    if without_process != replace(new, process_config=None):
+        return True
+    return _process_changed(current.process_config, new.process_config)
+
+
+def _process_changed(current: ProcessConfig, new: ProcessConfig) -> bool:
+    if new.port is not None and new.port != current.port:
+        return True
+    return (
+        current.command != new.command
+        or current.args != new.args
+        or _user_env(current) != _user_env(new)
+        or current.ready_pattern != new.ready_pattern
+        or current.inherit_socket != new.inherit_socket
+    )
+
+
+def _user_env(config: ProcessConfig) -> dict[str, str]:
+    return {k: v for k, v in config.env.items() if k != "PORT"}
@@ -0,0 +1,170 @@
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+from mcp_server.domain.value_objects import ResourceMatch
+
+_PARAMETER = re.compile(r"^\{(\w+)(\*?)\}$")
+
+
+def uri_segments(uri: str) -> list[str]:
+    scheme, separator, rest = uri.partition("://")
+    if not separator:
+        return ["", *uri.split("/")]
+    return [scheme.lower(), *rest.split("/")]
+
+
+@dataclass
+class _Route:
+    uri: str
+    backend_name: str
+    resource_info: dict[str, Any]
+    names: tuple[str, ...]
+
+
+@dataclass
+class _Node:
+    children: dict[str, "_Node"] = field(default_factory=dict)
+    parameter: "_Node | None" = None
+    route: _Route | None = None
+    tail: _Route | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.children or self.parameter or self.route or self.tail)
+
+
+class ResourceUriTrie:
+    def __init__(self) -> None:
+        self._root = _Node()
+        self._by_backend: dict[str, dict[str, dict[str, Any]]] = {}
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def index_backend(
+        self, backend_name: str, resources: dict[str, dict[str, Any]]
+    ) -> None:
+        previous = self._by_backend.pop(backend_name, {})
+        for uri, resource_info in previous.items():
+            if resources.get(uri) != resource_info:
+                self._remove(uri, backend_name)
+
+        indexed = {}
+        for uri, resource_info in resources.items():
+            if previous.get(uri) == resource_info or self._insert(
+                uri, backend_name, resource_info
+            ):
+                indexed[uri] = resource_info
+        if indexed:
+            self._by_backend[backend_name] = indexed
+
+    def remove_backend(self, backend_name: str) -> None:
+        for uri in self._by_backend.pop(backend_name, {}):
+            self._remove(uri, backend_name)
+
+    @property
+    def backend_names(self) -> list[str]:
+        return list(self._by_backend)
+
+    def backend_resources(self, backend_name: str) -> dict[str, dict[str, Any]]:
+        return self._by_backend.get(backend_name, {})
+
+    def match(self, uri: str) -> ResourceMatch | None:
+        captured: list[str] = []
+        route = _match(self._root, uri_segments(uri), 0, captured)
+        if route is None:
+            return None
+        return ResourceMatch(
+            uri=route.uri,
+            backend_name=route.backend_name,
+            resource_info=route.resource_info,
+            params=dict(zip(route.names, captured, strict=True)),
+        )
+
+    def _insert(
+        self, uri: str, backend_name: str, resource_info: dict[str, Any]
+    ) -> bool:
+        node = self._root
+        names: list[str] = []
+        segments = uri_segments(uri)
+        for index, segment in enumerate(segments):
+            parameter = _PARAMETER.match(segment)
+            if parameter and parameter.group(2) and index == len(segments) - 1:
+                names.append(parameter.group(1))
+                if node.tail and node.tail.backend_name != backend_name:
+                    return False
+                self._count += node.tail is None
+                node.tail = _Route(uri, backend_name, resource_info, tuple(names))
+                return True
+            if parameter:
+                names.append(parameter.group(1))
+                node.parameter = node.parameter or _Node()
+                node = node.parameter
+            else:
+                node = node.children.setdefault(segment, _Node())
+
+        if node.route and node.route.backend_name != backend_name:
+            return False
+        self._count += node.route is None
+        node.route = _Route(uri, backend_name, resource_info, tuple(names))
+        return True
+
+    def _remove(self, uri: str, backend_name: str) -> None:
+        path: list[tuple[_Node, str | None]] = []
+        node = self._root
+        segments = uri_segments(uri)
+        for index, segment in enumerate(segments):
+            parameter = _PARAMETER.match(segment)
+            if parameter and parameter.group(2) and index == len(segments) - 1:
+                if node.tail and node.tail.backend_name == backend_name:
+                    node.tail = None
+                    self._count -= 1
+                break
+            child = node.parameter if parameter else node.children.get(segment)
+            if child is None:
+                return
+            path.append((node, None if parameter else segment))
+            node = child
+        else:
+            if node.route and node.route.backend_name == backend_name:
+                node.route = None
+                self._count -= 1
+
+        for parent, segment in reversed(path):
+            child = (
+                parent.children[segment] if segment is not None else parent.parameter
+            )
+            if child is None or not child.is_empty:
+                break
+            if segment is None:
+                parent.parameter = None
+            else:
+                del parent.children[segment]
+
+
+def _match(
+    node: _Node, segments: list[str], index: int, captured: list[str]
+) -> _Route | None:
+    if index == len(segments):
+        return node.route
+
+    segment = segments[index]
+    child = node.children.get(segment)
+    if child is not None:
+        route = _match(child, segments, index + 1, captured)
+        if route is not None:
+            return route
+
+    if node.parameter is not None and segment:
+        captured.append(segment)
+        route = _match(node.parameter, segments, index + 1, captured)
+        if route is not None:
+            return route
+        captured.pop()
+
+    if node.tail is not None and segment:
+        captured.append("/".join(segments[index:]))
+        return node.tail
+    return None
@@ -0,0 +1,147 @@
+import heapq
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from mcp_server.domain.value_objects import ToolSearchHit
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_CAMEL_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])")
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> list[str]:
+    return _TOKEN.findall(_CAMEL_BOUNDARY.sub(" ", text).lower())
+
+
+def _tool_terms(name: str, tool_info: dict[str, Any]) -> Counter[str]:
+    schema = tool_info.get("inputSchema") or {}
+    parameters = " ".join((schema.get("properties") or {}).keys())
+    return Counter(
+        tokenize(name)
+        + tokenize(tool_info.get("description") or "")
+        + tokenize(parameters)
+    )
+
+
+@dataclass
+class _Document:
+    name: str
+    backend_name: str
+    tool_info: dict[str, Any]
+    terms: Counter[str]
+    length: int
+
+
+class ToolSearchIndex:
+    def __init__(self) -> None:
+        self._documents: dict[str, _Document] = {}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._by_backend: dict[str, set[str]] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def index_backend(
+        self, backend_name: str, tools: dict[str, dict[str, Any]]
+    ) -> None:
+        previous = self._by_backend.get(backend_name, set())
+        for name in previous - tools.keys():
+            self._remove(name)
+
+        for name, tool_info in tools.items():
+            existing = self._documents.get(name)
+            if existing and existing.tool_info == tool_info:
+                continue
+            if existing:
+                self._remove(name)
+            self._add(name, backend_name, tool_info)
+
+        if tools:
+            self._by_backend[backend_name] = set(tools)
+        else:
+            self._by_backend.pop(backend_name, None)
+
+    def remove_backend(self, backend_name: str) -> None:
+        self.index_backend(backend_name, {})
+
+    def get(self, name: str) -> ToolSearchHit | None:
+        document = self._documents.get(name)
+        if not document:
+            return None
+        return ToolSearchHit(
+            name=document.name,
+            backend_name=document.backend_name,
+            score=0.0,
+            tool_info=document.tool_info,
+        )
+
+    def search(self, query: str, limit: int = 10) -> list[ToolSearchHit]:
+        if not self._documents or limit < 1:
+            return []
+
+        count = len(self._documents)
+        average_length = self._total_length / count
+        documents = self._documents
+        norms: dict[int, float] = {}
+        scores: dict[str, float] = {}
+
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            matches = len(postings)
+            idf = math.log(1 + (count - matches + 0.5) / (matches + 0.5))
+            weight = idf * (BM25_K1 + 1)
+            for name, frequency in postings.items():
+                length = documents[name].length
+                norm = norms.get(length)
+                if norm is None:
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+                    norms[length] = norm
+                scores[name] = scores.get(name, 0.0) + weight * frequency / (
+                    frequency + norm
+                )
+
+        best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        return [
+            ToolSearchHit(
+                name=name,
+                backend_name=self._documents[name].backend_name,
+                score=score,
+                tool_info=self._documents[name].tool_info,
+            )
+            for name, score in best
+        ]
+
+    def _add(self, name: str, backend_name: str, tool_info: dict[str, Any]) -> None:
+        terms = _tool_terms(name, tool_info)
+        length = sum(terms.values())
+        self._documents[name] = _Document(
+            name=name,
+            backend_name=backend_name,
+            tool_info=tool_info,
+            terms=terms,
+            length=length,
+        )
+        self._total_length += length
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[name] = frequency
+
+    def _remove(self, name: str) -> None:
+        document = self._documents.pop(name, None)
+        if not document:
+            return
+        self._total_length -= document.length
+        for term in document.terms:
+            postings = self._postings.get(term)
+            if postings is None:
+                continue
+            postings.pop(name, None)
+            if not postings:
+                del self._postings[term]
@@ -2,7 +2,11 @@ from mcp_server.domain.value_objects.backend_config import (
     BackendConfig,
     CircuitBreakerSettings,
     HealthCheckSettings,
+    PriorityClass,
+    RateLimitRule,
+    ResourceCacheRule,
     RoutePattern,
+    SchedulingSettings,
 )
 from mcp_server.domain.value_objects.backend_source import (
     BackendSource,
@@ -10,12 +14,19 @@ from mcp_server.domain.value_objects.backend_source import (
 )
 from mcp_server.domain.value_objects.github_spec import GitHubSpec
 from mcp_server.domain.value_objects.health_status import CircuitState, HealthStatus
+from mcp_server.domain.value_objects.latency_stats import LatencyStats
 from mcp_server.domain.value_objects.process_config import ProcessConfig
+from mcp_server.domain.value_objects.resource_match import ResourceMatch
 from mcp_server.domain.value_objects.routing_decision import RoutingDecision
+from mcp_server.domain.value_objects.tool_search_hit import ToolSearchHit
 
 __all__ = [
     "BackendConfig",
     "RoutePattern",
+    "ResourceCacheRule",
+    "PriorityClass",
+    "SchedulingSettings",
+    "RateLimitRule",
     "HealthCheckSettings",
     "CircuitBreakerSettings",
     "BackendSource",
@@ -24,5 +35,8 @@ __all__ = [
     "ProcessConfig",
     "HealthStatus",
     "CircuitState",
+    "LatencyStats",
     "RoutingDecision",
+    "ToolSearchHit",
+    "ResourceMatch",
 ]
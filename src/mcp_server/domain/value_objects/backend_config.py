@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from fnmatch import fnmatchcase
 
 from mcp_server.domain.value_objects.backend_source import (
     BackendSource,
@@ -19,6 +20,105 @@ class RoutePattern:
             raise ValueError(f"Invalid strategy: {self.strategy}")
 
 
+@dataclass(frozen=True)
+class ResourceCacheRule:
+    pattern: str
+    ttl_seconds: float = 0.0
+    stale_while_revalidate_seconds: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.pattern:
+            raise ValueError("Resource cache pattern cannot be empty")
+        if self.ttl_seconds < 0:
+            raise ValueError("Resource cache TTL cannot be negative")
+        if self.stale_while_revalidate_seconds < 0:
+            raise ValueError("Stale-while-revalidate window cannot be negative")
+
+    def matches(self, uri: str) -> bool:
+        return fnmatchcase(uri, self.pattern)
+
+
+RATE_LIMIT_SCOPES = ("backend", "tool", "client")
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    scope: str
+    rate_per_second: float
+    burst: float = 1.0
+    pattern: str = "*"
+
+    def __post_init__(self) -> None:
+        if self.scope not in RATE_LIMIT_SCOPES:
+            raise ValueError(f"Invalid rate limit scope: {self.scope}")
+        if self.rate_per_second <= 0:
+            raise ValueError("Rate limit rate must be positive")
+        if self.burst < 1:
+            raise ValueError("Rate limit burst must be at least 1")
+        if not self.pattern:
+            raise ValueError("Rate limit pattern cannot be empty")
+
+    def subject(self, tool_name: str, client_id: str | None) -> str | None:
+        if self.scope == "backend":
+            return ""
+        if self.scope == "tool":
+            return "" if fnmatchcase(tool_name, self.pattern) else None
+        identity = client_id or ""
+        return identity if fnmatchcase(identity, self.pattern) else None
+
+
+@dataclass(frozen=True)
+class PriorityClass:
+    name: str
+    weight: float = 1.0
+    preemptive: bool = False
+    clients: tuple[str, ...] = ()
+    sessions: tuple[str, ...] = ()
+    tools: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        if not self.name:
+            raise ValueError("Priority class name cannot be empty")
+        if self.weight <= 0:
+            raise ValueError("Priority class weight must be positive")
+
+    def matches(
+        self, client_id: str | None, session_id: str | None, tool_name: str
+    ) -> bool:
+        return (
+            _matches_any(client_id, self.clients)
+            or _matches_any(session_id, self.sessions)
+            or _matches_any(tool_name, self.tools)
+        )
+
+
+DEFAULT_PRIORITY_CLASS = PriorityClass(name="default")
+
+
+@dataclass(frozen=True)
+class SchedulingSettings:
+    max_concurrency: int = 0
+    classes: tuple[PriorityClass, ...] = ()
+
+    def __post_init__(self) -> None:
+        if self.max_concurrency < 0:
+            raise ValueError("Max concurrency cannot be negative")
+        names = [c.name for c in self.classes]
+        if len(names) != len(set(names)):
+            raise ValueError("Priority class names must be unique")
+
+    def classify(
+        self, client_id: str | None, session_id: str | None, tool_name: str
+    ) -> PriorityClass:
+        for priority_class in self.classes:
+            if priority_class.matches(client_id, session_id, tool_name):
+                return priority_class
+        return next(
+            (c for c in self.classes if c.name == DEFAULT_PRIORITY_CLASS.name),
+            DEFAULT_PRIORITY_CLASS,
+        )
+
+
 @dataclass(frozen=True)
 class HealthCheckSettings:
     enabled: bool = True
@@ -58,6 +158,9 @@ class BackendConfig:
     health_check: HealthCheckSettings = HealthCheckSettings()
     circuit_breaker: CircuitBreakerSettings = CircuitBreakerSettings()
     auto_start: bool = True
+    resource_cache: tuple[ResourceCacheRule, ...] = ()
+    scheduling: SchedulingSettings = SchedulingSettings()
+    rate_limits: tuple[RateLimitRule, ...] = ()
 
     @property
     def url(self) -> str:
@@ -67,6 +170,15 @@ class BackendConfig:
             return f"http://localhost:{self.source.process_config.port}"
         raise ValueError(f"Backend {self.name} has no accessible URL")
 
+    def resource_cache_rule(self, uri: str) -> ResourceCacheRule | None:
+        return next((r for r in self.resource_cache if r.matches(uri)), None)
+
+    def with_port(self, port: int) -> "BackendConfig":
+        if not self.source.process_config:
+            raise ValueError(f"Backend {self.name} has no managed process")
+        process_config = self.source.process_config.with_port(port)
+        return replace(self, source=replace(self.source, process_config=process_config))
+
     def __post_init__(self) -> None:
         if not self.name:
             raise ValueError("Backend name cannot be empty")
@@ -74,3 +186,7 @@ class BackendConfig:
             raise ValueError("Backend namespace cannot be empty")
         if self.priority < 0:
             raise ValueError("Backend priority cannot be negative")
+
+
+def _matches_any(value: str | None, patterns: tuple[str, ...]) -> bool:
+    return value is not None and any(fnmatchcase(value, p) for p in patterns)
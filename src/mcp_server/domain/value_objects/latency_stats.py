@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class LatencyStats:
+    count: int = 0
+    ewma_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def __post_init__(self) -> None:
+        if self.count < 0:
+            raise ValueError("Latency sample count cannot be negative")
+
+    def with_sample(self, seconds: float, weight: float = 0.2) -> "LatencyStats":
+        ewma = (
+            seconds
+            if not self.count
+            else self.ewma_seconds + weight * (seconds - self.ewma_seconds)
+        )
+        return LatencyStats(
+            count=self.count + 1,
+            ewma_seconds=ewma,
+            max_seconds=max(self.max_seconds, seconds),
+        )
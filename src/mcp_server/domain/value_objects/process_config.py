@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 
 
 @dataclass(frozen=True)
@@ -7,9 +7,14 @@ class ProcessConfig:
     args: tuple[str, ...] = ()
     port: int | None = None
     env: dict[str, str] = field(default_factory=dict)
+    ready_pattern: str | None = None
+    inherit_socket: bool = False
 
     def __post_init__(self) -> None:
         if not self.command:
             raise ValueError("Process command cannot be empty")
         if self.port is not None and (self.port < 1 or self.port > 65535):
             raise ValueError(f"Invalid port number: {self.port}")
+
+    def with_port(self, port: int) -> "ProcessConfig":
+        return replace(self, port=port, env={**self.env, "PORT": str(port)})
@@ -0,0 +1,26 @@
+import re
+from dataclasses import dataclass, field
+from typing import Any
+
+_TEMPLATE_PARAMETER = re.compile(r"\{(\w+)\*?\}")
+
+
+@dataclass(frozen=True)
+class ResourceMatch:
+    uri: str
+    backend_name: str
+    resource_info: dict[str, Any]
+    params: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_template(self) -> bool:
+        return "uri" not in self.resource_info
+
+    @property
+    def original_uri(self) -> str:
+        if not self.is_template:
+            return self.resource_info["uri"]
+        return _TEMPLATE_PARAMETER.sub(
+            lambda m: self.params.get(m.group(1), ""),
+            self.resource_info["uriTemplate"],
+        )
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class ToolSearchHit:
+    name: str
+    backend_name: str
+    score: float
+    tool_info: dict[str, Any]
+
+    @property
+    def description(self) -> str:
+        return self.tool_info.get("description", "")
@@ -1,3 +1,13 @@
-from mcp_server.infrastructure import adapters, repositories
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from mcp_server.infrastructure import adapters, repositories
 
 __all__ = ["adapters", "repositories"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in __all__:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return import_module(f"{__name__}.{name}")
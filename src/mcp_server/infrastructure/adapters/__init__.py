@@ -1,5 +1,88 @@
-from mcp_server.infrastructure.adapters.http_mcp_client import HTTPMCPClient
-from mcp_server.infrastructure.adapters.port_allocator import PortAllocator
-from mcp_server.infrastructure.adapters.uvx_process_manager import UvxProcessManager
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["HTTPMCPClient", "UvxProcessManager", "PortAllocator"]
+if TYPE_CHECKING:
+    from mcp_server.infrastructure.adapters.fair_request_scheduler import (
+        FairRequestScheduler,
+    )
+    from mcp_server.infrastructure.adapters.http_mcp_client import HTTPMCPClient
+    from mcp_server.infrastructure.adapters.json_capability_snapshot import (
+        JsonCapabilitySnapshot,
+    )
+    from mcp_server.infrastructure.adapters.json_schema_argument_validator import (
+        JsonSchemaArgumentValidator,
+    )
+    from mcp_server.infrastructure.adapters.port_allocator import PortAllocator
+    from mcp_server.infrastructure.adapters.prometheus_metrics import PrometheusMetrics
+    from mcp_server.infrastructure.adapters.queued_access_log import QueuedAccessLog
+    from mcp_server.infrastructure.adapters.span_exporters import (
+        JsonLinesSpanExporter,
+        OtlpHttpSpanExporter,
+        SpanExporter,
+    )
+    from mcp_server.infrastructure.adapters.span_tracer import (
+        Span,
+        SpanTracer,
+        current_traceparent,
+    )
+    from mcp_server.infrastructure.adapters.sqlite_leader_lease import (
+        SqliteLeaderLease,
+    )
+    from mcp_server.infrastructure.adapters.tiered_resource_cache import (
+        TieredResourceCache,
+    )
+    from mcp_server.infrastructure.adapters.token_bucket_rate_limiter import (
+        TokenBucketRateLimiter,
+    )
+    from mcp_server.infrastructure.adapters.uvx_process_manager import UvxProcessManager
+    from mcp_server.infrastructure.adapters.warm_process_pool import WarmProcessPool
+
+_EXPORTS = {
+    "FairRequestScheduler": "fair_request_scheduler",
+    "HTTPMCPClient": "http_mcp_client",
+    "JsonCapabilitySnapshot": "json_capability_snapshot",
+    "JsonSchemaArgumentValidator": "json_schema_argument_validator",
+    "PortAllocator": "port_allocator",
+    "PrometheusMetrics": "prometheus_metrics",
+    "QueuedAccessLog": "queued_access_log",
+    "JsonLinesSpanExporter": "span_exporters",
+    "OtlpHttpSpanExporter": "span_exporters",
+    "SpanExporter": "span_exporters",
+    "Span": "span_tracer",
+    "SpanTracer": "span_tracer",
+    "current_traceparent": "span_tracer",
+    "SqliteLeaderLease": "sqlite_leader_lease",
+    "TieredResourceCache": "tiered_resource_cache",
+    "TokenBucketRateLimiter": "token_bucket_rate_limiter",
+    "UvxProcessManager": "uvx_process_manager",
+    "WarmProcessPool": "warm_process_pool",
+}
+
+__all__ = [
+    "FairRequestScheduler",
+    "HTTPMCPClient",
+    "JsonCapabilitySnapshot",
+    "JsonLinesSpanExporter",
+    "JsonSchemaArgumentValidator",
+    "OtlpHttpSpanExporter",
+    "UvxProcessManager",
+    "PortAllocator",
+    "PrometheusMetrics",
+    "QueuedAccessLog",
+    "Span",
+    "SpanExporter",
+    "SpanTracer",
+    "SqliteLeaderLease",
+    "TieredResourceCache",
+    "TokenBucketRateLimiter",
+    "WarmProcessPool",
+    "current_traceparent",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    globals()[name] = value
+    return value
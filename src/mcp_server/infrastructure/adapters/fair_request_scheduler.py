@@ -0,0 +1,152 @@
+import asyncio
+import time
+from collections import deque
+from collections.abc import Callable
+from functools import partial
+
+from mcp_server.application.ports import MetricsPort, RequestSchedulerPort
+from mcp_server.domain.value_objects import PriorityClass, SchedulingSettings
+
+
+class _ClassQueue:
+    __slots__ = ("name", "weight", "preemptive", "waiters", "deficit")
+
+    def __init__(self, priority_class: PriorityClass) -> None:
+        self.name = priority_class.name
+        self.weight = priority_class.weight
+        self.preemptive = priority_class.preemptive
+        self.waiters: deque[asyncio.Future[None]] = deque()
+        self.deficit = 0.0
+
+
+class _BackendQueue:
+    def __init__(self, backend_name: str) -> None:
+        self.backend_name = backend_name
+        self.limit = 0
+        self.in_flight = 0
+        self.classes: dict[str, _ClassQueue] = {}
+        self._cursors = {True: 0, False: 0}
+
+    def class_queue(self, priority_class: PriorityClass) -> _ClassQueue:
+        class_queue = self.classes.get(priority_class.name)
+        if class_queue is None:
+            class_queue = self.classes[priority_class.name] = _ClassQueue(
+                priority_class
+            )
+        class_queue.weight = priority_class.weight
+        class_queue.preemptive = priority_class.preemptive
+        return class_queue
+
+    def next_class(self) -> _ClassQueue | None:
+        for preemptive in (True, False):
+            group = [c for c in self.classes.values() if c.preemptive == preemptive]
+            if any(c.waiters for c in group):
+                return self._deficit_round_robin(group, preemptive)
+        return None
+
+    def _deficit_round_robin(
+        self, group: list[_ClassQueue], preemptive: bool
+    ) -> _ClassQueue:
+        cursor = self._cursors[preemptive]
+        while True:
+            current = group[cursor % len(group)]
+            if current.waiters and current.deficit >= 1:
+                current.deficit -= 1
+                self._cursors[preemptive] = cursor
+                return current
+            if not current.waiters:
+                current.deficit = 0.0
+            cursor += 1
+            upcoming = group[cursor % len(group)]
+            if upcoming.waiters:
+                upcoming.deficit += upcoming.weight
+
+
+class FairRequestScheduler(RequestSchedulerPort):
+    def __init__(self, metrics: MetricsPort | None = None) -> None:
+        self.metrics = metrics
+        self._queues: dict[str, _BackendQueue] = {}
+
+    def queue_depth(self, backend_name: str) -> dict[str, int]:
+        queue = self._queues.get(backend_name)
+        if queue is None:
+            return {}
+        return {name: len(c.waiters) for name, c in queue.classes.items()}
+
+    def in_flight(self, backend_name: str) -> int:
+        queue = self._queues.get(backend_name)
+        return queue.in_flight if queue else 0
+
+    async def acquire(
+        self,
+        backend_name: str,
+        settings: SchedulingSettings,
+        priority_class: PriorityClass,
+    ) -> Callable[[], None]:
+        if settings.max_concurrency <= 0:
+            return _release_nothing
+
+        queue = self._queues.get(backend_name)
+        if queue is None:
+            queue = self._queues[backend_name] = _BackendQueue(backend_name)
+        queue.limit = settings.max_concurrency
+        release = partial(self._release, queue)
+
+        if queue.in_flight < queue.limit and not any(
+            c.waiters for c in queue.classes.values()
+        ):
+            queue.in_flight += 1
+            self._record_wait(queue, priority_class.name, 0.0)
+            return release
+
+        class_queue = queue.class_queue(priority_class)
+        waiter = asyncio.get_running_loop().create_future()
+        class_queue.waiters.append(waiter)
+        self._record_depth(queue, class_queue)
+        started = time.perf_counter()
+        self._dispatch(queue)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._release(queue)
+            elif waiter in class_queue.waiters:
+                class_queue.waiters.remove(waiter)
+                self._record_depth(queue, class_queue)
+            raise
+        self._record_wait(queue, class_queue.name, time.perf_counter() - started)
+        return release
+
+    def _release(self, queue: _BackendQueue) -> None:
+        queue.in_flight -= 1
+        self._dispatch(queue)
+
+    def _dispatch(self, queue: _BackendQueue) -> None:
+        while queue.in_flight < queue.limit:
+            class_queue = queue.next_class()
+            if class_queue is None:
+                return
+            waiter = class_queue.waiters.popleft()
+            self._record_depth(queue, class_queue)
+            if waiter.done():
+                continue
+            waiter.set_result(None)
+            queue.in_flight += 1
+
+    def _record_wait(
+        self, queue: _BackendQueue, priority_class: str, wait_seconds: float
+    ) -> None:
+        if self.metrics:
+            self.metrics.record_queue_wait(
+                queue.backend_name, priority_class, wait_seconds
+            )
+
+    def _record_depth(self, queue: _BackendQueue, class_queue: _ClassQueue) -> None:
+        if self.metrics:
+            self.metrics.set_queue_depth(
+                queue.backend_name, class_queue.name, len(class_queue.waiters)
+            )
+
+
+def _release_nothing() -> None:
+    pass
@@ -1,9 +1,13 @@
 import logging
+import ssl
+from functools import cache
 from typing import Any
 
 import httpx
 
+from mcp_server.application.dtos import ResourceFetch
 from mcp_server.application.ports import MCPClientPort
+from mcp_server.infrastructure.adapters.span_tracer import current_traceparent
 
 logger = logging.getLogger(__name__)
 
@@ -13,50 +17,123 @@ class HTTPMCPClient(MCPClientPort):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
 
+    def _client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(timeout=self.timeout, verify=_ssl_context())
+
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             response = await client.post(
                 f"{self.base_url}/tools/{tool_name}",
                 json=arguments,
+                headers=_trace_headers(),
             )
             response.raise_for_status()
             return response.json()
 
     async def get_resource(self, uri: str) -> str:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             response = await client.get(
                 f"{self.base_url}/resources",
                 params={"uri": uri},
+                headers=_trace_headers(),
             )
             response.raise_for_status()
             return response.text
 
+    async def fetch_resource(
+        self,
+        uri: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> ResourceFetch:
+        headers = _trace_headers() or {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        async with self._client() as client:
+            response = await client.get(
+                f"{self.base_url}/resources",
+                params={"uri": uri},
+                headers=headers,
+            )
+            if response.status_code != 304:
+                response.raise_for_status()
+
+        directives = _cache_control(response.headers.get("cache-control", ""))
+        return ResourceFetch(
+            content=None if response.status_code == 304 else response.text,
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+            max_age_seconds=(
+                0.0
+                if "no-cache" in directives
+                else _seconds(directives.get("max-age"))
+            ),
+            stale_while_revalidate_seconds=_seconds(
+                directives.get("stale-while-revalidate")
+            ),
+            no_store="no-store" in directives,
+        )
+
     async def get_prompt(self, prompt_name: str, arguments: dict[str, Any]) -> str:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             response = await client.post(
                 f"{self.base_url}/prompts/{prompt_name}",
                 json=arguments,
+                headers=_trace_headers(),
             )
             response.raise_for_status()
             return response.text
 
     async def list_tools(self) -> list[dict[str, Any]]:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             response = await client.get(f"{self.base_url}/tools")
             response.raise_for_status()
             data = response.json()
             return data.get("tools", [])
 
     async def list_resources(self) -> list[dict[str, Any]]:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             response = await client.get(f"{self.base_url}/resources")
             response.raise_for_status()
             data = response.json()
-            return data.get("resources", [])
+            return data.get("resources", []) + data.get("resourceTemplates", [])
 
     async def list_prompts(self) -> list[dict[str, Any]]:
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
+        async with self._client() as client:
             response = await client.get(f"{self.base_url}/prompts")
             response.raise_for_status()
             data = response.json()
             return data.get("prompts", [])
+
+
+def _trace_headers() -> dict[str, str] | None:
+    traceparent = current_traceparent()
+    if traceparent is None:
+        return None
+    return {"traceparent": traceparent}
+
+
+def _cache_control(value: str) -> dict[str, str | None]:
+    directives: dict[str, str | None] = {}
+    for part in value.split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+def _seconds(value: str | None) -> float | None:
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+@cache
+def _ssl_context() -> ssl.SSLContext:
+    return httpx.create_ssl_context()
@@ -0,0 +1,51 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+from mcp_server.application.ports import CapabilitySnapshot, CapabilitySnapshotPort
+
+WATCH_MAX_BATCH_MS = 5000
+
+
+class JsonCapabilitySnapshot(CapabilitySnapshotPort):
+    def __init__(self, path: str, debounce_ms: int = 300) -> None:
+        self.path = Path(path).expanduser()
+        self.debounce_ms = debounce_ms
+        self._loaded: str | None = None
+
+    async def load(self) -> CapabilitySnapshot:
+        content = await asyncio.to_thread(self._read)
+        self._loaded = content
+        if content is None:
+            return {}
+        return json.loads(content).get("backends", {})
+
+    async def save(self, snapshot: CapabilitySnapshot) -> None:
+        await asyncio.to_thread(self._write, json.dumps({"backends": snapshot}))
+
+    async def watch_changes(self) -> AsyncIterator[CapabilitySnapshot]:
+        from watchfiles import awatch
+
+        async for _ in awatch(
+            self.path.parent,
+            watch_filter=lambda _, path: Path(path).name == self.path.name,
+            debounce=max(WATCH_MAX_BATCH_MS, self.debounce_ms),
+            step=self.debounce_ms,
+            recursive=False,
+        ):
+            if await asyncio.to_thread(self._read) == self._loaded:
+                continue
+            yield await self.load()
+
+    def _read(self) -> str | None:
+        try:
+            return self.path.read_text()
+        except FileNotFoundError:
+            return None
+
+    def _write(self, content: str) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(".tmp")
+        temp_path.write_text(content)
+        temp_path.replace(self.path)
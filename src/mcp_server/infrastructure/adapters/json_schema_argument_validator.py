@@ -0,0 +1,83 @@
+import hashlib
+import json
+import logging
+from typing import Any
+
+from jsonschema import validators
+from jsonschema.exceptions import SchemaError
+from jsonschema.protocols import Validator
+
+from mcp_server.application.ports import ArgumentValidatorPort
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.exceptions import InvalidToolArgumentsError
+
+logger = logging.getLogger(__name__)
+
+
+def _schema_hash(schema: dict[str, Any]) -> str:
+    payload = json.dumps(schema, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class JsonSchemaArgumentValidator(ArgumentValidatorPort):
+    def __init__(self) -> None:
+        self._validators: dict[str, Validator] = {}
+        self._schema_hashes: dict[str, dict[str, str]] = {}
+        self.compiled_count = 0
+
+    def update_backend(self, backend: Backend) -> None:
+        current: dict[str, str] = {}
+
+        for tool_info in backend.tools:
+            name = tool_info.get("name")
+            schema = tool_info.get("inputSchema")
+            if not name or not isinstance(schema, dict):
+                continue
+
+            schema_hash = _schema_hash(schema)
+            if schema_hash not in self._validators:
+                validator = self._compile(name, schema)
+                if validator is None:
+                    continue
+                self._validators[schema_hash] = validator
+            current[name] = schema_hash
+
+        self._schema_hashes[backend.name] = current
+        self._evict_unused()
+
+    def remove_backend(self, backend_name: str) -> None:
+        self._schema_hashes.pop(backend_name, None)
+        self._evict_unused()
+
+    def validate(
+        self, backend_name: str, tool_name: str, arguments: dict[str, Any]
+    ) -> None:
+        schema_hash = self._schema_hashes.get(backend_name, {}).get(tool_name)
+        if schema_hash is None:
+            return
+
+        validator = self._validators[schema_hash]
+        if validator.is_valid(arguments):
+            return
+
+        errors = [
+            f"{error.json_path}: {error.message}"
+            for error in sorted(validator.iter_errors(arguments), key=str)
+        ]
+        raise InvalidToolArgumentsError(tool_name, errors)
+
+    def _compile(self, tool_name: str, schema: dict[str, Any]) -> Validator | None:
+        validator_class = validators.validator_for(schema)
+        try:
+            validator_class.check_schema(schema)
+        except SchemaError as e:
+            logger.warning(f"Skipping argument validation for {tool_name}: {e.message}")
+            return None
+
+        self.compiled_count += 1
+        return validator_class(schema)
+
+    def _evict_unused(self) -> None:
+        in_use = {h for tools in self._schema_hashes.values() for h in tools.values()}
+        for schema_hash in self._validators.keys() - in_use:
+            del self._validators[schema_hash]
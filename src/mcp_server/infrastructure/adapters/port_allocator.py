@@ -1,33 +1,82 @@
 import socket
+from collections import deque
 
 from mcp_server.application.ports import PortAllocatorPort
 from mcp_server.domain.exceptions import ProcessManagementError
 
 
 class PortAllocator(PortAllocatorPort):
-    def __init__(self, start_port: int = 8100, end_port: int = 8200) -> None:
+    def __init__(
+        self,
+        start_port: int = 8100,
+        end_port: int = 8200,
+        host: str = "127.0.0.1",
+    ) -> None:
         self.start_port = start_port
         self.end_port = end_port
-        self._allocated: set[int] = set()
+        self.host = host
+        ports = range(start_port, end_port) if start_port else ()
+        self._free: deque[int] = deque(ports)
+        self._reserved: dict[int, socket.socket | None] = {}
+
+    @property
+    def uses_ephemeral_ports(self) -> bool:
+        return not self.start_port
 
     async def allocate_port(self) -> int:
-        for port in range(self.start_port, self.end_port):
-            if port in self._allocated:
-                continue
+        if self.uses_ephemeral_ports:
+            return self._reserve(self._bind(0))
 
-            if self._is_port_available(port):
-                self._allocated.add(port)
-                return port
+        for _ in range(len(self._free)):
+            port = self._free.popleft()
+            try:
+                return self._reserve(self._bind(port))
+            except OSError:
+                self._free.append(port)
 
         raise ProcessManagementError("No available ports in range")
 
     async def release_port(self, port: int) -> None:
-        self._allocated.discard(port)
+        if port not in self._reserved:
+            return
+
+        sock = self._reserved.pop(port)
+        if sock:
+            sock.close()
+        if self.start_port <= port < self.end_port:
+            self._free.append(port)
+
+    def listen_fd(self, port: int) -> int | None:
+        if port not in self._reserved:
+            return None
 
-    def _is_port_available(self, port: int) -> bool:
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        sock = self._reserved[port]
+        if sock is None:
             try:
-                s.bind(("localhost", port))
-                return True
-            except OSError:
-                return False
+                sock = self._reserved[port] = self._bind(port)
+            except OSError as e:
+                raise ProcessManagementError(f"Port {port} is no longer free") from e
+        sock.setblocking(True)
+        sock.listen()
+        return sock.fileno()
+
+    def unbind_port(self, port: int) -> None:
+        sock = self._reserved.get(port)
+        if sock:
+            sock.close()
+            self._reserved[port] = None
+
+    def _reserve(self, sock: socket.socket) -> int:
+        port = sock.getsockname()[1]
+        self._reserved[port] = sock
+        return port
+
+    def _bind(self, port: int) -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        try:
+            sock.bind((self.host, port))
+        except OSError:
+            sock.close()
+            raise
+        return sock
@@ -0,0 +1,286 @@
+from bisect import bisect_left
+from collections.abc import Iterator
+
+from mcp_server.application.ports import MetricsPort
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+DISCOVERY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+LOOP_LAG_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+OVERFLOW_LABEL = "__other__"
+PREFIX = "mcp_router"
+
+
+class _Histogram:
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class _RequestSeries:
+    __slots__ = ("duration", "outcomes", "retries")
+
+    def __init__(self) -> None:
+        self.duration = _Histogram(LATENCY_BUCKETS)
+        self.outcomes: dict[str, int] = {}
+        self.retries = 0
+
+
+class _DiscoverySeries:
+    __slots__ = ("duration", "outcomes")
+
+    def __init__(self) -> None:
+        self.duration = _Histogram(DISCOVERY_BUCKETS)
+        self.outcomes: dict[str, int] = {}
+
+
+class PrometheusMetrics(MetricsPort):
+    def __init__(
+        self, max_backends: int = 128, max_tools_per_backend: int = 256
+    ) -> None:
+        self.max_backends = max_backends
+        self.max_tools_per_backend = max_tools_per_backend
+        self._requests: dict[str, dict[str, _RequestSeries]] = {}
+        self._in_flight: dict[str, int] = {}
+        self._circuit_transitions: dict[str, dict[str, int]] = {}
+        self._discoveries: dict[str, _DiscoverySeries] = {}
+        self._cache_lookups: dict[str, list[int]] = {}
+        self._process_restarts: dict[str, int] = {}
+        self._queue_waits: dict[str, dict[str, _Histogram]] = {}
+        self._queue_depths: dict[str, dict[str, int]] = {}
+        self._rate_limited: dict[str, dict[str, int]] = {}
+        self._loop_lag = _Histogram(LOOP_LAG_BUCKETS)
+        self._loop_stalls = _Histogram(LOOP_LAG_BUCKETS)
+
+    def request_started(self, backend_name: str) -> None:
+        backend = self._backend_label(self._in_flight, backend_name)
+        self._in_flight[backend] = self._in_flight.get(backend, 0) + 1
+
+    def request_finished(
+        self,
+        backend_name: str,
+        tool_name: str,
+        duration_seconds: float,
+        outcome: str,
+    ) -> None:
+        backend = self._backend_label(self._in_flight, backend_name)
+        self._in_flight[backend] = self._in_flight.get(backend, 1) - 1
+
+        series = self._request_series(backend_name, tool_name)
+        series.duration.observe(duration_seconds)
+        series.outcomes[outcome] = series.outcomes.get(outcome, 0) + 1
+
+    def record_retry(self, backend_name: str, tool_name: str) -> None:
+        self._request_series(backend_name, tool_name).retries += 1
+
+    def record_circuit_transition(self, backend_name: str, state: str) -> None:
+        backend = self._backend_label(self._circuit_transitions, backend_name)
+        states = self._circuit_transitions.setdefault(backend, {})
+        states[state] = states.get(state, 0) + 1
+
+    def record_discovery(
+        self, backend_name: str, duration_seconds: float, outcome: str
+    ) -> None:
+        backend = self._backend_label(self._discoveries, backend_name)
+        series = self._discoveries.get(backend)
+        if series is None:
+            series = self._discoveries[backend] = _DiscoverySeries()
+        series.duration.observe(duration_seconds)
+        series.outcomes[outcome] = series.outcomes.get(outcome, 0) + 1
+
+    def record_cache_lookup(self, cache_name: str, hit: bool) -> None:
+        lookups = self._cache_lookups.get(cache_name)
+        if lookups is None:
+            lookups = self._cache_lookups[cache_name] = [0, 0]
+        lookups[0 if hit else 1] += 1
+
+    def record_process_restart(self, backend_name: str) -> None:
+        backend = self._backend_label(self._process_restarts, backend_name)
+        self._process_restarts[backend] = self._process_restarts.get(backend, 0) + 1
+
+    def record_queue_wait(
+        self, backend_name: str, priority_class: str, wait_seconds: float
+    ) -> None:
+        backend = self._backend_label(self._queue_waits, backend_name)
+        classes = self._queue_waits.setdefault(backend, {})
+        histogram = classes.get(priority_class)
+        if histogram is None:
+            histogram = classes[priority_class] = _Histogram(LATENCY_BUCKETS)
+        histogram.observe(wait_seconds)
+
+    def set_queue_depth(
+        self, backend_name: str, priority_class: str, depth: int
+    ) -> None:
+        backend = self._backend_label(self._queue_depths, backend_name)
+        self._queue_depths.setdefault(backend, {})[priority_class] = depth
+
+    def record_rate_limited(self, backend_name: str, scope: str) -> None:
+        backend = self._backend_label(self._rate_limited, backend_name)
+        scopes = self._rate_limited.setdefault(backend, {})
+        scopes[scope] = scopes.get(scope, 0) + 1
+
+    def record_loop_lag(self, lag_seconds: float) -> None:
+        self._loop_lag.observe(lag_seconds)
+
+    def record_loop_stall(self, duration_seconds: float) -> None:
+        self._loop_stalls.observe(duration_seconds)
+
+    def render(self) -> str:
+        return "\n".join(self._render_lines()) + "\n"
+
+    def _request_series(self, backend_name: str, tool_name: str) -> _RequestSeries:
+        tools = self._requests.get(backend_name)
+        if tools is None:
+            backend = self._backend_label(self._requests, backend_name)
+            tools = self._requests.setdefault(backend, {})
+        series = tools.get(tool_name)
+        if series is None:
+            if len(tools) >= self.max_tools_per_backend:
+                tool_name = OVERFLOW_LABEL
+            series = tools.setdefault(tool_name, _RequestSeries())
+        return series
+
+    def _backend_label(self, series: dict, backend_name: str) -> str:
+        if backend_name in series or len(series) < self.max_backends:
+            return backend_name
+        return OVERFLOW_LABEL
+
+    def _render_lines(self) -> Iterator[str]:
+        yield f"# HELP {PREFIX}_requests_total Proxied tool calls by outcome."
+        yield f"# TYPE {PREFIX}_requests_total counter"
+        for backend, tool, series in self._iter_requests():
+            for outcome, value in series.outcomes.items():
+                labels = _labels(backend=backend, tool=tool, outcome=outcome)
+                yield f"{PREFIX}_requests_total{labels} {value}"
+
+        yield f"# HELP {PREFIX}_request_duration_seconds Proxied tool call latency."
+        yield f"# TYPE {PREFIX}_request_duration_seconds histogram"
+        for backend, tool, series in self._iter_requests():
+            yield from _histogram_lines(
+                f"{PREFIX}_request_duration_seconds",
+                series.duration,
+                backend=backend,
+                tool=tool,
+            )
+
+        yield f"# HELP {PREFIX}_requests_in_flight Proxied tool calls in progress."
+        yield f"# TYPE {PREFIX}_requests_in_flight gauge"
+        for backend, value in self._in_flight.items():
+            yield f"{PREFIX}_requests_in_flight{_labels(backend=backend)} {value}"
+
+        yield f"# HELP {PREFIX}_retries_total Retried backend calls."
+        yield f"# TYPE {PREFIX}_retries_total counter"
+        for backend, tool, series in self._iter_requests():
+            if series.retries:
+                labels = _labels(backend=backend, tool=tool)
+                yield f"{PREFIX}_retries_total{labels} {series.retries}"
+
+        yield f"# HELP {PREFIX}_circuit_transitions_total Circuit breaker transitions."
+        yield f"# TYPE {PREFIX}_circuit_transitions_total counter"
+        for backend, states in self._circuit_transitions.items():
+            for state, value in states.items():
+                labels = _labels(backend=backend, state=state)
+                yield f"{PREFIX}_circuit_transitions_total{labels} {value}"
+
+        yield f"# HELP {PREFIX}_discovery_duration_seconds Capability discovery time."
+        yield f"# TYPE {PREFIX}_discovery_duration_seconds histogram"
+        for backend, series in self._discoveries.items():
+            yield from _histogram_lines(
+                f"{PREFIX}_discovery_duration_seconds",
+                series.duration,
+                backend=backend,
+            )
+
+        yield f"# HELP {PREFIX}_discoveries_total Capability discoveries by outcome."
+        yield f"# TYPE {PREFIX}_discoveries_total counter"
+        for backend, series in self._discoveries.items():
+            for outcome, value in series.outcomes.items():
+                labels = _labels(backend=backend, outcome=outcome)
+                yield f"{PREFIX}_discoveries_total{labels} {value}"
+
+        yield f"# HELP {PREFIX}_cache_lookups_total Cache lookups by result."
+        yield f"# TYPE {PREFIX}_cache_lookups_total counter"
+        for cache, (hits, misses) in self._cache_lookups.items():
+            for result, value in (("hit", hits), ("miss", misses)):
+                labels = _labels(cache=cache, result=result)
+                yield f"{PREFIX}_cache_lookups_total{labels} {value}"
+
+        yield f"# HELP {PREFIX}_cache_hit_ratio Share of cache lookups that hit."
+        yield f"# TYPE {PREFIX}_cache_hit_ratio gauge"
+        for cache, (hits, misses) in self._cache_lookups.items():
+            ratio = hits / (hits + misses) if hits + misses else 0.0
+            yield f"{PREFIX}_cache_hit_ratio{_labels(cache=cache)} {ratio}"
+
+        yield f"# HELP {PREFIX}_process_restarts_total Managed backend restarts."
+        yield f"# TYPE {PREFIX}_process_restarts_total counter"
+        for backend, value in self._process_restarts.items():
+            yield f"{PREFIX}_process_restarts_total{_labels(backend=backend)} {value}"
+
+        yield f"# HELP {PREFIX}_queue_wait_seconds Time calls waited for a slot."
+        yield f"# TYPE {PREFIX}_queue_wait_seconds histogram"
+        for backend, classes in self._queue_waits.items():
+            for priority_class, histogram in classes.items():
+                yield from _histogram_lines(
+                    f"{PREFIX}_queue_wait_seconds",
+                    histogram,
+                    backend=backend,
+                    priority_class=priority_class,
+                )
+
+        yield f"# HELP {PREFIX}_queue_depth Calls waiting for a backend slot."
+        yield f"# TYPE {PREFIX}_queue_depth gauge"
+        for backend, depths in self._queue_depths.items():
+            for priority_class, depth in depths.items():
+                labels = _labels(backend=backend, priority_class=priority_class)
+                yield f"{PREFIX}_queue_depth{labels} {depth}"
+
+        yield f"# HELP {PREFIX}_rate_limited_total Calls rejected by rate limits."
+        yield f"# TYPE {PREFIX}_rate_limited_total counter"
+        for backend, scopes in self._rate_limited.items():
+            for scope, value in scopes.items():
+                labels = _labels(backend=backend, scope=scope)
+                yield f"{PREFIX}_rate_limited_total{labels} {value}"
+
+        yield f"# HELP {PREFIX}_event_loop_lag_seconds Event loop scheduling delay."
+        yield f"# TYPE {PREFIX}_event_loop_lag_seconds histogram"
+        yield from _histogram_lines(f"{PREFIX}_event_loop_lag_seconds", self._loop_lag)
+
+        yield f"# HELP {PREFIX}_event_loop_stall_seconds Steps over the slow threshold."
+        yield f"# TYPE {PREFIX}_event_loop_stall_seconds histogram"
+        yield from _histogram_lines(
+            f"{PREFIX}_event_loop_stall_seconds", self._loop_stalls
+        )
+
+    def _iter_requests(self) -> Iterator[tuple[str, str, _RequestSeries]]:
+        for backend, tools in self._requests.items():
+            for tool, series in tools.items():
+                yield backend, tool, series
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _histogram_lines(name: str, histogram: _Histogram, **labels: str) -> Iterator[str]:
+    cumulative = 0
+    for bound, count in zip(histogram.bounds, histogram.counts, strict=False):
+        cumulative += count
+        yield f"{name}_bucket{_labels(**labels, le=str(bound))} {cumulative}"
+    yield f"{name}_bucket{_labels(**labels, le='+Inf')} {histogram.count}"
+    yield f"{name}_sum{_labels(**labels)} {histogram.total}"
+    yield f"{name}_count{_labels(**labels)} {histogram.count}"
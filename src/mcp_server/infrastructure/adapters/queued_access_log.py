@@ -0,0 +1,127 @@
+import asyncio
+import json
+import logging
+import queue
+import random
+import sys
+import threading
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, TextIO
+
+from mcp_server.application.dtos import AccessLogEntry
+from mcp_server.application.ports import AccessLogPort
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class QueuedAccessLog(AccessLogPort):
+    def __init__(
+        self,
+        path: str,
+        sample_rate: float = 1.0,
+        slow_threshold_seconds: float = 1.0,
+        max_queue: int = 10000,
+    ) -> None:
+        self.path = path
+        self.sample_rate = sample_rate
+        self.slow_threshold_seconds = slow_threshold_seconds
+        self.written = 0
+        self.dropped = 0
+        self.sampled_out = 0
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_queue)
+        self._writer = threading.Thread(
+            target=self._run, name="mcp-access-log", daemon=True
+        )
+        self._writer.start()
+
+    def record(self, entry: AccessLogEntry) -> None:
+        if not self._should_keep(entry):
+            self.sampled_out += 1
+            return
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self.dropped += 1
+
+    async def close(self) -> None:
+        if not self._writer.is_alive():
+            return
+        await asyncio.to_thread(self._queue.put, _STOP)
+        await asyncio.to_thread(self._writer.join)
+
+    def _should_keep(self, entry: AccessLogEntry) -> bool:
+        if entry.outcome != "success":
+            return True
+        if entry.latency_seconds >= self.slow_threshold_seconds:
+            return True
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    def _run(self) -> None:
+        stream = self._open()
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+                lines = [format_entry(item)]
+                stopping = False
+                while not self._queue.empty():
+                    item = self._queue.get_nowait()
+                    if item is _STOP:
+                        stopping = True
+                        break
+                    lines.append(format_entry(item))
+                self._write(stream, lines)
+                if stopping:
+                    break
+        finally:
+            if stream is not sys.stderr:
+                stream.close()
+
+    def _open(self) -> TextIO:
+        if self.path == "-":
+            return sys.stderr
+        path = Path(self.path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path.open("a", encoding="utf-8")
+
+    def _write(self, stream: TextIO, lines: list[str]) -> None:
+        try:
+            stream.write("".join(lines))
+            stream.flush()
+            self.written += len(lines)
+        except OSError as e:
+            self.dropped += len(lines)
+            logger.warning("Failed to write access log: %s", e)
+
+
+def format_entry(entry: AccessLogEntry) -> str:
+    record = {
+        "timestamp": datetime.fromtimestamp(entry.timestamp, UTC).isoformat(
+            timespec="milliseconds"
+        ),
+        "tool": entry.tool_name,
+        "backend": entry.backend_name,
+        "strategy": entry.strategy,
+        "attempts": entry.attempts,
+        "latency_ms": round(entry.latency_seconds * 1000, 3),
+        "request_bytes": _size(entry.arguments),
+        "response_bytes": _size(entry.result) if entry.outcome == "success" else 0,
+        "outcome": entry.outcome,
+    }
+    if entry.error:
+        record["error"] = entry.error
+    return json.dumps(record, separators=(",", ":")) + "\n"
+
+
+def _size(value: Any) -> int:
+    if value is None:
+        return 0
+    if isinstance(value, bytes):
+        return len(value)
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    return len(json.dumps(value, default=str, separators=(",", ":")))
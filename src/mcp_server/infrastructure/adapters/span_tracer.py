@@ -0,0 +1,144 @@
+import logging
+import random
+import secrets
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from mcp_server.application.ports import TracerPort
+from mcp_server.infrastructure.adapters.span_exporters import SpanExporter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    name: str
+    attributes: dict[str, Any]
+    start_ns: int = 0
+    end_ns: int = 0
+    error: str | None = None
+    _tracer: "SpanTracer | None" = field(default=None, repr=False, compare=False)
+    _token: Any = field(default=None, repr=False, compare=False)
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    @property
+    def duration_seconds(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e9
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+    def __enter__(self) -> "Span":
+        self._token = _current_span.set(self)
+        self.start_ns = time.time_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
+        self.end_ns = time.time_ns()
+        _current_span.reset(self._token)
+        if exc is not None:
+            self.error = f"{type(exc).__name__}: {exc}"
+        if self._tracer:
+            self._tracer._finish(self)
+        return False
+
+
+class _UnsampledSpan:
+    def __init__(self) -> None:
+        self._token: Any = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_UnsampledSpan":
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
+        _current_span.reset(self._token)
+        return False
+
+
+_current_span: ContextVar["Span | _UnsampledSpan | None"] = ContextVar(
+    "mcp_current_span", default=None
+)
+
+
+def current_traceparent() -> str | None:
+    span = _current_span.get()
+    if isinstance(span, Span):
+        return span.traceparent
+    return None
+
+
+class SpanTracer(TracerPort):
+    def __init__(
+        self,
+        exporter: SpanExporter,
+        sample_rate: float = 1.0,
+        max_pending: int = 10_000,
+    ) -> None:
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+        self.max_pending = max_pending
+        self.dropped = 0
+        self._pending: list[Span] = []
+
+    def span(self, name: str, **attributes: Any) -> Span | _UnsampledSpan:
+        parent = _current_span.get()
+        if parent is None:
+            if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+                return _UnsampledSpan()
+            return Span(
+                trace_id=secrets.token_hex(16),
+                span_id=secrets.token_hex(8),
+                parent_id=None,
+                name=name,
+                attributes=attributes,
+                _tracer=self,
+            )
+        if isinstance(parent, _UnsampledSpan):
+            return _UnsampledSpan()
+        return Span(
+            trace_id=parent.trace_id,
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id,
+            name=name,
+            attributes=attributes,
+            _tracer=self,
+        )
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        spans, self._pending = self._pending, []
+        try:
+            await self.exporter.export(spans)
+        except Exception as e:
+            logger.warning(f"Failed to export {len(spans)} spans: {e}")
+
+    def _finish(self, span: Span) -> None:
+        if len(self._pending) >= self.max_pending:
+            self.dropped += 1
+            return
+        self._pending.append(span)
@@ -0,0 +1,72 @@
+import asyncio
+import logging
+import os
+import time
+import uuid
+
+from mcp_server.application.ports import LeaderLeasePort
+from mcp_server.infrastructure.repositories.sqlite_backend_repository import (
+    immediate_transaction,
+    open_state_db,
+)
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS leases (
+    name TEXT PRIMARY KEY,
+    holder TEXT NOT NULL,
+    expires_at REAL NOT NULL
+)
+"""
+
+
+class SqliteLeaderLease(LeaderLeasePort):
+    def __init__(
+        self, path: str, ttl_seconds: float = 15.0, name: str = "health"
+    ) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.name = name
+        self.holder = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._connection = open_state_db(path)
+        self._connection.execute(SCHEMA)
+        self._expires_at = 0.0
+
+    @property
+    def is_leader(self) -> bool:
+        return time.time() < self._expires_at
+
+    async def renew(self) -> bool:
+        was_leader = self.is_leader
+        self._expires_at = await asyncio.to_thread(self._claim)
+        if self.is_leader != was_leader:
+            logger.info(
+                f"{'Acquired' if self.is_leader else 'Lost'} {self.name} lease "
+                f"({self.holder})"
+            )
+        return self.is_leader
+
+    def _claim(self) -> float:
+        now = time.time()
+        with immediate_transaction(self._connection):
+            row = self._connection.execute(
+                "SELECT holder, expires_at FROM leases WHERE name = ?", (self.name,)
+            ).fetchone()
+            if row and row[0] != self.holder and row[1] > now:
+                return 0.0
+            expires_at = now + self.ttl_seconds
+            self._connection.execute(
+                "INSERT OR REPLACE INTO leases (name, holder, expires_at) "
+                "VALUES (?, ?, ?)",
+                (self.name, self.holder, expires_at),
+            )
+        return expires_at
+
+    def release(self) -> None:
+        self._connection.execute(
+            "DELETE FROM leases WHERE name = ? AND holder = ?",
+            (self.name, self.holder),
+        )
+        self._expires_at = 0.0
+        self._connection.close()
@@ -0,0 +1,177 @@
+import asyncio
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from pathlib import Path
+
+from mcp_server.application.dtos import CachedResource
+from mcp_server.application.ports import ResourceCachePort
+
+logger = logging.getLogger(__name__)
+
+ENTRY_SUFFIX = ".entry"
+
+CacheKey = tuple[str, str]
+
+
+class TieredResourceCache(ResourceCachePort):
+    def __init__(
+        self,
+        max_bytes: int = 32 * 1024 * 1024,
+        disk_dir: str = "",
+        disk_max_bytes: int = 256 * 1024 * 1024,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir).expanduser() if disk_dir else None
+        self.disk_max_bytes = disk_max_bytes
+        self.memory_bytes = 0
+        self.disk_bytes = 0
+        self._memory: OrderedDict[CacheKey, tuple[CachedResource, int]] = OrderedDict()
+        self._disk: OrderedDict[CacheKey, int] = OrderedDict()
+        self._generations: dict[CacheKey, int] = {}
+        if self.disk_dir:
+            self._load_disk_index()
+
+    @property
+    def entry_count(self) -> int:
+        return len(self._memory.keys() | self._disk.keys())
+
+    async def get(self, backend_name: str, uri: str) -> CachedResource | None:
+        key = (backend_name, uri)
+        cached = self._memory.get(key)
+        if cached:
+            self._memory.move_to_end(key)
+            return cached[0]
+        if key not in self._disk:
+            return None
+
+        entry = await asyncio.to_thread(self._read_entry, key)
+        if entry is None:
+            self._forget_disk(key)
+            return None
+        if key in self._disk:
+            self._disk.move_to_end(key)
+        self._remember(key, entry)
+        return entry
+
+    async def put(self, backend_name: str, uri: str, entry: CachedResource) -> None:
+        key = (backend_name, uri)
+        self._remember(key, entry)
+        if not self.disk_dir:
+            return
+
+        generation = self._generations.get(key, 0)
+        size = await asyncio.to_thread(self._write_entry, key, entry)
+        if self._generations.get(key, 0) != generation:
+            await asyncio.to_thread(self._unlink, key)
+            return
+
+        self._forget_disk(key)
+        self._disk[key] = size
+        self.disk_bytes += size
+        evicted = []
+        while self.disk_bytes > self.disk_max_bytes and self._disk:
+            old_key, old_size = self._disk.popitem(last=False)
+            self.disk_bytes -= old_size
+            evicted.append(old_key)
+        for old_key in evicted:
+            await asyncio.to_thread(self._unlink, old_key)
+
+    async def invalidate(
+        self, backend_name: str | None = None, uri: str | None = None
+    ) -> int:
+        keys = [
+            key
+            for key in self._memory.keys() | self._disk.keys()
+            if (backend_name is None or key[0] == backend_name)
+            and (uri is None or key[1] == uri)
+        ]
+        for key in keys:
+            cached = self._memory.pop(key, None)
+            if cached:
+                self.memory_bytes -= cached[1]
+            self._generations[key] = self._generations.get(key, 0) + 1
+            if key in self._disk:
+                self._forget_disk(key)
+                await asyncio.to_thread(self._unlink, key)
+        return len(keys)
+
+    def _remember(self, key: CacheKey, entry: CachedResource) -> None:
+        previous = self._memory.pop(key, None)
+        if previous:
+            self.memory_bytes -= previous[1]
+
+        size = entry.size
+        if size > self.max_bytes:
+            return
+        self._memory[key] = (entry, size)
+        self.memory_bytes += size
+        while self.memory_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._memory.popitem(last=False)
+            self.memory_bytes -= evicted_size
+
+    def _forget_disk(self, key: CacheKey) -> None:
+        size = self._disk.pop(key, None)
+        if size is not None:
+            self.disk_bytes -= size
+
+    def _path(self, key: CacheKey) -> Path:
+        assert self.disk_dir is not None
+        digest = hashlib.sha256("\0".join(key).encode()).hexdigest()
+        return self.disk_dir / f"{digest}{ENTRY_SUFFIX}"
+
+    def _write_entry(self, key: CacheKey, entry: CachedResource) -> int:
+        header = {
+            "backend": key[0],
+            "uri": key[1],
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "fresh_until": entry.fresh_until,
+            "stale_until": entry.stale_until,
+        }
+        data = (json.dumps(header) + "\n" + entry.content).encode()
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_suffix(".tmp")
+        temp_path.write_bytes(data)
+        temp_path.replace(path)
+        return len(data)
+
+    def _read_entry(self, key: CacheKey) -> CachedResource | None:
+        try:
+            data = self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+        header_line, _, content = data.partition(b"\n")
+        header = json.loads(header_line)
+        return CachedResource(
+            content=content.decode(),
+            etag=header["etag"],
+            last_modified=header["last_modified"],
+            fresh_until=header["fresh_until"],
+            stale_until=header["stale_until"],
+        )
+
+    def _unlink(self, key: CacheKey) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def _load_disk_index(self) -> None:
+        assert self.disk_dir is not None
+        self.disk_dir.mkdir(parents=True, exist_ok=True)
+        paths = sorted(
+            self.disk_dir.glob(f"*{ENTRY_SUFFIX}"), key=lambda p: p.stat().st_mtime
+        )
+        for path in paths:
+            try:
+                with path.open("rb") as f:
+                    header = json.loads(f.readline())
+                key = (header["backend"], header["uri"])
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Dropping unreadable resource cache entry {path}: {e}")
+                path.unlink(missing_ok=True)
+                continue
+            size = path.stat().st_size
+            self._disk[key] = size
+            self.disk_bytes += size
+        logger.info(f"Loaded {len(self._disk)} resource cache entries from disk")
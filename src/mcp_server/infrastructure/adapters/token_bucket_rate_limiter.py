@@ -0,0 +1,85 @@
+import time
+from collections import OrderedDict
+
+from mcp_server.application.ports import MetricsPort, RateLimiterPort
+from mcp_server.domain.exceptions import RateLimitExceededError
+from mcp_server.domain.value_objects import RateLimitRule
+
+BucketKey = tuple[str, RateLimitRule, str]
+
+
+class _Bucket:
+    __slots__ = ("tokens", "updated")
+
+    def __init__(self, tokens: float, updated: float) -> None:
+        self.tokens = tokens
+        self.updated = updated
+
+    def refill(self, rule: RateLimitRule, now: float) -> None:
+        elapsed = max(now - self.updated, 0.0)
+        self.tokens = min(rule.burst, self.tokens + elapsed * rule.rate_per_second)
+        self.updated = now
+
+
+class TokenBucketRateLimiter(RateLimiterPort):
+    def __init__(
+        self, metrics: MetricsPort | None = None, max_keys: int = 100_000
+    ) -> None:
+        self.metrics = metrics
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[BucketKey, _Bucket] = OrderedDict()
+
+    @property
+    def bucket_count(self) -> int:
+        return len(self._buckets)
+
+    def acquire(
+        self,
+        backend_name: str,
+        rules: tuple[RateLimitRule, ...],
+        tool_name: str,
+        client_id: str | None,
+    ) -> None:
+        if not rules:
+            return
+        now = time.monotonic()
+        buckets = []
+        for rule in rules:
+            subject = rule.subject(tool_name, client_id)
+            if subject is not None:
+                buckets.append((rule, self._bucket((backend_name, rule, subject), now)))
+
+        exhausted = [(rule, bucket) for rule, bucket in buckets if bucket.tokens < 1]
+        if exhausted:
+            rule, retry_after = max(
+                ((r, (1 - b.tokens) / r.rate_per_second) for r, b in exhausted),
+                key=lambda item: item[1],
+            )
+            if self.metrics:
+                self.metrics.record_rate_limited(backend_name, rule.scope)
+            raise RateLimitExceededError(backend_name, rule.scope, retry_after)
+
+        for _, bucket in buckets:
+            bucket.tokens -= 1
+        self._evict(now)
+
+    def _bucket(self, key: BucketKey, now: float) -> _Bucket:
+        rule = key[1]
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(rule.burst, now)
+        else:
+            bucket.refill(rule, now)
+            self._buckets.move_to_end(key)
+        return bucket
+
+    def _evict(self, now: float) -> None:
+        while self._buckets:
+            key, bucket = next(iter(self._buckets.items()))
+            rule = key[1]
+            idle = now - bucket.updated
+            if len(self._buckets) <= self.max_keys and idle < (
+                rule.burst / rule.rate_per_second
+            ):
+                return
+            del self._buckets[key]
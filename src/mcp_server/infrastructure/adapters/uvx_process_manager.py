@@ -1,15 +1,47 @@
 import asyncio
+import json
 import os
-import signal
+import re
+from dataclasses import dataclass, field
 
-from mcp_server.application.ports import ProcessManagerPort
+import httpx
+from mcp.types import LATEST_PROTOCOL_VERSION
+
+from mcp_server.application.ports import PortAllocatorPort, ProcessManagerPort
 from mcp_server.domain.exceptions import ProcessManagementError
 from mcp_server.domain.value_objects import ProcessConfig
 
+READY_PROBE_INITIAL_DELAY = 0.005
+READY_PROBE_MAX_DELAY = 0.25
+LISTEN_FD_ENV = "MCP_LISTEN_FD"
+MCP_ENDPOINT = "/mcp"
+READY_PROBE_ID = "mcp-router-ready"
+INITIALIZE_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": READY_PROBE_ID,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": LATEST_PROTOCOL_VERSION,
+        "capabilities": {},
+        "clientInfo": {"name": "mcp-router", "version": "0"},
+    },
+}
+INITIALIZED_NOTIFICATION = {"jsonrpc": "2.0", "method": "notifications/initialized"}
+
+
+@dataclass
+class ManagedProcess:
+    process: asyncio.subprocess.Process
+    config: ProcessConfig
+    ready_line: asyncio.Event = field(default_factory=asyncio.Event)
+    initialized: asyncio.Event = field(default_factory=asyncio.Event)
+    readers: list[asyncio.Task] = field(default_factory=list)
+
 
 class UvxProcessManager(ProcessManagerPort):
-    def __init__(self) -> None:
-        self._processes: dict[int, asyncio.subprocess.Process] = {}
+    def __init__(self, port_allocator: PortAllocatorPort | None = None) -> None:
+        self.port_allocator = port_allocator
+        self._processes: dict[int, ManagedProcess] = {}
 
     async def start_process(self, config: ProcessConfig) -> int:
         cmd = [config.command, *config.args]
@@ -17,41 +49,100 @@ class UvxProcessManager(ProcessManagerPort):
         if config.port:
             env["PORT"] = str(config.port)
 
+        listen_fd = self._listen_fd(config)
+        pass_fds: tuple[int, ...] = ()
+        if listen_fd is not None:
+            env[LISTEN_FD_ENV] = str(listen_fd)
+            pass_fds = (listen_fd,)
+
         process = await asyncio.create_subprocess_exec(
             *cmd,
             env=env,
+            stdin=None if config.port else asyncio.subprocess.PIPE,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
+            pass_fds=pass_fds,
         )
 
         if not process.pid:
             raise ProcessManagementError("Failed to start process")
 
-        self._processes[process.pid] = process
-        await asyncio.sleep(2)
+        managed = ManagedProcess(process=process, config=config)
+        pattern = re.compile(config.ready_pattern) if config.ready_pattern else None
+        for stream in (process.stdout, process.stderr):
+            if stream:
+                managed.readers.append(
+                    asyncio.create_task(self._drain_output(stream, pattern, managed))
+                )
 
+        self._processes[process.pid] = managed
         return process.pid
 
+    async def wait_until_ready(self, pid: int, timeout: float = 30.0) -> None:
+        managed = self._processes.get(pid)
+        if not managed:
+            raise ProcessManagementError(f"Unknown process: {pid}")
+
+        signals = []
+        if managed.config.ready_pattern:
+            signals.append(asyncio.create_task(managed.ready_line.wait()))
+        if managed.config.port and not managed.config.inherit_socket:
+            signals.append(asyncio.create_task(self._wait_for_port(managed.config.port)))
+        if not signals:
+            signals.append(asyncio.create_task(self._initialize(managed)))
+
+        exited = asyncio.create_task(managed.process.wait())
+        try:
+            done, _ = await asyncio.wait(
+                [*signals, exited],
+                timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            for task in (*signals, exited):
+                task.cancel()
+
+        if not done:
+            raise ProcessManagementError(f"Process {pid} not ready after {timeout}s")
+        if any(t is not exited and not t.exception() for t in done):
+            return
+        if exited not in done:
+            failed = next(iter(done))
+            try:
+                await asyncio.wait_for(managed.process.wait(), READY_PROBE_MAX_DELAY)
+            except TimeoutError:
+                raise ProcessManagementError(
+                    f"Process {pid} readiness probe failed: {failed.exception()}"
+                ) from failed.exception()
+        raise ProcessManagementError(
+            f"Process {pid} exited with code {managed.process.returncode} "
+            "before becoming ready"
+        )
+
     async def stop_process(self, pid: int) -> None:
-        process = self._processes.get(pid)
-        if not process:
+        managed = self._processes.get(pid)
+        if not managed:
             return
 
+        process = managed.process
         try:
-            process.terminate()
+            if process.returncode is None:
+                process.terminate()
             await asyncio.wait_for(process.wait(), timeout=5.0)
         except asyncio.TimeoutError:
             process.kill()
             await process.wait()
         finally:
+            for reader in managed.readers:
+                reader.cancel()
             self._processes.pop(pid, None)
 
     async def is_process_alive(self, pid: int) -> bool:
-        process = self._processes.get(pid)
-        if not process:
+        managed = self._processes.get(pid)
+        if not managed:
             return False
 
-        return process.returncode is None
+        return managed.process.returncode is None
 
     async def restart_process(self, pid: int, config: ProcessConfig) -> int:
         await self.stop_process(pid)
@@ -60,3 +151,87 @@ class UvxProcessManager(ProcessManagerPort):
     async def shutdown_all(self) -> None:
         for pid in list(self._processes.keys()):
             await self.stop_process(pid)
+
+    def _listen_fd(self, config: ProcessConfig) -> int | None:
+        if not self.port_allocator or not config.port:
+            return None
+        if not config.inherit_socket:
+            self.port_allocator.unbind_port(config.port)
+            return None
+        return self.port_allocator.listen_fd(config.port)
+
+    async def _drain_output(
+        self,
+        stream: asyncio.StreamReader,
+        pattern: re.Pattern[str] | None,
+        managed: ManagedProcess,
+    ) -> None:
+        while True:
+            try:
+                line = await stream.readline()
+            except ValueError:
+                continue
+            if not line:
+                return
+            if pattern and not managed.ready_line.is_set():
+                if pattern.search(line.decode(errors="replace")):
+                    managed.ready_line.set()
+            if not managed.initialized.is_set() and _is_initialize_result(line):
+                managed.initialized.set()
+
+    async def _initialize(self, managed: ManagedProcess) -> None:
+        if managed.config.port:
+            await self._initialize_over_http(managed.config.port)
+            return
+
+        stdin = managed.process.stdin
+        if not stdin:
+            raise ProcessManagementError("Process has no stdin to initialize over")
+        stdin.write(json.dumps(INITIALIZE_REQUEST).encode() + b"\n")
+        await stdin.drain()
+        await managed.initialized.wait()
+        stdin.write(json.dumps(INITIALIZED_NOTIFICATION).encode() + b"\n")
+        await stdin.drain()
+
+    async def _initialize_over_http(self, port: int) -> None:
+        delay = READY_PROBE_INITIAL_DELAY
+        async with httpx.AsyncClient(timeout=READY_PROBE_MAX_DELAY * 4) as client:
+            while True:
+                try:
+                    response = await client.post(
+                        f"http://127.0.0.1:{port}{MCP_ENDPOINT}",
+                        json=INITIALIZE_REQUEST,
+                        headers={"Accept": "application/json, text/event-stream"},
+                    )
+                    if response.is_success:
+                        return
+                except httpx.HTTPError:
+                    pass
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, READY_PROBE_MAX_DELAY)
+
+    async def _wait_for_port(self, port: int) -> None:
+        delay = READY_PROBE_INITIAL_DELAY
+        while True:
+            try:
+                _, writer = await asyncio.open_connection("127.0.0.1", port)
+            except OSError:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, READY_PROBE_MAX_DELAY)
+                continue
+            writer.close()
+            return
+
+
+def _is_initialize_result(line: bytes) -> bool:
+    if not line.startswith(b"{"):
+        return False
+    try:
+        message = json.loads(line)
+    except ValueError:
+        return False
+    return (
+        isinstance(message, dict)
+        and message.get("id") == READY_PROBE_ID
+        and "result" in message
+    )
@@ -0,0 +1,106 @@
+import asyncio
+import logging
+from collections import deque
+
+from mcp_server.application.dtos import WarmProcess
+from mcp_server.application.ports import (
+    PortAllocatorPort,
+    ProcessManagerPort,
+    ProcessPoolPort,
+)
+from mcp_server.domain.value_objects import ProcessConfig
+
+logger = logging.getLogger(__name__)
+
+PoolKey = tuple[str, tuple[str, ...], tuple[tuple[str, str], ...]]
+
+
+def _pool_key(config: ProcessConfig) -> PoolKey:
+    env = tuple(sorted((k, v) for k, v in config.env.items() if k != "PORT"))
+    return (config.command, config.args, env)
+
+
+class WarmProcessPool(ProcessPoolPort):
+    def __init__(
+        self,
+        process_manager: ProcessManagerPort,
+        port_allocator: PortAllocatorPort,
+        size: int = 1,
+        readiness_timeout: float = 30.0,
+    ) -> None:
+        self.process_manager = process_manager
+        self.port_allocator = port_allocator
+        self.size = size
+        self.readiness_timeout = readiness_timeout
+        self._spares: dict[PoolKey, deque[WarmProcess]] = {}
+        self._pending: dict[PoolKey, int] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def acquire(self, config: ProcessConfig) -> WarmProcess | None:
+        key = _pool_key(config)
+        spares = self._spares.get(key)
+        if spares is None:
+            return None
+
+        while spares:
+            spare = spares.popleft()
+            if await self.process_manager.is_process_alive(spare.pid):
+                self._refill(key, config)
+                return spare
+            await self.process_manager.stop_process(spare.pid)
+            await self.port_allocator.release_port(spare.port)
+
+        self._refill(key, config)
+        return None
+
+    async def prewarm(self, config: ProcessConfig) -> None:
+        key = _pool_key(config)
+        self._spares.setdefault(key, deque())
+        self._refill(key, config)
+
+    async def shutdown(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+        for spares in self._spares.values():
+            for spare in spares:
+                await self.process_manager.stop_process(spare.pid)
+                await self.port_allocator.release_port(spare.port)
+        self._spares.clear()
+
+    def spare_count(self, config: ProcessConfig) -> int:
+        return len(self._spares.get(_pool_key(config), ()))
+
+    def _refill(self, key: PoolKey, config: ProcessConfig) -> None:
+        pending = self._pending.get(key, 0)
+        missing = self.size - len(self._spares[key]) - pending
+        if missing <= 0:
+            return
+
+        self._pending[key] = pending + missing
+        for _ in range(missing):
+            task = asyncio.create_task(self._spawn_spare(key, config))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _spawn_spare(self, key: PoolKey, config: ProcessConfig) -> None:
+        port: int | None = None
+        pid: int | None = None
+        warmed = False
+        try:
+            port = await self.port_allocator.allocate_port()
+            pid = await self.process_manager.start_process(config.with_port(port))
+            await self.process_manager.wait_until_ready(pid, self.readiness_timeout)
+            self._spares[key].append(WarmProcess(pid=pid, port=port))
+            warmed = True
+            logger.debug(f"Warmed spare process {pid} for {config.args} on {port}")
+        except Exception as e:
+            logger.warning(f"Failed to warm spare process for {config.args}: {e}")
+        finally:
+            self._pending[key] -= 1
+            if not warmed:
+                if pid is not None:
+                    await self.process_manager.stop_process(pid)
+                if port is not None:
+                    await self.port_allocator.release_port(port)
@@ -1,3 +1,19 @@
-from mcp_server.infrastructure.config.yaml_config_loader import load_backend_configs
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from mcp_server.infrastructure.config.yaml_config_loader import load_backend_configs
+
+_EXPORTS = {
+    "load_backend_configs": "yaml_config_loader",
+}
 
 __all__ = ["load_backend_configs"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    globals()[name] = value
+    return value
@@ -1,9 +1,8 @@
+import asyncio
+import hashlib
 from collections.abc import AsyncIterator
 from pathlib import Path
 
-import yaml
-from watchfiles import awatch
-
 from mcp_server.domain.exceptions import ConfigurationWatchError, InvalidConfigurationError
 from mcp_server.domain.repositories import ConfigRepository
 from mcp_server.domain.services.namespace_generator import NamespaceGenerator
@@ -14,14 +13,27 @@ from mcp_server.domain.value_objects import (
     CircuitBreakerSettings,
     GitHubSpec,
     HealthCheckSettings,
+    PriorityClass,
     ProcessConfig,
+    RateLimitRule,
+    ResourceCacheRule,
     RoutePattern,
+    SchedulingSettings,
 )
 
+WATCH_MAX_BATCH_MS = 5000
+
+
+def _content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
 
 class YamlBackendConfigRepository(ConfigRepository):
-    def __init__(self, config_path: str) -> None:
+    def __init__(self, config_path: str, debounce_ms: int = 300) -> None:
         self.config_path = Path(config_path).expanduser()
+        self.debounce_ms = debounce_ms
+        self._applied_hash: str | None = None
+        self._write_lock = asyncio.Lock()
         self._ensure_config_exists()
 
     def _ensure_config_exists(self) -> None:
@@ -30,12 +42,69 @@ class YamlBackendConfigRepository(ConfigRepository):
             self.config_path.write_text("backends: []\n")
 
     async def load_configs(self) -> list[BackendConfig]:
-        if not self.config_path.exists():
+        content, configs = await asyncio.to_thread(self._load)
+        self._applied_hash = None if content is None else _content_hash(content)
+        return configs
+
+    async def save_config(self, config: BackendConfig) -> None:
+        async with self._write_lock:
+            content, configs = await asyncio.to_thread(self._load)
+            configs = [c for c in configs if c.name != config.name]
+            configs.append(config)
+            await self._write_configs(configs, content)
+
+    async def remove_config(self, backend_name: str) -> None:
+        async with self._write_lock:
+            content, configs = await asyncio.to_thread(self._load)
+            configs = [c for c in configs if c.name != backend_name]
+            await self._write_configs(configs, content)
+
+    async def replace_configs(self, configs: list[BackendConfig]) -> None:
+        async with self._write_lock:
+            content = await asyncio.to_thread(self._read_content)
+            await self._write_configs(configs, content)
+
+    async def watch_changes(self) -> AsyncIterator[list[BackendConfig]]:
+        from watchfiles import awatch
+
+        async for _ in awatch(
+            self.config_path.parent,
+            watch_filter=self._is_config_change,
+            debounce=max(WATCH_MAX_BATCH_MS, self.debounce_ms),
+            step=self.debounce_ms,
+            recursive=False,
+        ):
+            content = await asyncio.to_thread(self._read_content)
+            if content is not None and _content_hash(content) == self._applied_hash:
+                continue
+            try:
+                configs = await asyncio.to_thread(self._parse_content, content)
+            except Exception as e:
+                raise ConfigurationWatchError(f"Error reloading config: {e}") from e
+            self._applied_hash = None if content is None else _content_hash(content)
+            yield configs
+
+    def _is_config_change(self, change: object, path: str) -> bool:
+        return Path(path).name == self.config_path.name
+
+    def _load(self) -> tuple[bytes | None, list[BackendConfig]]:
+        content = self._read_content()
+        return content, self._parse_content(content)
+
+    def _read_content(self) -> bytes | None:
+        try:
+            return self.config_path.read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def _parse_content(self, content: bytes | None) -> list[BackendConfig]:
+        if content is None:
             return []
 
+        import yaml
+
         try:
-            with open(self.config_path) as f:
-                data = yaml.safe_load(f)
+            data = yaml.safe_load(content)
         except yaml.YAMLError as e:
             raise InvalidConfigurationError(f"Invalid YAML: {e}") from e
 
@@ -49,33 +118,26 @@ class YamlBackendConfigRepository(ConfigRepository):
 
         return configs
 
-    async def save_config(self, config: BackendConfig) -> None:
-        configs = await self.load_configs()
-        configs = [c for c in configs if c.name != config.name]
-        configs.append(config)
-        await self._write_configs(configs)
+    async def _write_configs(
+        self, configs: list[BackendConfig], previous: bytes | None
+    ) -> None:
+        data = {"backends": [self._config_to_dict(c) for c in configs]}
+        content = await asyncio.to_thread(self._write_content, data)
 
-    async def remove_config(self, backend_name: str) -> None:
-        configs = await self.load_configs()
-        configs = [c for c in configs if c.name != backend_name]
-        await self._write_configs(configs)
+        if previous is None or _content_hash(previous) == self._applied_hash:
+            self._applied_hash = _content_hash(content)
 
-    async def watch_changes(self) -> AsyncIterator[list[BackendConfig]]:
-        async for changes in awatch(self.config_path):
-            try:
-                configs = await self.load_configs()
-                yield configs
-            except Exception as e:
-                raise ConfigurationWatchError(f"Error reloading config: {e}") from e
+    def _write_content(self, data: dict) -> bytes:
+        import yaml
 
-    async def _write_configs(self, configs: list[BackendConfig]) -> None:
-        data = {"backends": [self._config_to_dict(c) for c in configs]}
+        content = yaml.safe_dump(
+            data, default_flow_style=False, sort_keys=False
+        ).encode()
 
         temp_path = self.config_path.with_suffix(".tmp")
-        with open(temp_path, "w") as f:
-            yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False)
-
+        temp_path.write_bytes(content)
         temp_path.replace(self.config_path)
+        return content
 
     def _parse_backend_config(self, data: dict) -> BackendConfig:
         name = data.get("name")
@@ -102,6 +164,43 @@ class YamlBackendConfigRepository(ConfigRepository):
                 )
             )
 
+        resource_cache = tuple(
+            ResourceCacheRule(
+                pattern=rule_data.get("pattern", "*"),
+                ttl_seconds=rule_data.get("ttl_seconds", 0),
+                stale_while_revalidate_seconds=rule_data.get(
+                    "stale_while_revalidate_seconds", 0
+                ),
+            )
+            for rule_data in data.get("resource_cache", [])
+        )
+
+        scheduling_data = data.get("scheduling", {})
+        scheduling = SchedulingSettings(
+            max_concurrency=scheduling_data.get("max_concurrency", 0),
+            classes=tuple(
+                PriorityClass(
+                    name=class_data.get("name", ""),
+                    weight=class_data.get("weight", 1),
+                    preemptive=class_data.get("preemptive", False),
+                    clients=tuple(class_data.get("clients", [])),
+                    sessions=tuple(class_data.get("sessions", [])),
+                    tools=tuple(class_data.get("tools", [])),
+                )
+                for class_data in scheduling_data.get("classes", [])
+            ),
+        )
+
+        rate_limits = tuple(
+            RateLimitRule(
+                scope=rule_data.get("scope", "backend"),
+                rate_per_second=rule_data.get("rate_per_second", 0),
+                burst=rule_data.get("burst", 1),
+                pattern=rule_data.get("pattern", "*"),
+            )
+            for rule_data in data.get("rate_limits", [])
+        )
+
         health_check_data = data.get("health_check", {})
         health_check = HealthCheckSettings(
             enabled=health_check_data.get("enabled", True),
@@ -126,6 +225,9 @@ class YamlBackendConfigRepository(ConfigRepository):
             health_check=health_check,
             circuit_breaker=circuit_breaker,
             auto_start=data.get("auto_start", True),
+            resource_cache=resource_cache,
+            scheduling=scheduling,
+            rate_limits=rate_limits,
         )
 
     def _parse_source(self, source_str: str, data: dict) -> BackendSource:
@@ -143,6 +245,8 @@ class YamlBackendConfigRepository(ConfigRepository):
                 command="uvx",
                 args=(github_spec.to_package_name(),),
                 port=port,
+                ready_pattern=data.get("ready_pattern"),
+                inherit_socket=data.get("inherit_socket", False),
             )
 
             return BackendSource(
@@ -156,6 +260,8 @@ class YamlBackendConfigRepository(ConfigRepository):
             command="uvx",
             args=(source_str,),
             port=port,
+            ready_pattern=data.get("ready_pattern"),
+            inherit_socket=data.get("inherit_socket", False),
         )
 
         return BackendSource(
@@ -183,6 +289,12 @@ class YamlBackendConfigRepository(ConfigRepository):
         if config.source.process_config and config.source.process_config.port:
             result["port"] = config.source.process_config.port
 
+        if config.source.process_config and config.source.process_config.ready_pattern:
+            result["ready_pattern"] = config.source.process_config.ready_pattern
+
+        if config.source.process_config and config.source.process_config.inherit_socket:
+            result["inherit_socket"] = True
+
         if config.routes:
             result["routes"] = [
                 {
@@ -193,6 +305,43 @@ class YamlBackendConfigRepository(ConfigRepository):
                 for r in config.routes
             ]
 
+        if config.resource_cache:
+            result["resource_cache"] = [
+                {
+                    "pattern": r.pattern,
+                    "ttl_seconds": r.ttl_seconds,
+                    "stale_while_revalidate_seconds": r.stale_while_revalidate_seconds,
+                }
+                for r in config.resource_cache
+            ]
+
+        if config.scheduling != SchedulingSettings():
+            result["scheduling"] = {
+                "max_concurrency": config.scheduling.max_concurrency,
+                "classes": [
+                    {
+                        "name": c.name,
+                        "weight": c.weight,
+                        "preemptive": c.preemptive,
+                        "clients": list(c.clients),
+                        "sessions": list(c.sessions),
+                        "tools": list(c.tools),
+                    }
+                    for c in config.scheduling.classes
+                ],
+            }
+
+        if config.rate_limits:
+            result["rate_limits"] = [
+                {
+                    "scope": r.scope,
+                    "pattern": r.pattern,
+                    "rate_per_second": r.rate_per_second,
+                    "burst": r.burst,
+                }
+                for r in config.rate_limits
+            ]
+
         result["health_check"] = {
             "enabled": config.health_check.enabled,
             "interval_seconds": config.health_check.interval_seconds,
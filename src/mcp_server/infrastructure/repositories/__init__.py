@@ -1,5 +1,21 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from mcp_server.infrastructure.repositories.in_memory_backend_repository import (
     InMemoryBackendRepository,
 )
 
-__all__ = ["InMemoryBackendRepository"]
+if TYPE_CHECKING:
+    from mcp_server.infrastructure.repositories.sqlite_backend_repository import (
+        SqliteBackendRepository,
+    )
+
+__all__ = ["InMemoryBackendRepository", "SqliteBackendRepository"]
+
+
+def __getattr__(name: str) -> Any:
+    if name != "SqliteBackendRepository":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.sqlite_backend_repository"), name)
+    globals()[name] = value
+    return value
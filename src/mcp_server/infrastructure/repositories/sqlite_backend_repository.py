@@ -0,0 +1,232 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.repositories import BackendRepository
+from mcp_server.domain.value_objects import CircuitState, HealthStatus, LatencyStats
+
+logger = logging.getLogger(__name__)
+
+BUSY_TIMEOUT_MS = 5000
+SYNC_INTERVAL_MS = 50
+
+HealthChange = Callable[[Backend], None]
+HealthState = tuple[HealthStatus, LatencyStats]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS backend_health (
+    name TEXT PRIMARY KEY,
+    is_healthy INTEGER NOT NULL,
+    last_check REAL NOT NULL,
+    error_count INTEGER NOT NULL,
+    circuit_state TEXT NOT NULL,
+    last_error TEXT,
+    failure_timestamps TEXT NOT NULL,
+    latency_count INTEGER NOT NULL,
+    latency_ewma REAL NOT NULL,
+    latency_max REAL NOT NULL
+)
+"""
+
+COLUMNS = (
+    "name, is_healthy, last_check, error_count, circuit_state, last_error, "
+    "failure_timestamps, latency_count, latency_ewma, latency_max"
+)
+
+
+def open_state_db(path: str) -> sqlite3.Connection:
+    db_path = Path(path).expanduser()
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(db_path, isolation_level=None, check_same_thread=False)
+    connection.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.execute("PRAGMA synchronous = NORMAL")
+    return connection
+
+
+@contextmanager
+def immediate_transaction(connection: sqlite3.Connection) -> Iterator[None]:
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+
+class SqliteBackendRepository(BackendRepository):
+    def __init__(
+        self, path: str, owner: bool = True, sync_interval_ms: int = SYNC_INTERVAL_MS
+    ) -> None:
+        self.path = path
+        self.owner = owner
+        self.sync_interval = sync_interval_ms / 1000
+        self._connection = open_state_db(path)
+        self._connection.execute(SCHEMA)
+        self._writer_connection = open_state_db(path)
+        self._backends: dict[str, Backend] = {}
+        self._data_version: int | None = None
+        self._next_sync = 0.0
+        self._pending: dict[str, tuple[Backend, list[HealthChange]]] = {}
+        self._deleted: set[str] = set()
+        self._pending_written: asyncio.Future[None] | None = None
+        self._writer: asyncio.Task[None] | None = None
+
+    def add(self, backend: Backend) -> None:
+        self._backends[backend.name] = backend
+        self._pending.setdefault(backend.name, (backend, []))
+        self._schedule_write().add_done_callback(_log_write_error)
+
+    def get(self, name: str) -> Backend | None:
+        self._sync()
+        return self._backends.get(name)
+
+    def get_all(self) -> list[Backend]:
+        self._sync()
+        return list(self._backends.values())
+
+    def get_healthy(self) -> list[Backend]:
+        return [b for b in self.get_all() if b.is_healthy]
+
+    def get_with_tool(self, tool_name: str) -> list[Backend]:
+        return [b for b in self.get_all() if b.has_tool(tool_name)]
+
+    def remove(self, name: str) -> None:
+        if self._backends.pop(name, None) is None:
+            return
+        self._pending.pop(name, None)
+        if self.owner:
+            self._deleted.add(name)
+            self._schedule_write().add_done_callback(_log_write_error)
+
+    def exists(self, name: str) -> bool:
+        return name in self._backends
+
+    async def update_health(self, backend: Backend, change: HealthChange) -> None:
+        pending = self._pending.get(backend.name)
+        if pending is None:
+            pending = self._pending[backend.name] = (backend, [])
+        pending[1].append(change)
+        await asyncio.shield(self._schedule_write())
+
+    def close(self) -> None:
+        if self._writer:
+            self._writer.cancel()
+        self._connection.close()
+        self._writer_connection.close()
+
+    def _schedule_write(self) -> asyncio.Future[None]:
+        if self._pending_written is None:
+            self._pending_written = asyncio.get_running_loop().create_future()
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._write_pending())
+        return self._pending_written
+
+    async def _write_pending(self) -> None:
+        try:
+            while self._pending or self._deleted:
+                batch, self._pending = self._pending, {}
+                deleted, self._deleted = self._deleted, set()
+                written, self._pending_written = self._pending_written, None
+                assert written is not None
+                try:
+                    states = await asyncio.to_thread(self._write_batch, batch, deleted)
+                except Exception as e:
+                    written.set_exception(e)
+                    continue
+                for name, (backend, _) in batch.items():
+                    backend.health_status, backend.latency = states[name]
+                written.set_result(None)
+        finally:
+            self._writer = None
+
+    def _write_batch(
+        self,
+        batch: dict[str, tuple[Backend, list[HealthChange]]],
+        deleted: set[str],
+    ) -> dict[str, HealthState]:
+        states = {}
+        with immediate_transaction(self._writer_connection):
+            for name in deleted:
+                self._writer_connection.execute(
+                    "DELETE FROM backend_health WHERE name = ?", (name,)
+                )
+            for name, (backend, changes) in batch.items():
+                merged = Backend(config=backend.config)
+                row = self._select(name)
+                if row:
+                    _apply_row(merged, row)
+                else:
+                    merged.health_status = backend.health_status
+                    merged.latency = backend.latency
+                for change in changes:
+                    change(merged)
+                self._write(merged)
+                states[name] = (merged.health_status, merged.latency)
+        return states
+
+    def _sync(self) -> None:
+        now = time.monotonic()
+        if now < self._next_sync:
+            return
+        self._next_sync = now + self.sync_interval
+        (version,) = self._connection.execute("PRAGMA data_version").fetchone()
+        if version == self._data_version:
+            return
+        self._data_version = version
+        for row in self._connection.execute(f"SELECT {COLUMNS} FROM backend_health"):
+            backend = self._backends.get(row[0])
+            if backend:
+                _apply_row(backend, row)
+
+    def _select(self, name: str) -> tuple | None:
+        return self._writer_connection.execute(
+            f"SELECT {COLUMNS} FROM backend_health WHERE name = ?", (name,)
+        ).fetchone()
+
+    def _write(self, backend: Backend) -> None:
+        status = backend.health_status
+        self._writer_connection.execute(
+            f"INSERT OR REPLACE INTO backend_health ({COLUMNS}) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                backend.name,
+                int(status.is_healthy),
+                status.last_check.timestamp(),
+                status.error_count,
+                status.circuit_state.value,
+                status.last_error,
+                json.dumps([t.timestamp() for t in status.failure_timestamps]),
+                backend.latency.count,
+                backend.latency.ewma_seconds,
+                backend.latency.max_seconds,
+            ),
+        )
+
+
+def _log_write_error(written: asyncio.Future[None]) -> None:
+    if not written.cancelled() and written.exception():
+        logger.error(f"Backend state write failed: {written.exception()}")
+
+
+def _apply_row(backend: Backend, row: tuple) -> None:
+    backend.health_status = HealthStatus(
+        backend_name=backend.name,
+        is_healthy=bool(row[1]),
+        last_check=datetime.fromtimestamp(row[2]),
+        error_count=row[3],
+        circuit_state=CircuitState(row[4]),
+        last_error=row[5],
+        failure_timestamps=tuple(datetime.fromtimestamp(t) for t in json.loads(row[6])),
+    )
+    backend.latency = LatencyStats(
+        count=row[7], ewma_seconds=row[8], max_seconds=row[9]
+    )
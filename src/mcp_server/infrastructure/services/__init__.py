@@ -1,3 +1,39 @@
-from mcp_server.infrastructure.services.config_watcher import ConfigWatcher
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["ConfigWatcher"]
+if TYPE_CHECKING:
+    from mcp_server.infrastructure.services.capability_snapshot_watcher import (
+        CapabilitySnapshotWatcher,
+    )
+    from mcp_server.infrastructure.services.config_watcher import ConfigWatcher
+    from mcp_server.infrastructure.services.loop_monitor import LoopMonitor, LoopStall
+    from mcp_server.infrastructure.services.runtime_profiler import (
+        ProfilingInProgressError,
+        RuntimeProfiler,
+    )
+
+_EXPORTS = {
+    "CapabilitySnapshotWatcher": "capability_snapshot_watcher",
+    "ConfigWatcher": "config_watcher",
+    "LoopMonitor": "loop_monitor",
+    "LoopStall": "loop_monitor",
+    "ProfilingInProgressError": "runtime_profiler",
+    "RuntimeProfiler": "runtime_profiler",
+}
+
+__all__ = [
+    "CapabilitySnapshotWatcher",
+    "ConfigWatcher",
+    "LoopMonitor",
+    "LoopStall",
+    "ProfilingInProgressError",
+    "RuntimeProfiler",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    globals()[name] = value
+    return value
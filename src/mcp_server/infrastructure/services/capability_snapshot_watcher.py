@@ -0,0 +1,56 @@
+import asyncio
+import logging
+from typing import TYPE_CHECKING
+
+from mcp_server.application.ports import CapabilitySnapshotPort
+from mcp_server.domain.repositories import BackendRepository
+
+if TYPE_CHECKING:
+    from mcp_server.application.use_cases import DiscoverCapabilities
+
+logger = logging.getLogger(__name__)
+
+
+class CapabilitySnapshotWatcher:
+    def __init__(
+        self,
+        capability_snapshot: CapabilitySnapshotPort,
+        backend_repository: BackendRepository,
+        discover_capabilities: "DiscoverCapabilities",
+    ) -> None:
+        self.capability_snapshot = capability_snapshot
+        self.backend_repository = backend_repository
+        self.discover_capabilities = discover_capabilities
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        self._task = asyncio.create_task(self._watch_loop())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _watch_loop(self) -> None:
+        logger.info("Starting capability snapshot watcher")
+
+        try:
+            async for snapshot in self.capability_snapshot.watch_changes():
+                logger.info("Capability snapshot changed, applying capabilities")
+                for backend in self.backend_repository.get_all():
+                    try:
+                        await self.discover_capabilities.apply_snapshot(
+                            backend, snapshot
+                        )
+                    except Exception as e:
+                        logger.error(
+                            f"Error applying capabilities for {backend.name}: {e}",
+                            exc_info=True,
+                        )
+        except asyncio.CancelledError:
+            logger.info("Capability snapshot watcher stopped")
+        except Exception as e:
+            logger.error(f"Capability snapshot watcher error: {e}", exc_info=True)
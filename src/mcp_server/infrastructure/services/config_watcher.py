@@ -38,7 +38,7 @@ class ConfigWatcher:
             async for configs in self.config_repository.watch_changes():
                 logger.info("Config file changed, reloading backends")
                 try:
-                    results = await self.reload_backends.execute()
+                    results = await self.reload_backends.execute(configs)
                     logger.info(f"Reload complete: {results}")
                 except Exception as e:
                     logger.error(f"Error reloading backends: {e}", exc_info=True)
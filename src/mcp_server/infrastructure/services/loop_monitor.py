@@ -0,0 +1,138 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from mcp_server.application.ports import MetricsPort
+
+logger = logging.getLogger(__name__)
+
+STACK_DEPTH = 20
+
+
+@dataclass
+class LoopStall:
+    started_at: float
+    task: str | None
+    stack: list[str] = field(default_factory=list)
+    duration_seconds: float | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "started_at": self.started_at,
+            "duration_seconds": self.duration_seconds,
+            "task": self.task,
+            "stack": self.stack,
+        }
+
+
+class LoopMonitor:
+    def __init__(
+        self,
+        metrics: MetricsPort | None = None,
+        interval_seconds: float = 0.1,
+        slow_threshold_seconds: float = 0.1,
+        max_stalls: int = 50,
+    ) -> None:
+        self.metrics = metrics
+        self.interval_seconds = interval_seconds
+        self.slow_threshold_seconds = slow_threshold_seconds
+        self.stalls: deque[LoopStall] = deque(maxlen=max_stalls)
+        self.samples = 0
+        self.last_lag_seconds = 0.0
+        self.max_lag_seconds = 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int | None = None
+        self._heartbeat = 0.0
+        self._pending: LoopStall | None = None
+        self._task: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        self._task = asyncio.create_task(self._sample_lag(), name="loop-lag-monitor")
+        self._watchdog = threading.Thread(
+            target=self._watch, name="loop-stall-watchdog", daemon=True
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self._watchdog:
+            await asyncio.to_thread(self._watchdog.join)
+
+    def snapshot(self, limit: int = 20) -> dict[str, Any]:
+        return {
+            "samples": self.samples,
+            "last_lag_seconds": self.last_lag_seconds,
+            "max_lag_seconds": self.max_lag_seconds,
+            "slow_threshold_seconds": self.slow_threshold_seconds,
+            "stalls": [stall.to_dict() for stall in list(self.stalls)[-limit:]],
+        }
+
+    async def _sample_lag(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            scheduled = loop.time() + self.interval_seconds
+            await asyncio.sleep(self.interval_seconds)
+            lag = max(0.0, loop.time() - scheduled)
+            self._heartbeat = time.monotonic()
+            self._record_lag(lag)
+
+    def _record_lag(self, lag: float) -> None:
+        self.samples += 1
+        self.last_lag_seconds = lag
+        self.max_lag_seconds = max(self.max_lag_seconds, lag)
+        if self.metrics:
+            self.metrics.record_loop_lag(lag)
+
+        stall, self._pending = self._pending, None
+        if lag < self.slow_threshold_seconds:
+            return
+        if stall is None:
+            stall = LoopStall(started_at=time.time() - lag, task=None)
+        stall.duration_seconds = lag
+        self.stalls.append(stall)
+        if self.metrics:
+            self.metrics.record_loop_stall(lag)
+        logger.warning(
+            f"Event loop blocked for {lag * 1000:.0f}ms"
+            + (f" in task {stall.task}" if stall.task else "")
+        )
+
+    def _watch(self) -> None:
+        poll = min(self.slow_threshold_seconds, self.interval_seconds) / 2
+        while not self._stopped.wait(poll):
+            blocked_for = time.monotonic() - self._heartbeat - self.interval_seconds
+            if self._pending is None and blocked_for > self.slow_threshold_seconds:
+                self._pending = self._capture(blocked_for)
+
+    def _capture(self, blocked_for: float) -> LoopStall:
+        frame = sys._current_frames().get(self._loop_thread)
+        stack = []
+        if frame is not None:
+            stack = [
+                f"{entry.filename}:{entry.lineno} in {entry.name}"
+                for entry in traceback.extract_stack(frame)[-STACK_DEPTH:]
+            ]
+        task = asyncio.current_task(self._loop) if self._loop else None
+        return LoopStall(
+            started_at=time.time() - blocked_for,
+            task=task.get_name() if task else None,
+            stack=stack,
+        )
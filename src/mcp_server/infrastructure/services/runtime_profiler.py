@@ -0,0 +1,265 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from types import FrameType
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+MAX_PROFILE_SECONDS = 300.0
+TRACEMALLOC_FRAMES = 25
+
+
+class ProfilingInProgressError(RuntimeError):
+    def __init__(self, kind: str) -> None:
+        super().__init__(f"A {kind} profiling session is already running")
+        self.kind = kind
+
+
+class RuntimeProfiler:
+    def __init__(self, output_dir: str) -> None:
+        self.output_dir = Path(output_dir).expanduser()
+        self._active: str | None = None
+
+    @property
+    def active_session(self) -> str | None:
+        return self._active
+
+    async def profile_cpu(
+        self,
+        duration_seconds: float,
+        interval_ms: float = 10.0,
+        top: int = 20,
+    ) -> dict[str, Any]:
+        duration = _bounded(duration_seconds)
+        with self._session("cpu"):
+            sampler = _StackSampler(
+                loop=asyncio.get_running_loop(),
+                loop_thread=threading.get_ident(),
+                interval=max(interval_ms, 1.0) / 1000,
+            )
+            sampler.start()
+            try:
+                await asyncio.sleep(duration)
+            finally:
+                sampler.stop()
+                await asyncio.to_thread(sampler.join)
+
+            path = self._output_path("cpu", "folded")
+            await asyncio.to_thread(
+                _write_folded, path, sampler.stacks + sampler.task_stacks
+            )
+
+        return {
+            "kind": "cpu",
+            "duration_seconds": duration,
+            "samples": sampler.samples,
+            "file": str(path),
+            "top_self": _top_frames(sampler.stacks, top, leaf_only=True),
+            "top_inclusive": _top_frames(sampler.stacks, top, leaf_only=False),
+            "top_awaiting": _top_frames(sampler.task_stacks, top, leaf_only=True),
+        }
+
+    async def profile_heap(
+        self,
+        duration_seconds: float,
+        top: int = 20,
+    ) -> dict[str, Any]:
+        duration = _bounded(duration_seconds)
+        with self._session("heap"):
+            started_tracing = not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start(TRACEMALLOC_FRAMES)
+            try:
+                before = tracemalloc.take_snapshot()
+                await asyncio.sleep(duration)
+                after = tracemalloc.take_snapshot()
+                traced_current, traced_peak = tracemalloc.get_traced_memory()
+            finally:
+                if started_tracing:
+                    tracemalloc.stop()
+
+            diff = await asyncio.to_thread(_snapshot_diff, before, after)
+            path = self._output_path("heap", "txt")
+            await asyncio.to_thread(_write_heap_diff, path, diff)
+
+        return {
+            "kind": "heap",
+            "duration_seconds": duration,
+            "traced_bytes": traced_current,
+            "peak_traced_bytes": traced_peak,
+            "file": str(path),
+            "top_growth": [
+                {
+                    "location": str(stat.traceback[-1]),
+                    "size_diff_bytes": stat.size_diff,
+                    "count_diff": stat.count_diff,
+                    "size_bytes": stat.size,
+                }
+                for stat in diff[:top]
+            ],
+        }
+
+    def _session(self, kind: str) -> "_Session":
+        if self._active:
+            raise ProfilingInProgressError(self._active)
+        return _Session(self, kind)
+
+    def _output_path(self, kind: str, suffix: str) -> Path:
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        return self.output_dir / f"{kind}-{stamp}.{suffix}"
+
+
+class _Session:
+    def __init__(self, profiler: RuntimeProfiler, kind: str) -> None:
+        self.profiler = profiler
+        self.kind = kind
+
+    def __enter__(self) -> None:
+        self.profiler._active = self.kind
+        logger.info(f"Started {self.kind} profiling session")
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.profiler._active = None
+        logger.info(f"Finished {self.kind} profiling session")
+
+
+class _StackSampler(threading.Thread):
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        loop_thread: int,
+        interval: float,
+    ) -> None:
+        super().__init__(name="mcp-cpu-profiler", daemon=True)
+        self.loop = loop
+        self.loop_thread = loop_thread
+        self.interval = interval
+        self.samples = 0
+        self.stacks: Counter[str] = Counter()
+        self.task_stacks: Counter[str] = Counter()
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+    def run(self) -> None:
+        own_thread = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        while not self._stop_event.wait(self.interval):
+            self.samples += 1
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_thread:
+                    continue
+                label = "event-loop" if thread_id == self.loop_thread else None
+                label = label or names.get(thread_id) or f"thread-{thread_id}"
+                self.stacks[_collapse(label, _frame_stack(frame))] += 1
+            self._sample_tasks()
+
+    def _sample_tasks(self) -> None:
+        try:
+            tasks = asyncio.all_tasks(self.loop)
+        except RuntimeError:
+            return
+        for task in tasks:
+            stack = _task_stack(task)
+            if stack:
+                self.task_stacks[_collapse(f"task:{task.get_name()}", stack)] += 1
+
+
+def _bounded(duration_seconds: float) -> float:
+    return min(max(duration_seconds, 0.1), MAX_PROFILE_SECONDS)
+
+
+def _describe(filename: str, name: str, lineno: int) -> str:
+    parts = Path(filename).parts
+    short = "/".join(parts[-2:]) if len(parts) > 1 else filename
+    return f"{name} ({short}:{lineno})"
+
+
+def _frame_stack(frame: FrameType | None) -> list[str]:
+    stack = []
+    while frame is not None:
+        code = frame.f_code
+        stack.append(_describe(code.co_filename, code.co_name, code.co_firstlineno))
+        frame = frame.f_back
+    stack.reverse()
+    return stack
+
+
+def _task_stack(task: asyncio.Task) -> list[str]:
+    stack = []
+    awaitable: Any = task.get_coro()
+    while awaitable is not None:
+        frame = getattr(awaitable, "cr_frame", None) or getattr(
+            awaitable, "gi_frame", None
+        )
+        if frame is None:
+            break
+        code = frame.f_code
+        stack.append(_describe(code.co_filename, code.co_name, code.co_firstlineno))
+        awaitable = getattr(awaitable, "cr_await", None) or getattr(
+            awaitable, "gi_yieldfrom", None
+        )
+    return stack
+
+
+def _collapse(label: str, stack: list[str]) -> str:
+    return ";".join([label, *(entry.replace(";", ":") for entry in stack)])
+
+
+def _top_frames(
+    stacks: Counter[str], top: int, leaf_only: bool
+) -> list[dict[str, Any]]:
+    counts: Counter[str] = Counter()
+    total = sum(stacks.values())
+    for stack, count in stacks.items():
+        frames = stack.split(";")[1:]
+        if not frames:
+            continue
+        for frame in [frames[-1]] if leaf_only else set(frames):
+            counts[frame] += count
+    return [
+        {"frame": frame, "samples": count, "percent": round(count / total * 100, 1)}
+        for frame, count in counts.most_common(top)
+    ]
+
+
+def _write_folded(path: Path, stacks: Counter[str]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        for stack, count in stacks.most_common():
+            f.write(f"{stack} {count}\n")
+
+
+def _snapshot_diff(
+    before: tracemalloc.Snapshot, after: tracemalloc.Snapshot
+) -> list[tracemalloc.StatisticDiff]:
+    ignore = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    ]
+    return after.filter_traces(ignore).compare_to(
+        before.filter_traces(ignore), "traceback"
+    )
+
+
+def _write_heap_diff(path: Path, diff: list[tracemalloc.StatisticDiff]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        f.write(f"# tracemalloc diff written {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        for stat in diff:
+            if not stat.size_diff and not stat.count_diff:
+                continue
+            f.write(
+                f"{stat.size_diff:+d} B ({stat.count_diff:+d} blocks), "
+                f"{stat.size} B total\n"
+            )
+            for line in stat.traceback.format():
+                f.write(f"    {line}\n")
@@ -1,3 +1,19 @@
-from mcp_server.presentation.composition_root import CompositionRoot
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from mcp_server.presentation.composition_root import CompositionRoot
+
+_EXPORTS = {
+    "CompositionRoot": "composition_root",
+}
 
 __all__ = ["CompositionRoot"]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{_EXPORTS[name]}"), name)
+    globals()[name] = value
+    return value
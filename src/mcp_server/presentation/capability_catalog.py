@@ -0,0 +1,109 @@
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any
+
+from mcp_server.application.ports import MetricsPort
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.repositories import BackendRepository
+from mcp_server.presentation.capability_registrar import (
+    proxied_prompts,
+    proxied_resource_templates,
+    proxied_resources,
+    proxied_tools,
+)
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    version: str
+    body: bytes
+    data: dict[str, Any]
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.version}"'
+
+
+class CapabilityCatalog:
+    def __init__(
+        self,
+        backend_repository: BackendRepository,
+        enable_namespace_prefixing: bool,
+        metrics: MetricsPort | None = None,
+    ) -> None:
+        self.backend_repository = backend_repository
+        self.enable_namespace_prefixing = enable_namespace_prefixing
+        self.metrics = metrics
+        self._sources: tuple[tuple[str, str, str, bool], ...] | None = None
+        self._snapshot: CatalogSnapshot | None = None
+
+    def snapshot(self) -> CatalogSnapshot:
+        backends = self.backend_repository.get_all()
+        sources = tuple(
+            (b.name, b.config.namespace, b.capabilities_hash, b.config.auto_start)
+            for b in backends
+        )
+        stale = self._snapshot is None or sources != self._sources
+        if stale:
+            self._snapshot = self._build(backends)
+            self._sources = sources
+        if self.metrics:
+            self.metrics.record_cache_lookup("catalog", not stale)
+        return self._snapshot
+
+    def is_current(self, version: str | None) -> bool:
+        return version is not None and version.strip('"') == self.snapshot().version
+
+    def _build(self, backends: list[Backend]) -> CatalogSnapshot:
+        tools: list[dict[str, Any]] = []
+        resources: list[dict[str, Any]] = []
+        resource_templates: list[dict[str, Any]] = []
+        prompts: list[dict[str, Any]] = []
+
+        for backend in backends:
+            if not backend.config.auto_start:
+                continue
+            prefix = self.enable_namespace_prefixing
+            tools.extend(
+                {**info, "name": name, "backend": backend.name}
+                for name, info in proxied_tools(backend, prefix).items()
+            )
+            resources.extend(
+                {**info, "uri": uri, "backend": backend.name}
+                for uri, info in proxied_resources(backend, prefix).items()
+            )
+            resource_templates.extend(
+                {**info, "uriTemplate": uri, "backend": backend.name}
+                for uri, info in proxied_resource_templates(backend, prefix).items()
+            )
+            prompts.extend(
+                {**info, "name": name, "backend": backend.name}
+                for name, info in proxied_prompts(backend, prefix).items()
+            )
+
+        content = json.dumps(
+            {
+                "tools": tools,
+                "resources": resources,
+                "resource_templates": resource_templates,
+                "prompts": prompts,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        ).encode()
+        version = hashlib.sha256(content).hexdigest()[:16]
+        body = b'{"version":"' + version.encode() + b'",' + content[1:]
+
+        return CatalogSnapshot(
+            version=version,
+            body=body,
+            data={
+                "version": version,
+                "tools": tools,
+                "resources": resources,
+                "resource_templates": resource_templates,
+                "prompts": prompts,
+            },
+        )
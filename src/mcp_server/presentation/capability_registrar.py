@@ -0,0 +1,535 @@
+import logging
+import re
+from typing import Any
+from weakref import WeakSet
+
+from fastmcp import FastMCP
+from fastmcp.prompts import Prompt
+from fastmcp.prompts.prompt import Message, PromptArgument
+from fastmcp.resources import Resource, ResourceTemplate
+from fastmcp.server.dependencies import get_context
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.tools import Tool
+from fastmcp.tools.tool import ToolResult
+from mcp.server.lowlevel.helper_types import ReadResourceContents
+from mcp.server.session import ServerSession
+from mcp.types import PromptMessage
+from pydantic import AnyUrl, PrivateAttr, ValidationError
+
+from mcp_server.application.dtos import ToolCallRequest
+from mcp_server.application.ports import CapabilityListenerPort
+from mcp_server.application.use_cases import (
+    ReadResource,
+    RenderPrompt,
+    RouteToolCall,
+)
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.services import ResourceUriTrie, ToolSearchIndex
+from mcp_server.domain.value_objects import ResourceMatch
+
+logger = logging.getLogger(__name__)
+
+EMPTY_SCHEMA: dict[str, Any] = {"type": "object", "properties": {}}
+
+
+def caller_identity() -> tuple[str | None, str | None]:
+    try:
+        context = get_context()
+    except RuntimeError:
+        return None, None
+    if context.request_context is None:
+        return None, None
+
+    client_id = context.client_id
+    client_params = context.session.client_params
+    if client_id is None and client_params is not None:
+        client_id = client_params.clientInfo.name
+    return client_id, context.session_id
+
+
+def proxied_tools(
+    backend: Backend, enable_namespace_prefixing: bool
+) -> dict[str, dict[str, Any]]:
+    tools = {}
+    for tool_info in backend.tools:
+        original_name = tool_info.get("name")
+        if not original_name:
+            continue
+        proxied_name = (
+            f"{backend.config.namespace}.{original_name}"
+            if enable_namespace_prefixing
+            else original_name
+        )
+        tools[proxied_name] = tool_info
+    return tools
+
+
+def proxied_resources(
+    backend: Backend, enable_namespace_prefixing: bool
+) -> dict[str, dict[str, Any]]:
+    resources = {}
+    for resource_info in backend.resources:
+        original_uri = resource_info.get("uri")
+        if not original_uri:
+            continue
+        proxied_uri = (
+            f"{backend.config.namespace}://{original_uri}"
+            if enable_namespace_prefixing
+            else original_uri
+        )
+        resources[proxied_uri] = resource_info
+    return resources
+
+
+def proxied_resource_templates(
+    backend: Backend, enable_namespace_prefixing: bool
+) -> dict[str, dict[str, Any]]:
+    templates = {}
+    for resource_info in backend.resources:
+        original_template = resource_info.get("uriTemplate")
+        if not original_template or "uri" in resource_info:
+            continue
+        proxied_template = (
+            f"{backend.config.namespace}://{original_template}"
+            if enable_namespace_prefixing
+            else original_template
+        )
+        templates[proxied_template] = resource_info
+    return templates
+
+
+def proxied_prompts(
+    backend: Backend, enable_namespace_prefixing: bool
+) -> dict[str, dict[str, Any]]:
+    prompts = {}
+    for prompt_info in backend.prompts:
+        original_name = prompt_info.get("name")
+        if not original_name:
+            continue
+        proxied_name = (
+            f"{backend.config.namespace}.{original_name}"
+            if enable_namespace_prefixing
+            else original_name
+        )
+        prompts[proxied_name] = prompt_info
+    return prompts
+
+
+class ProxiedTool(Tool):
+    original_name: str
+    _route_tool_call: RouteToolCall = PrivateAttr()
+
+    @classmethod
+    def create(
+        cls,
+        name: str,
+        tool_info: dict[str, Any],
+        route_tool_call: RouteToolCall,
+    ) -> "ProxiedTool":
+        tool = cls(
+            name=name,
+            description=tool_info.get("description", ""),
+            parameters=tool_info.get("inputSchema") or EMPTY_SCHEMA,
+            original_name=tool_info["name"],
+        )
+        tool._route_tool_call = route_tool_call
+        return tool
+
+    async def run(self, arguments: dict[str, Any]) -> ToolResult:
+        client_id, session_id = caller_identity()
+        request = ToolCallRequest(
+            tool_name=self.original_name,
+            arguments=arguments,
+            client_id=client_id,
+            session_id=session_id,
+        )
+        response = await self._route_tool_call.execute(request)
+        return ToolResult(content=response.result)
+
+
+class ProxiedResource(Resource):
+    backend_name: str
+    original_uri: str
+    _read_resource: ReadResource = PrivateAttr()
+
+    @classmethod
+    def create(
+        cls,
+        uri: str,
+        resource_info: dict[str, Any],
+        backend_name: str,
+        read_resource: ReadResource,
+    ) -> "ProxiedResource":
+        resource = cls(
+            uri=uri,
+            name=resource_info.get("name") or uri,
+            description=resource_info.get("description", ""),
+            mime_type=resource_info.get("mimeType"),
+            backend_name=backend_name,
+            original_uri=resource_info["uri"],
+        )
+        resource._read_resource = read_resource
+        return resource
+
+    async def read(self) -> str:
+        return await self._read_resource.execute(self.backend_name, self.original_uri)
+
+
+class ProxiedResourceTemplate(ResourceTemplate):
+    backend_name: str
+    resource_info: dict[str, Any]
+    _read_resource: ReadResource = PrivateAttr()
+
+    @classmethod
+    def create(
+        cls,
+        uri_template: str,
+        resource_info: dict[str, Any],
+        backend_name: str,
+        read_resource: ReadResource,
+    ) -> "ProxiedResourceTemplate":
+        names = re.findall(r"\{(\w+)\*?\}", uri_template)
+        template = cls(
+            uri_template=uri_template,
+            name=resource_info.get("name") or uri_template,
+            description=resource_info.get("description", ""),
+            mime_type=resource_info.get("mimeType"),
+            parameters={
+                "type": "object",
+                "properties": {name: {"type": "string"} for name in names},
+                "required": names,
+            },
+            backend_name=backend_name,
+            resource_info=resource_info,
+        )
+        template._read_resource = read_resource
+        return template
+
+    async def read(self, arguments: dict[str, Any]) -> str:
+        match = ResourceMatch(
+            uri=self.uri_template,
+            backend_name=self.backend_name,
+            resource_info=self.resource_info,
+            params=arguments,
+        )
+        return await self._read_resource.execute(self.backend_name, match.original_uri)
+
+
+class ProxiedPrompt(Prompt):
+    backend_name: str
+    original_name: str
+    _render_prompt: RenderPrompt = PrivateAttr()
+
+    @classmethod
+    def create(
+        cls,
+        name: str,
+        prompt_info: dict[str, Any],
+        backend_name: str,
+        render_prompt: RenderPrompt,
+    ) -> "ProxiedPrompt":
+        prompt = cls(
+            name=name,
+            description=prompt_info.get("description", ""),
+            arguments=[
+                PromptArgument(
+                    name=argument["name"],
+                    description=argument.get("description"),
+                    required=argument.get("required", False),
+                )
+                for argument in prompt_info.get("arguments") or []
+                if argument.get("name")
+            ],
+            backend_name=backend_name,
+            original_name=prompt_info["name"],
+        )
+        prompt._render_prompt = render_prompt
+        return prompt
+
+    async def render(
+        self, arguments: dict[str, Any] | None = None
+    ) -> list[PromptMessage]:
+        rendered = await self._render_prompt.execute(
+            self.backend_name, self.original_name, arguments or {}
+        )
+        return [Message(rendered)]
+
+
+class SessionTracker(Middleware):
+    def __init__(self) -> None:
+        self.sessions: WeakSet[ServerSession] = WeakSet()
+
+    async def on_message(self, context: MiddlewareContext, call_next: Any) -> Any:
+        fastmcp_context = context.fastmcp_context
+        if fastmcp_context and fastmcp_context.request_context:
+            self.sessions.add(fastmcp_context.session)
+        return await call_next(context)
+
+
+class ResourceRouter(Middleware):
+    def __init__(self, read_resource: ReadResource) -> None:
+        self.read_resource = read_resource
+        self.trie = ResourceUriTrie()
+        self._resources: list[Resource] | None = None
+        self._templates: list[ResourceTemplate] | None = None
+
+    def index_backend(
+        self, backend_name: str, resources: dict[str, dict[str, Any]]
+    ) -> bool:
+        previous = self.trie.backend_resources(backend_name)
+        normalized = {}
+        for uri, info in resources.items():
+            try:
+                normalized[_normalize_uri(uri)] = info
+            except ValidationError:
+                logger.warning(
+                    f"Skipping invalid resource URI from {backend_name}: {uri}"
+                )
+        self.trie.index_backend(backend_name, normalized)
+        return self._invalidate_listing(
+            previous != self.trie.backend_resources(backend_name)
+        )
+
+    def remove_backend(self, backend_name: str) -> bool:
+        removed = bool(self.trie.backend_resources(backend_name))
+        self.trie.remove_backend(backend_name)
+        return self._invalidate_listing(removed)
+
+    async def on_read_resource(self, context: MiddlewareContext, call_next: Any) -> Any:
+        match = self.trie.match(str(context.message.uri))
+        if match is None:
+            return await call_next(context)
+        content = await self.read_resource.execute(
+            match.backend_name, match.original_uri
+        )
+        return [
+            ReadResourceContents(
+                content=content,
+                mime_type=match.resource_info.get("mimeType") or "text/plain",
+            )
+        ]
+
+    async def on_list_resources(
+        self, context: MiddlewareContext, call_next: Any
+    ) -> Any:
+        if self._resources is None:
+            self._resources = [
+                ProxiedResource.create(uri, info, backend_name, self.read_resource)
+                for backend_name, uri, info in self._entries(template=False)
+            ]
+        return [*await call_next(context), *self._resources]
+
+    async def on_list_resource_templates(
+        self, context: MiddlewareContext, call_next: Any
+    ) -> Any:
+        if self._templates is None:
+            self._templates = [
+                ProxiedResourceTemplate.create(
+                    uri, info, backend_name, self.read_resource
+                )
+                for backend_name, uri, info in self._entries(template=True)
+            ]
+        return [*await call_next(context), *self._templates]
+
+    def _entries(self, template: bool) -> list[tuple[str, str, dict[str, Any]]]:
+        return [
+            (backend_name, uri, info)
+            for backend_name in self.trie.backend_names
+            for uri, info in self.trie.backend_resources(backend_name).items()
+            if ("uri" not in info) == template
+        ]
+
+    def _invalidate_listing(self, changed: bool) -> bool:
+        if changed:
+            self._resources = None
+            self._templates = None
+        return changed
+
+
+class CapabilityRegistrar(CapabilityListenerPort):
+    def __init__(
+        self,
+        server: FastMCP,
+        route_tool_call: RouteToolCall,
+        read_resource: ReadResource,
+        render_prompt: RenderPrompt,
+        enable_namespace_prefixing: bool,
+        session_tracker: SessionTracker | None = None,
+        search_index: ToolSearchIndex | None = None,
+        expose_tools: bool = True,
+    ) -> None:
+        self.server = server
+        self.route_tool_call = route_tool_call
+        self.read_resource = read_resource
+        self.render_prompt = render_prompt
+        self.enable_namespace_prefixing = enable_namespace_prefixing
+        self.session_tracker = session_tracker
+        self.search_index = search_index
+        self.expose_tools = expose_tools
+        self.resource_router = ResourceRouter(read_resource)
+        server.add_middleware(self.resource_router)
+        self._tools: dict[str, dict[str, dict[str, Any]]] = {}
+        self._prompts: dict[str, dict[str, dict[str, Any]]] = {}
+
+    @property
+    def tool_count(self) -> int:
+        return len({name for tools in self._tools.values() for name in tools})
+
+    @property
+    def resource_count(self) -> int:
+        return len(self.resource_router.trie)
+
+    @property
+    def prompt_count(self) -> int:
+        return len({name for prompts in self._prompts.values() for name in prompts})
+
+    async def capabilities_changed(self, backend: Backend) -> None:
+        if not backend.config.auto_start:
+            logger.info(
+                f"Skipping capability registration for backend '{backend.name}' "
+                f"(auto_start=false)"
+            )
+            await self.backend_removed(backend.name)
+            return
+
+        desired_tools = proxied_tools(backend, self.enable_namespace_prefixing)
+        if self.search_index is not None:
+            self.search_index.index_backend(backend.name, desired_tools)
+        if not self.expose_tools:
+            desired_tools = {}
+
+        tools_changed = self._sync_tools(backend.name, desired_tools)
+        resources_changed = self.resource_router.index_backend(
+            backend.name,
+            {
+                **proxied_resources(backend, self.enable_namespace_prefixing),
+                **proxied_resource_templates(backend, self.enable_namespace_prefixing),
+            },
+        )
+        prompts_changed = self._sync_prompts(
+            backend.name, proxied_prompts(backend, self.enable_namespace_prefixing)
+        )
+        if resources_changed:
+            await self.read_resource.invalidate(backend.name)
+        self.render_prompt.invalidate(backend.name)
+        await self._notify(tools_changed, resources_changed, prompts_changed)
+
+    async def backend_removed(self, backend_name: str) -> None:
+        if self.search_index is not None:
+            self.search_index.remove_backend(backend_name)
+        tools_changed = self._sync_tools(backend_name, {})
+        resources_changed = self.resource_router.remove_backend(backend_name)
+        prompts_changed = self._sync_prompts(backend_name, {})
+        await self.read_resource.invalidate(backend_name)
+        self.render_prompt.invalidate(backend_name)
+        await self._notify(tools_changed, resources_changed, prompts_changed)
+
+    async def resource_updated(self, backend_name: str, uri: str) -> None:
+        await self.read_resource.invalidate(backend_name, uri)
+        if not self.session_tracker:
+            return
+
+        proxied_uris = [
+            proxied_uri
+            for proxied_uri, info in self.resource_router.trie.backend_resources(
+                backend_name
+            ).items()
+            if info.get("uri") == uri
+        ]
+        for session in list(self.session_tracker.sessions):
+            try:
+                for proxied_uri in proxied_uris:
+                    await session.send_resource_updated(AnyUrl(proxied_uri))
+            except Exception as e:
+                logger.debug(f"Dropping session after failed notification: {e}")
+                self.session_tracker.sessions.discard(session)
+
+    def _sync_tools(
+        self, backend_name: str, desired: dict[str, dict[str, Any]]
+    ) -> bool:
+        current = self._tools.pop(backend_name, {})
+        changed = False
+
+        for name, info in current.items():
+            if desired.get(name) != info and not self._tool_claimed(name):
+                self.server.remove_tool(name)
+                changed = True
+                logger.debug(f"Removed proxied tool: {name}")
+
+        for name, info in desired.items():
+            if current.get(name) != info:
+                if current.get(name) is None and self._tool_claimed(name):
+                    continue
+                self.server.add_tool(
+                    ProxiedTool.create(name, info, self.route_tool_call)
+                )
+                changed = True
+                logger.debug(f"Registered proxied tool: {name}")
+
+        if desired:
+            self._tools[backend_name] = desired
+        return changed
+
+    def _sync_prompts(
+        self, backend_name: str, desired: dict[str, dict[str, Any]]
+    ) -> bool:
+        current = self._prompts.pop(backend_name, {})
+        changed = False
+        for name, info in current.items():
+            if desired.get(name) != info and not self._prompt_claimed(name):
+                _remove_prompt(self.server, name)
+                changed = True
+                logger.debug(f"Removed proxied prompt: {name}")
+
+        for name, info in desired.items():
+            if current.get(name) != info:
+                if current.get(name) is None and self._prompt_claimed(name):
+                    continue
+                self.server.add_prompt(
+                    ProxiedPrompt.create(name, info, backend_name, self.render_prompt)
+                )
+                changed = True
+                logger.debug(f"Registered proxied prompt: {name}")
+
+        if desired:
+            self._prompts[backend_name] = desired
+        return changed
+
+    def _tool_claimed(self, name: str) -> bool:
+        return any(name in tools for tools in self._tools.values())
+
+    def _prompt_claimed(self, name: str) -> bool:
+        return any(name in prompts for prompts in self._prompts.values())
+
+    async def _notify(
+        self, tools_changed: bool, resources_changed: bool, prompts_changed: bool
+    ) -> None:
+        if not self.session_tracker or not (
+            tools_changed or resources_changed or prompts_changed
+        ):
+            return
+
+        for session in list(self.session_tracker.sessions):
+            try:
+                if tools_changed:
+                    await session.send_tool_list_changed()
+                if resources_changed:
+                    await session.send_resource_list_changed()
+                if prompts_changed:
+                    await session.send_prompt_list_changed()
+            except Exception as e:
+                logger.debug(f"Dropping session after failed notification: {e}")
+                self.session_tracker.sessions.discard(session)
+
+
+def _remove_prompt(server: FastMCP, name: str) -> None:
+    remove_prompt = getattr(server, "remove_prompt", None)
+    if remove_prompt is not None:
+        remove_prompt(name)
+        return
+    # fastmcp 2.14.1 (the pinned version) has no public way to remove a prompt
+    server._prompt_manager._prompts.pop(name, None)
+
+
+def _normalize_uri(uri: str) -> str:
+    return str(AnyUrl(uri)).replace("%7B", "{").replace("%7D", "}")
@@ -1,28 +1,69 @@
+import asyncio
 import logging
+import time
 from pathlib import Path
 
+from mcp_server.application.dtos import BackendStartupTimeline
 from mcp_server.application.ports import (
+    AccessLogPort,
+    ArgumentValidatorPort,
+    CapabilityListenerPort,
+    CapabilitySnapshot,
+    CapabilitySnapshotPort,
+    LeaderLeasePort,
     MCPClientPort,
+    MetricsPort,
     PortAllocatorPort,
     ProcessManagerPort,
+    ProcessPoolPort,
+    RateLimiterPort,
+    RequestSchedulerPort,
+    ResourceCachePort,
+    TracerPort,
 )
 from mcp_server.application.use_cases import (
     CheckBackendHealth,
     DiscoverCapabilities,
     MonitorBackendProcesses,
+    ReadResource,
     RegisterBackend,
     ReloadBackendsConfig,
+    RenderPrompt,
     RouteToolCall,
+    StartBackendProcess,
     UnregisterBackend,
 )
+from mcp_server.config import RouterConfig
 from mcp_server.domain.entities import Backend
 from mcp_server.domain.repositories import BackendRepository, ConfigRepository
-from mcp_server.infrastructure.adapters import HTTPMCPClient, PortAllocator, UvxProcessManager
+from mcp_server.domain.value_objects import BackendConfig
+from mcp_server.infrastructure.adapters import (
+    FairRequestScheduler,
+    HTTPMCPClient,
+    JsonCapabilitySnapshot,
+    JsonLinesSpanExporter,
+    JsonSchemaArgumentValidator,
+    OtlpHttpSpanExporter,
+    PortAllocator,
+    PrometheusMetrics,
+    QueuedAccessLog,
+    SpanExporter,
+    SpanTracer,
+    TieredResourceCache,
+    TokenBucketRateLimiter,
+    UvxProcessManager,
+    WarmProcessPool,
+)
 from mcp_server.infrastructure.config.yaml_backend_config_repository import (
     YamlBackendConfigRepository,
 )
 from mcp_server.infrastructure.repositories import InMemoryBackendRepository
-from mcp_server.infrastructure.services import ConfigWatcher
+from mcp_server.infrastructure.services import (
+    CapabilitySnapshotWatcher,
+    ConfigWatcher,
+    LoopMonitor,
+    RuntimeProfiler,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,39 +76,216 @@ class CompositionRoot:
         max_retry_attempts: int = 3,
         retry_backoff_multiplier: float = 2.0,
         max_retry_backoff: int = 10,
+        warm_pool_size: int = 0,
+        readiness_timeout: int = 30,
+        startup_concurrency: int = 8,
+        port_range_start: int = 8100,
+        port_range_end: int = 8200,
+        config_debounce_ms: int = 300,
+        metrics_enabled: bool = True,
+        trace_sample_rate: float = 0.0,
+        trace_exporter: str = "jsonl",
+        trace_jsonl_path: str = "~/.mcp/traces.jsonl",
+        trace_otlp_endpoint: str = "http://localhost:4318/v1/traces",
+        profile_dir: str = "~/.mcp/profiles",
+        loop_lag_interval_ms: int = 100,
+        slow_callback_ms: int = 100,
+        access_log_path: str = "",
+        access_log_sample_rate: float = 1.0,
+        access_log_slow_ms: int = 1000,
+        capability_snapshot_path: str = "",
+        state_db_path: str = "",
+        leader_lease_seconds: int = 15,
+        resource_cache_mb: int = 32,
+        resource_cache_dir: str = "",
+        resource_cache_disk_mb: int = 256,
+        prompt_cache_seconds: float = 60.0,
     ) -> None:
         self.backends_config_path = str(Path(backends_config_path).expanduser())
         self.request_timeout = request_timeout
         self.max_retry_attempts = max_retry_attempts
         self.retry_backoff_multiplier = retry_backoff_multiplier
         self.max_retry_backoff = max_retry_backoff
+        self.warm_pool_size = warm_pool_size
+        self.readiness_timeout = readiness_timeout
+        self.startup_concurrency = startup_concurrency
+        self.port_range_start = port_range_start
+        self.port_range_end = port_range_end
+        self.config_debounce_ms = config_debounce_ms
+        self.metrics_enabled = metrics_enabled
+        self.trace_sample_rate = trace_sample_rate
+        self.trace_exporter = trace_exporter
+        self.trace_jsonl_path = trace_jsonl_path
+        self.trace_otlp_endpoint = trace_otlp_endpoint
+        self.profile_dir = profile_dir
+        self.loop_lag_interval_ms = loop_lag_interval_ms
+        self.slow_callback_ms = slow_callback_ms
+        self.access_log_path = access_log_path
+        self.access_log_sample_rate = access_log_sample_rate
+        self.access_log_slow_ms = access_log_slow_ms
+        self.capability_snapshot_path = capability_snapshot_path
+        self.state_db_path = state_db_path
+        self.leader_lease_seconds = leader_lease_seconds
+        self.resource_cache_mb = resource_cache_mb
+        self.resource_cache_dir = resource_cache_dir
+        self.resource_cache_disk_mb = resource_cache_disk_mb
+        self.prompt_cache_seconds = prompt_cache_seconds
+        self.startup_timeline: list[BackendStartupTimeline] = []
+        self.capability_listener: CapabilityListenerPort | None = None
 
         self._backend_repository: BackendRepository | None = None
         self._client_factory: dict[str, MCPClientPort] | None = None
+        self._argument_validator: ArgumentValidatorPort | None = None
+        self._metrics: MetricsPort | None = None
+        self._tracer: TracerPort | None = None
+        self._access_log: AccessLogPort | None = None
+        self._scheduler: RequestSchedulerPort | None = None
+        self._rate_limiter: RateLimiterPort | None = None
+        self._leader_lease: LeaderLeasePort | None = None
+        self._capability_snapshot: CapabilitySnapshotPort | None = None
         self._route_tool_call: RouteToolCall | None = None
+        self._resource_cache: ResourceCachePort | None = None
+        self._read_resource: ReadResource | None = None
+        self._render_prompt: RenderPrompt | None = None
         self._discover_capabilities: DiscoverCapabilities | None = None
         self._check_backend_health: CheckBackendHealth | None = None
         self._config_repository: ConfigRepository | None = None
         self._process_manager: ProcessManagerPort | None = None
         self._port_allocator: PortAllocatorPort | None = None
+        self._process_pool: ProcessPoolPort | None = None
+        self._start_backend_process: StartBackendProcess | None = None
         self._register_backend: RegisterBackend | None = None
         self._unregister_backend: UnregisterBackend | None = None
         self._reload_backends: ReloadBackendsConfig | None = None
         self._monitor_processes: MonitorBackendProcesses | None = None
         self._config_watcher: ConfigWatcher | None = None
+        self._capability_snapshot_watcher: CapabilitySnapshotWatcher | None = None
+        self._profiler: RuntimeProfiler | None = None
+        self._loop_monitor: LoopMonitor | None = None
+
+    @classmethod
+    def from_config(cls, config: RouterConfig) -> "CompositionRoot":
+        return cls(
+            backends_config_path=config.backends_config_path,
+            request_timeout=config.request_timeout,
+            max_retry_attempts=config.max_retry_attempts,
+            retry_backoff_multiplier=config.retry_backoff_multiplier,
+            max_retry_backoff=config.max_retry_backoff,
+            warm_pool_size=config.warm_pool_size,
+            readiness_timeout=config.readiness_timeout,
+            startup_concurrency=config.startup_concurrency,
+            port_range_start=config.port_range_start,
+            port_range_end=config.port_range_end,
+            config_debounce_ms=config.config_debounce_ms,
+            metrics_enabled=config.metrics_enabled,
+            trace_sample_rate=config.trace_sample_rate,
+            trace_exporter=config.trace_exporter,
+            trace_jsonl_path=config.trace_jsonl_path,
+            trace_otlp_endpoint=config.trace_otlp_endpoint,
+            profile_dir=config.profile_dir,
+            loop_lag_interval_ms=config.loop_lag_interval_ms,
+            slow_callback_ms=config.slow_callback_ms,
+            access_log_path=config.access_log_path,
+            access_log_sample_rate=config.access_log_sample_rate,
+            access_log_slow_ms=config.access_log_slow_ms,
+            capability_snapshot_path=config.capability_snapshot_path,
+            state_db_path=config.state_db_path,
+            leader_lease_seconds=config.leader_lease_seconds,
+            resource_cache_mb=config.resource_cache_mb,
+            resource_cache_dir=config.resource_cache_dir,
+            resource_cache_disk_mb=config.resource_cache_disk_mb,
+            prompt_cache_seconds=config.prompt_cache_seconds,
+        )
 
     @property
     def backend_repository(self) -> BackendRepository:
         if self._backend_repository is None:
-            self._backend_repository = InMemoryBackendRepository()
+            if self.state_db_path:
+                from mcp_server.infrastructure.repositories import (
+                    SqliteBackendRepository,
+                )
+
+                self._backend_repository = SqliteBackendRepository(
+                    self.state_db_path, owner=not self.is_worker
+                )
+            else:
+                self._backend_repository = InMemoryBackendRepository()
         return self._backend_repository
 
+    @property
+    def is_worker(self) -> bool:
+        return bool(self.capability_snapshot_path)
+
+    @property
+    def leader_lease(self) -> LeaderLeasePort | None:
+        if self._leader_lease is None and self.state_db_path and not self.is_worker:
+            from mcp_server.infrastructure.adapters import SqliteLeaderLease
+
+            self._leader_lease = SqliteLeaderLease(
+                self.state_db_path,
+                ttl_seconds=self.leader_lease_seconds,
+            )
+        return self._leader_lease
+
+    @property
+    def is_leader(self) -> bool:
+        if self.is_worker:
+            return False
+        return self.leader_lease is None or self.leader_lease.is_leader
+
     @property
     def client_factory(self) -> dict[str, MCPClientPort]:
         if self._client_factory is None:
             self._client_factory = {}
         return self._client_factory
 
+    @property
+    def argument_validator(self) -> ArgumentValidatorPort:
+        if self._argument_validator is None:
+            self._argument_validator = JsonSchemaArgumentValidator()
+        return self._argument_validator
+
+    @property
+    def metrics(self) -> MetricsPort | None:
+        if self._metrics is None and self.metrics_enabled:
+            self._metrics = PrometheusMetrics()
+        return self._metrics
+
+    @property
+    def tracer(self) -> TracerPort | None:
+        if self._tracer is None and self.trace_sample_rate > 0:
+            exporter: SpanExporter
+            if self.trace_exporter == "otlp":
+                exporter = OtlpHttpSpanExporter(endpoint=self.trace_otlp_endpoint)
+            elif self.trace_exporter == "jsonl":
+                exporter = JsonLinesSpanExporter(self.trace_jsonl_path)
+            else:
+                raise ValueError(f"Unknown trace exporter: {self.trace_exporter}")
+            self._tracer = SpanTracer(exporter, sample_rate=self.trace_sample_rate)
+        return self._tracer
+
+    @property
+    def access_log(self) -> AccessLogPort | None:
+        if self._access_log is None and self.access_log_path:
+            self._access_log = QueuedAccessLog(
+                self.access_log_path,
+                sample_rate=self.access_log_sample_rate,
+                slow_threshold_seconds=self.access_log_slow_ms / 1000,
+            )
+        return self._access_log
+
+    @property
+    def scheduler(self) -> RequestSchedulerPort:
+        if self._scheduler is None:
+            self._scheduler = FairRequestScheduler(metrics=self.metrics)
+        return self._scheduler
+
+    @property
+    def rate_limiter(self) -> RateLimiterPort:
+        if self._rate_limiter is None:
+            self._rate_limiter = TokenBucketRateLimiter(metrics=self.metrics)
+        return self._rate_limiter
+
     @property
     def route_tool_call(self) -> RouteToolCall:
         if self._route_tool_call is None:
@@ -77,23 +295,74 @@ class CompositionRoot:
                 max_retry_attempts=self.max_retry_attempts,
                 retry_backoff_multiplier=self.retry_backoff_multiplier,
                 max_retry_backoff=self.max_retry_backoff,
+                argument_validator=self.argument_validator,
+                metrics=self.metrics,
+                tracer=self.tracer,
+                access_log=self.access_log,
+                scheduler=self.scheduler,
+                rate_limiter=self.rate_limiter,
             )
         return self._route_tool_call
 
+    @property
+    def resource_cache(self) -> ResourceCachePort | None:
+        if self._resource_cache is None and self.resource_cache_mb > 0:
+            self._resource_cache = TieredResourceCache(
+                max_bytes=self.resource_cache_mb * 1024 * 1024,
+                disk_dir=self.resource_cache_dir,
+                disk_max_bytes=self.resource_cache_disk_mb * 1024 * 1024,
+            )
+        return self._resource_cache
+
+    @property
+    def read_resource(self) -> ReadResource:
+        if self._read_resource is None:
+            self._read_resource = ReadResource(
+                backend_repository=self.backend_repository,
+                client_factory=self.client_factory,
+                cache=self.resource_cache,
+                metrics=self.metrics,
+            )
+        return self._read_resource
+
+    @property
+    def render_prompt(self) -> RenderPrompt:
+        if self._render_prompt is None:
+            self._render_prompt = RenderPrompt(
+                client_factory=self.client_factory,
+                ttl_seconds=self.prompt_cache_seconds,
+                metrics=self.metrics,
+            )
+        return self._render_prompt
+
     @property
     def discover_capabilities(self) -> DiscoverCapabilities:
         if self._discover_capabilities is None:
             self._discover_capabilities = DiscoverCapabilities(
                 backend_repository=self.backend_repository,
                 client_factory=self.client_factory,
+                capability_listener=self.capability_listener,
+                argument_validator=self.argument_validator,
+                metrics=self.metrics,
+                capability_snapshot=self.capability_snapshot,
             )
         return self._discover_capabilities
 
+    @property
+    def capability_snapshot(self) -> CapabilitySnapshotPort | None:
+        if self._capability_snapshot is None and self.is_worker:
+            self._capability_snapshot = JsonCapabilitySnapshot(
+                self.capability_snapshot_path,
+                debounce_ms=self.config_debounce_ms,
+            )
+        return self._capability_snapshot
+
     @property
     def check_backend_health(self) -> CheckBackendHealth:
         if self._check_backend_health is None:
             self._check_backend_health = CheckBackendHealth(
                 backend_repository=self.backend_repository,
+                metrics=self.metrics,
             )
         return self._check_backend_health
 
@@ -101,22 +370,53 @@ class CompositionRoot:
     def config_repository(self) -> ConfigRepository:
         if self._config_repository is None:
             self._config_repository = YamlBackendConfigRepository(
-                self.backends_config_path
+                self.backends_config_path,
+                debounce_ms=self.config_debounce_ms,
             )
         return self._config_repository
 
     @property
     def process_manager(self) -> ProcessManagerPort:
         if self._process_manager is None:
-            self._process_manager = UvxProcessManager()
+            self._process_manager = UvxProcessManager(
+                port_allocator=self.port_allocator,
+            )
         return self._process_manager
 
     @property
     def port_allocator(self) -> PortAllocatorPort:
         if self._port_allocator is None:
-            self._port_allocator = PortAllocator()
+            self._port_allocator = PortAllocator(
+                start_port=self.port_range_start,
+                end_port=self.port_range_end,
+            )
         return self._port_allocator
 
+    @property
+    def process_pool(self) -> ProcessPoolPort | None:
+        if self._process_pool is None and self.warm_pool_size > 0:
+            self._process_pool = WarmProcessPool(
+                process_manager=self.process_manager,
+                port_allocator=self.port_allocator,
+                size=self.warm_pool_size,
+                readiness_timeout=self.readiness_timeout,
+            )
+        return self._process_pool
+
+    @property
+    def start_backend_process(self) -> StartBackendProcess:
+        if self._start_backend_process is None:
+            self._start_backend_process = StartBackendProcess(
+                process_manager=self.process_manager,
+                port_allocator=self.port_allocator,
+                client_factory=self.client_factory,
+                process_pool=self.process_pool,
+                request_timeout=self.request_timeout,
+                readiness_timeout=self.readiness_timeout,
+                metrics=self.metrics,
+            )
+        return self._start_backend_process
+
     @property
     def register_backend(self) -> RegisterBackend:
         if self._register_backend is None:
@@ -127,6 +427,7 @@ class CompositionRoot:
                 port_allocator=self.port_allocator,
                 client_factory=self.client_factory,
                 discover_capabilities=self.discover_capabilities,
+                start_backend_process=self.start_backend_process,
             )
         return self._register_backend
 
@@ -139,6 +440,8 @@ class CompositionRoot:
                 process_manager=self.process_manager,
                 port_allocator=self.port_allocator,
                 client_factory=self.client_factory,
+                capability_listener=self.capability_listener,
+                argument_validator=self.argument_validator,
             )
         return self._unregister_backend
 
@@ -150,6 +453,7 @@ class CompositionRoot:
                 config_repository=self.config_repository,
                 register_backend=self.register_backend,
                 unregister_backend=self.unregister_backend,
+                capability_listener=self.capability_listener,
             )
         return self._reload_backends
 
@@ -159,6 +463,8 @@ class CompositionRoot:
             self._monitor_processes = MonitorBackendProcesses(
                 backend_repository=self.backend_repository,
                 process_manager=self.process_manager,
+                start_backend_process=self.start_backend_process,
+                metrics=self.metrics,
             )
         return self._monitor_processes
 
@@ -171,34 +477,106 @@ class CompositionRoot:
             )
         return self._config_watcher
 
-    async def initialize_backends(self) -> None:
+    @property
+    def capability_snapshot_watcher(self) -> CapabilitySnapshotWatcher | None:
+        if self._capability_snapshot_watcher is None and self.capability_snapshot:
+            self._capability_snapshot_watcher = CapabilitySnapshotWatcher(
+                capability_snapshot=self.capability_snapshot,
+                backend_repository=self.backend_repository,
+                discover_capabilities=self.discover_capabilities,
+            )
+        return self._capability_snapshot_watcher
+
+    @property
+    def profiler(self) -> RuntimeProfiler:
+        if self._profiler is None:
+            self._profiler = RuntimeProfiler(self.profile_dir)
+        return self._profiler
+
+    @property
+    def loop_monitor(self) -> LoopMonitor | None:
+        if self._loop_monitor is None and self.loop_lag_interval_ms > 0:
+            self._loop_monitor = LoopMonitor(
+                metrics=self.metrics,
+                interval_seconds=self.loop_lag_interval_ms / 1000,
+                slow_threshold_seconds=self.slow_callback_ms / 1000,
+            )
+        return self._loop_monitor
+
+    async def initialize_backends(self) -> list[BackendStartupTimeline]:
         logger.info(f"Loading backends from: {self.backends_config_path}")
 
         configs = await self.config_repository.load_configs()
         logger.info(f"Loaded {len(configs)} backend configurations")
 
-        for config in configs:
-            backend = Backend(config=config)
+        snapshot = None
+        if self.capability_snapshot:
+            snapshot = await self.capability_snapshot.load()
+        semaphore = asyncio.Semaphore(self.startup_concurrency)
+        started_at = time.perf_counter()
+        results = await asyncio.gather(
+            *(
+                self._initialize_backend(config, semaphore, started_at, snapshot)
+                for config in configs
+            )
+        )
+
+        for timeline, backend in results:
+            logger.info(_format_timeline(timeline))
+            if backend:
+                self.backend_repository.add(backend)
+
+        self.startup_timeline = [timeline for timeline, _ in results]
+        succeeded = sum(1 for timeline in self.startup_timeline if timeline.succeeded)
+        logger.info(
+            f"Initialized {succeeded}/{len(configs)} backends "
+            f"in {time.perf_counter() - started_at:.2f}s"
+        )
+        return self.startup_timeline
 
-            if config.source.process_config and config.auto_start:
-                try:
-                    pid = await self.process_manager.start_process(
-                        config.source.process_config
+    async def _initialize_backend(
+        self,
+        config: BackendConfig,
+        semaphore: asyncio.Semaphore,
+        started_at: float,
+        snapshot: CapabilitySnapshot | None = None,
+    ) -> tuple[BackendStartupTimeline, Backend | None]:
+        timeline = BackendStartupTimeline(backend_name=config.name)
+        backend = Backend(config=config)
+
+        async with semaphore:
+            try:
+                if config.source.process_config and config.auto_start:
+                    await self.start_backend_process.spawn(backend)
+                    timeline.spawned_seconds = time.perf_counter() - started_at
+                    await self.start_backend_process.wait_until_ready(backend)
+                    timeline.ready_seconds = time.perf_counter() - started_at
+
+                client = HTTPMCPClient(
+                    base_url=backend.config.url,
+                    timeout=self.request_timeout,
+                )
+                self.client_factory[config.name] = client
+
+                if snapshot is not None:
+                    await self.discover_capabilities.apply_snapshot(backend, snapshot)
+                else:
+                    await self.discover_capabilities.execute_for_backend(
+                        backend, client
                     )
-                    backend.process_id = pid
-                    logger.info(f"Started process for {config.name} (PID: {pid})")
-                except Exception as e:
-                    logger.error(f"Failed to start {config.name}: {e}")
-                    continue
+                timeline.discovered_seconds = time.perf_counter() - started_at
+            except Exception as e:
+                logger.error(f"Failed to start {config.name}: {e}")
+                timeline.error = str(e)
+                self.client_factory.pop(config.name, None)
+                if backend.process_id:
+                    await self.process_manager.stop_process(backend.process_id)
+                return timeline, None
 
-            client = HTTPMCPClient(
-                base_url=config.url,
-                timeout=self.request_timeout,
-            )
-            self.client_factory[config.name] = client
+            if not backend.health_status.is_healthy:
+                timeline.error = backend.health_status.last_error
 
-            self.backend_repository.add(backend)
-            logger.debug(f"Initialized backend: {config.name}")
+        return timeline, backend
 
     async def shutdown(self) -> None:
         logger.info("Shutting down composition root")
@@ -206,5 +584,40 @@ class CompositionRoot:
         if self._config_watcher:
             await self._config_watcher.stop()
 
+        if self._capability_snapshot_watcher:
+            await self._capability_snapshot_watcher.stop()
+
+        if self._loop_monitor:
+            await self._loop_monitor.stop()
+
+        if self._process_pool:
+            await self._process_pool.shutdown()
+
         if self._process_manager:
             await self._process_manager.shutdown_all()
+
+        if self._tracer:
+            await self._tracer.flush()
+
+        if self._access_log:
+            await self._access_log.close()
+
+        if self._leader_lease:
+            self._leader_lease.release()
+
+        if self._backend_repository:
+            self._backend_repository.close()
+
+
+def _format_timeline(timeline: BackendStartupTimeline) -> str:
+    def seconds(value: float | None) -> str:
+        return "-" if value is None else f"{value:.3f}s"
+
+    line = (
+        f"Startup {timeline.backend_name}: spawned={seconds(timeline.spawned_seconds)} "
+        f"ready={seconds(timeline.ready_seconds)} "
+        f"discovered={seconds(timeline.discovered_seconds)}"
+    )
+    if timeline.error:
+        line += f" error={timeline.error}"
+    return line
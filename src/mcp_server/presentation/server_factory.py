@@ -1,11 +1,23 @@
 import asyncio
+import hmac
 import logging
 from typing import Any
 
 from fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import Response
 
 from mcp_server.application.dtos import ToolCallRequest
+from mcp_server.application.ports import LeaderLeasePort, MetricsPort, TracerPort
 from mcp_server.config import RouterConfig, ServerConfig
+from mcp_server.domain.services import ToolSearchIndex
+from mcp_server.infrastructure.services import LoopMonitor, RuntimeProfiler
+from mcp_server.presentation.capability_catalog import CapabilityCatalog
+from mcp_server.presentation.capability_registrar import (
+    CapabilityRegistrar,
+    SessionTracker,
+    caller_identity,
+)
 from mcp_server.presentation.composition_root import CompositionRoot
 from mcp_server.prompts import register_prompts
 from mcp_server.resources import register_resources
@@ -13,6 +25,10 @@ from mcp_server.tools import register_tools
 
 logger = logging.getLogger(__name__)
 
+TOOL_EXPOSURE_MODES = ("direct", "search")
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LOOPBACK_HOSTS = frozenset({"127.0.0.1", "::1"})
+
 
 def create_server(config: ServerConfig | None = None) -> FastMCP:
     config = config or ServerConfig.from_env()
@@ -29,39 +45,59 @@ async def create_router_server(config: RouterConfig | None = None) -> FastMCP:
 
     logger.info(f"Creating router server: {config.name}")
 
-    composition_root = CompositionRoot(
-        backends_config_path=config.backends_config_path,
-        request_timeout=config.request_timeout,
-        max_retry_attempts=config.max_retry_attempts,
-        retry_backoff_multiplier=config.retry_backoff_multiplier,
-        max_retry_backoff=config.max_retry_backoff,
+    composition_root = CompositionRoot.from_config(config)
+
+    if config.tool_exposure not in TOOL_EXPOSURE_MODES:
+        raise ValueError(f"Invalid tool exposure mode: {config.tool_exposure}")
+
+    search_index = ToolSearchIndex()
+    session_tracker = SessionTracker()
+    server.add_middleware(session_tracker)
+    registrar = CapabilityRegistrar(
+        server=server,
+        route_tool_call=composition_root.route_tool_call,
+        read_resource=composition_root.read_resource,
+        render_prompt=composition_root.render_prompt,
+        enable_namespace_prefixing=config.enable_namespace_prefixing,
+        session_tracker=session_tracker,
+        search_index=search_index,
+        expose_tools=config.tool_exposure == "direct",
     )
+    composition_root.capability_listener = registrar
 
-    logger.info("Initializing backends...")
+    logger.info("Initializing backends and discovering capabilities...")
     await composition_root.initialize_backends()
-
-    logger.info("Discovering backend capabilities...")
-    await composition_root.discover_capabilities.execute()
-
-    await _register_proxied_tools(
-        server,
-        composition_root,
-        config.enable_namespace_prefixing,
+    logger.info(
+        f"Registered {registrar.tool_count} proxied tools, "
+        f"{registrar.resource_count} proxied resources and "
+        f"{registrar.prompt_count} proxied prompts"
     )
 
-    await _register_proxied_resources(
-        server,
-        composition_root,
-        config.enable_namespace_prefixing,
-    )
-
-    await _register_proxied_prompts(
+    _register_router_tools(server, composition_root)
+    _register_backend_notifications(server, registrar, config.notification_token)
+    _register_profiling_tools(server, composition_root.profiler)
+    if composition_root.loop_monitor:
+        _register_loop_health_tool(server, composition_root.loop_monitor)
+    _register_catalog(
         server,
-        composition_root,
-        config.enable_namespace_prefixing,
+        CapabilityCatalog(
+            composition_root.backend_repository,
+            config.enable_namespace_prefixing,
+            metrics=composition_root.metrics,
+        ),
     )
-
-    _register_router_tools(server, composition_root)
+    if composition_root.metrics:
+        _register_metrics(server, composition_root.metrics)
+    if config.tool_exposure == "search":
+        _register_search_tools(server, composition_root, search_index)
+
+    if composition_root.leader_lease:
+        asyncio.create_task(
+            _run_leader_lease(
+                composition_root.leader_lease,
+                interval=config.leader_lease_seconds / 3,
+            )
+        )
 
     asyncio.create_task(
         _run_health_checker(
@@ -72,7 +108,14 @@ async def create_router_server(config: RouterConfig | None = None) -> FastMCP:
 
     asyncio.create_task(_run_process_monitor(composition_root, interval=30))
 
+    if composition_root.tracer:
+        asyncio.create_task(_run_trace_exporter(composition_root.tracer, interval=5))
+
     await composition_root.config_watcher.start()
+    if composition_root.capability_snapshot_watcher:
+        await composition_root.capability_snapshot_watcher.start()
+    if composition_root.loop_monitor:
+        await composition_root.loop_monitor.start()
 
     _register_shutdown_handler(composition_root)
 
@@ -81,139 +124,6 @@ async def create_router_server(config: RouterConfig | None = None) -> FastMCP:
     return server
 
 
-async def _register_proxied_tools(
-    server: FastMCP,
-    composition_root: CompositionRoot,
-    enable_namespace_prefixing: bool,
-) -> None:
-    tool_count = 0
-    backends = composition_root.backend_repository.get_all()
-
-    for backend in backends:
-        # Skip tool registration for backends with auto_start disabled
-        # This allows backends with incompatible tools (e.g., **kwargs) to be configured
-        # without crashing the router at startup
-        if not backend.config.auto_start:
-            logger.info(
-                f"Skipping tool registration for backend '{backend.config.name}' "
-                f"(auto_start=false)"
-            )
-            continue
-
-        for tool_info in backend.tools:
-            original_name = tool_info.get("name")
-            if not original_name:
-                continue
-
-            proxied_name = (
-                f"{backend.config.namespace}.{original_name}"
-                if enable_namespace_prefixing
-                else original_name
-            )
-
-            def make_proxy(tool_name: str, display_name: str):
-                async def proxy_tool(**kwargs: Any) -> Any:
-                    request = ToolCallRequest(
-                        tool_name=tool_name,
-                        arguments=kwargs,
-                    )
-                    response = await composition_root.route_tool_call.execute(request)
-                    return response.result
-
-                return proxy_tool
-
-            proxy_fn = make_proxy(original_name, proxied_name)
-            proxy_fn.__name__ = proxied_name.replace(".", "_")
-            description = tool_info.get("description", "")
-
-            server.tool(
-                name=proxied_name,
-                description=description,
-            )(proxy_fn)
-
-            tool_count += 1
-            logger.debug(f"Registered proxied tool: {proxied_name}")
-
-    logger.info(f"Registered {tool_count} proxied tools")
-
-
-async def _register_proxied_resources(
-    server: FastMCP,
-    composition_root: CompositionRoot,
-    enable_namespace_prefixing: bool,
-) -> None:
-    resource_count = 0
-    backends = composition_root.backend_repository.get_all()
-
-    for backend in backends:
-        # Skip resource registration for backends with auto_start disabled
-        if not backend.config.auto_start:
-            logger.info(
-                f"Skipping resource registration for backend '{backend.config.name}' "
-                f"(auto_start=false)"
-            )
-            continue
-
-        for resource_info in backend.resources:
-            original_uri = resource_info.get("uri")
-            if not original_uri:
-                continue
-
-            proxied_uri = (
-                f"{backend.config.namespace}://{original_uri}"
-                if enable_namespace_prefixing
-                else original_uri
-            )
-
-            def make_resource_proxy(backend_name: str, uri: str):
-                async def proxy_resource() -> str:
-                    client = composition_root.client_factory.get(backend_name)
-                    if not client:
-                        raise ValueError(f"Backend not found: {backend_name}")
-                    return await client.get_resource(uri)
-
-                return proxy_resource
-
-            proxy_fn = make_resource_proxy(backend.name, original_uri)
-            description = resource_info.get("description", "")
-
-            server.resource(
-                uri_template=proxied_uri,
-                description=description,
-            )(proxy_fn)
-
-            resource_count += 1
-            logger.debug(f"Registered proxied resource: {proxied_uri}")
-
-    logger.info(f"Registered {resource_count} proxied resources")
-
-
-async def _register_proxied_prompts(
-    server: FastMCP,
-    composition_root: CompositionRoot,
-    enable_namespace_prefixing: bool,
-) -> None:
-    prompt_count = 0
-    backends = composition_root.backend_repository.get_all()
-
-    for backend in backends:
-        for prompt_info in backend.prompts:
-            original_name = prompt_info.get("name")
-            if not original_name:
-                continue
-
-            proxied_name = (
-                f"{backend.config.namespace}.{original_name}"
-                if enable_namespace_prefixing
-                else original_name
-            )
-
-            logger.debug(f"Registered proxied prompt: {proxied_name}")
-            prompt_count += 1
-
-    logger.info(f"Registered {prompt_count} proxied prompts")
-
-
 def _register_router_tools(
     server: FastMCP,
     composition_root: CompositionRoot,
@@ -248,8 +158,30 @@ def _register_router_tools(
             "circuit_state": backend.health_status.circuit_state.value,
             "error_count": backend.health_status.error_count,
             "last_error": backend.health_status.last_error,
+            "requests": backend.latency.count,
+            "latency_ewma_ms": round(backend.latency.ewma_seconds * 1000, 3),
+            "latency_max_ms": round(backend.latency.max_seconds * 1000, 3),
         }
 
+    @server.tool
+    def get_startup_timeline() -> list[dict[str, Any]]:
+        """
+        Show per-backend startup timings from the last router start.
+
+        Times are seconds since startup began for process spawn, readiness
+        and capability discovery.
+        """
+        return [
+            {
+                "name": timeline.backend_name,
+                "spawned_seconds": timeline.spawned_seconds,
+                "ready_seconds": timeline.ready_seconds,
+                "discovered_seconds": timeline.discovered_seconds,
+                "error": timeline.error,
+            }
+            for timeline in composition_root.startup_timeline
+        ]
+
     @server.tool
     async def register_backend(
         source: str,
@@ -309,7 +241,8 @@ def _register_router_tools(
         """
         Reload backend configuration from file.
 
-        Adds new backends, removes deleted ones, and updates changed configurations.
+        Adds new backends, removes deleted ones, and updates changed configurations
+        in place. Backends are restarted only when their source or process changed.
         """
         results = await composition_root.reload_backends.execute()
         return results
@@ -317,13 +250,194 @@ def _register_router_tools(
     logger.info("Registered router management tools")
 
 
+def _register_backend_notifications(
+    server: FastMCP, registrar: CapabilityRegistrar, token: str = ""
+) -> None:
+    @server.custom_route("/backends/{backend_name}/notifications", methods=["POST"])
+    async def post_backend_notification(request: Request) -> Response:
+        if not _notification_allowed(request, token):
+            return Response("Unauthorized", status_code=401)
+        try:
+            message = await request.json()
+        except ValueError:
+            message = None
+        if not isinstance(message, dict):
+            return Response("Expected a JSON-RPC notification", status_code=400)
+
+        if message.get("method") == "notifications/resources/updated":
+            uri = (message.get("params") or {}).get("uri")
+            if not uri:
+                return Response("Missing params.uri", status_code=400)
+            await registrar.resource_updated(request.path_params["backend_name"], uri)
+        return Response(status_code=202)
+
+
+def _notification_allowed(request: Request, token: str) -> bool:
+    if token:
+        supplied = request.headers.get("authorization", "")
+        return hmac.compare_digest(supplied.encode(), f"Bearer {token}".encode())
+    return request.client is not None and request.client.host in LOOPBACK_HOSTS
+
+
+def _register_loop_health_tool(server: FastMCP, loop_monitor: LoopMonitor) -> None:
+    @server.tool
+    def get_event_loop_health(limit: int = 20) -> dict[str, Any]:
+        """
+        Show event loop lag and recent stalls with the blocked task and stack.
+
+        Args:
+            limit: Maximum number of recent stalls to return
+        """
+        return loop_monitor.snapshot(limit)
+
+
+def _register_profiling_tools(server: FastMCP, profiler: RuntimeProfiler) -> None:
+    @server.tool
+    async def profile_cpu(
+        duration_seconds: float = 10.0,
+        interval_ms: float = 10.0,
+        top: int = 20,
+    ) -> dict[str, Any]:
+        """
+        Sample the live router's CPU stacks and asyncio tasks for a bounded time.
+
+        Args:
+            duration_seconds: How long to sample (capped at 300 seconds)
+            interval_ms: Time between samples in milliseconds
+            top: Number of frames to return in each summary
+        """
+        return await profiler.profile_cpu(duration_seconds, interval_ms, top)
+
+    @server.tool
+    async def profile_heap(
+        duration_seconds: float = 30.0,
+        top: int = 20,
+    ) -> dict[str, Any]:
+        """
+        Diff tracemalloc heap snapshots taken at the start and end of a window.
+
+        Args:
+            duration_seconds: Length of the window (capped at 300 seconds)
+            top: Number of allocation sites to return
+        """
+        return await profiler.profile_heap(duration_seconds, top)
+
+
+def _register_catalog(server: FastMCP, catalog: CapabilityCatalog) -> None:
+    @server.custom_route("/catalog", methods=["GET"])
+    async def get_catalog(request: Request) -> Response:
+        snapshot = catalog.snapshot()
+        headers = {"ETag": snapshot.etag}
+        if request.headers.get("if-none-match") == snapshot.etag:
+            return Response(status_code=304, headers=headers)
+        return Response(snapshot.body, media_type="application/json", headers=headers)
+
+    @server.tool
+    def get_capability_catalog(version: str | None = None) -> dict[str, Any]:
+        """
+        Get the aggregated tool, resource and prompt catalog of all backends.
+
+        Args:
+            version: Catalog version from a previous call; if it is still current
+                only the version is returned with not_modified set
+        """
+        if catalog.is_current(version):
+            return {"version": catalog.snapshot().version, "not_modified": True}
+        return {**catalog.snapshot().data, "not_modified": False}
+
+
+def _register_metrics(server: FastMCP, metrics: MetricsPort) -> None:
+    @server.custom_route("/metrics", methods=["GET"])
+    async def get_metrics(request: Request) -> Response:
+        return Response(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+def _register_search_tools(
+    server: FastMCP,
+    composition_root: CompositionRoot,
+    search_index: ToolSearchIndex,
+) -> None:
+    @server.tool
+    def search_tools(query: str, limit: int = 10) -> list[dict[str, Any]]:
+        """
+        Search the proxied backend tools by keyword.
+
+        Args:
+            query: Words to match against tool names, descriptions and parameters
+            limit: Maximum number of results (default: 10)
+        """
+        return [
+            {
+                "name": hit.name,
+                "backend": hit.backend_name,
+                "description": hit.description,
+                "score": round(hit.score, 4),
+            }
+            for hit in search_index.search(query, limit)
+        ]
+
+    @server.tool
+    def describe_tool(name: str) -> dict[str, Any]:
+        """
+        Show the description and input schema of a proxied tool.
+
+        Args:
+            name: Tool name as returned by search_tools
+        """
+        hit = search_index.get(name)
+        if not hit:
+            raise ValueError(f"Tool not found: {name}")
+
+        return {
+            "name": hit.name,
+            "backend": hit.backend_name,
+            "description": hit.description,
+            "inputSchema": hit.tool_info.get("inputSchema", {}),
+        }
+
+    @server.tool
+    async def call_tool(name: str, arguments: dict[str, Any] | None = None) -> Any:
+        """
+        Call a proxied tool by name.
+
+        Args:
+            name: Tool name as returned by search_tools
+            arguments: Tool arguments matching the schema from describe_tool
+        """
+        hit = search_index.get(name)
+        if not hit:
+            raise ValueError(f"Tool not found: {name}")
+
+        client_id, session_id = caller_identity()
+        request = ToolCallRequest(
+            tool_name=hit.tool_info["name"],
+            arguments=arguments or {},
+            client_id=client_id,
+            session_id=session_id,
+        )
+        response = await composition_root.route_tool_call.execute(request)
+        return response.result
+
+    logger.info(f"Registered tool search over {len(search_index)} tools")
+
+
 async def _run_health_checker(
     composition_root: CompositionRoot,
     interval: int,
 ) -> None:
     while True:
         await asyncio.sleep(interval)
-        await composition_root.check_backend_health.execute()
+        if composition_root.is_leader:
+            await composition_root.check_backend_health.execute()
+
+
+async def _run_leader_lease(lease: LeaderLeasePort, interval: float) -> None:
+    while True:
+        try:
+            await lease.renew()
+        except Exception as e:
+            logger.error(f"Leader lease renewal error: {e}", exc_info=True)
+        await asyncio.sleep(interval)
 
 
 async def _run_process_monitor(composition_root: CompositionRoot, interval: int) -> None:
@@ -335,6 +449,12 @@ async def _run_process_monitor(composition_root: CompositionRoot, interval: int)
             logger.error(f"Process monitor error: {e}", exc_info=True)
 
 
+async def _run_trace_exporter(tracer: TracerPort, interval: int) -> None:
+    while True:
+        await asyncio.sleep(interval)
+        await tracer.flush()
+
+
 def _register_shutdown_handler(composition_root: CompositionRoot) -> None:
     import atexit
 
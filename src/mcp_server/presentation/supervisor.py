@@ -0,0 +1,354 @@
+import asyncio
+import logging
+import os
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from mcp_server.config import RouterConfig
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.value_objects import (
+    BackendConfig,
+    BackendSource,
+    BackendSourceType,
+)
+from mcp_server.infrastructure.adapters import JsonCapabilitySnapshot
+from mcp_server.infrastructure.config.yaml_backend_config_repository import (
+    YamlBackendConfigRepository,
+)
+from mcp_server.presentation.composition_root import CompositionRoot
+
+if TYPE_CHECKING:
+    import uvicorn
+
+logger = logging.getLogger(__name__)
+
+SOCKET_FD_ENV = "MCP_WORKER_SOCKET_FD"
+READY_FD_ENV = "MCP_WORKER_READY_FD"
+WORKER_COMMAND = "from mcp_server.server import main_router; main_router()"
+LISTEN_BACKLOG = 2048
+
+
+@dataclass
+class WorkerProcess:
+    slot: int
+    process: asyncio.subprocess.Process
+    started_at: float
+    ready: bool = False
+    exited_at: float | None = None
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    @property
+    def running(self) -> bool:
+        return self.process.returncode is None
+
+
+class RouterSupervisor:
+    def __init__(
+        self,
+        config: RouterConfig,
+        host: str,
+        port: int,
+        workers: int,
+        ready_timeout: float = 60.0,
+        grace_seconds: float = 30.0,
+        max_restart_backoff: float = 30.0,
+        check_interval: float = 1.0,
+    ) -> None:
+        self.state_dir = Path(tempfile.mkdtemp(prefix="mcp-router-"))
+        self.config = replace(
+            config,
+            state_db_path=config.state_db_path or str(self.state_dir / "state.db"),
+        )
+        self.host = host
+        self.port = port
+        self.worker_count = workers
+        self.ready_timeout = ready_timeout
+        self.grace_seconds = grace_seconds
+        self.max_restart_backoff = max_restart_backoff
+        self.check_interval = check_interval
+        self.composition_root = CompositionRoot.from_config(self.config)
+        self.workers: dict[int, WorkerProcess] = {}
+        self.restarts: dict[int, int] = {}
+        self._socket: socket.socket | None = None
+        self._exported: tuple[tuple[str, str, str], ...] | None = None
+        self._stopping = asyncio.Event()
+        self._reload_requested = asyncio.Event()
+        self._worker_config = YamlBackendConfigRepository(
+            str(self.state_dir / "backends.yaml")
+        )
+        self._capability_snapshot = JsonCapabilitySnapshot(
+            str(self.state_dir / "capabilities.json")
+        )
+
+    @property
+    def capability_snapshot_path(self) -> Path:
+        return self._capability_snapshot.path
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self._stopping.set)
+        loop.add_signal_handler(signal.SIGHUP, self._reload_requested.set)
+
+        self._socket = _listen(self.host, self.port)
+        logger.info(
+            f"Supervisor listening on {self.host}:{self.port} "
+            f"with {self.worker_count} workers"
+        )
+        try:
+            await self._renew_lease()
+            await self.composition_root.initialize_backends()
+            await self.export_worker_state()
+            await asyncio.gather(
+                *(self._start_worker(slot) for slot in range(self.worker_count))
+            )
+            await self.composition_root.config_watcher.start()
+            await self._supervise()
+        finally:
+            await self._stop_workers()
+            await self.composition_root.shutdown()
+            self._socket.close()
+            shutil.rmtree(self.state_dir, ignore_errors=True)
+
+    async def export_worker_state(self) -> bool:
+        backends = self.composition_root.backend_repository.get_all()
+        fingerprint = tuple(
+            (b.name, b.config.url, b.capabilities_hash)
+            for b in sorted(backends, key=lambda b: b.name)
+        )
+        if fingerprint == self._exported:
+            return False
+
+        await self._capability_snapshot.save(
+            {
+                b.name: {
+                    "tools": b.tools,
+                    "resources": b.resources,
+                    "prompts": b.prompts,
+                }
+                for b in backends
+                if b.health_status.is_healthy
+            }
+        )
+        await self._worker_config.replace_configs([_worker_view(b) for b in backends])
+        self._exported = fingerprint
+        logger.info(f"Exported {len(backends)} backends to workers")
+        return True
+
+    async def rolling_restart(self) -> bool:
+        logger.info("Restarting workers")
+        for slot in sorted(self.workers):
+            previous = self.workers[slot]
+            replacement = await self._start_worker(slot)
+            if not replacement.ready:
+                self.workers[slot] = previous
+                logger.error(
+                    f"Replacement for worker {slot} did not become ready; keeping "
+                    f"pid {previous.pid} and aborting the restart"
+                )
+                return False
+            await self._terminate(previous)
+        return True
+
+    async def _supervise(self) -> None:
+        lease_renewal = asyncio.create_task(self._keep_lease())
+        try:
+            await self._supervise_workers()
+        finally:
+            lease_renewal.cancel()
+
+    async def _keep_lease(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval)
+            await self._renew_lease()
+
+    async def _supervise_workers(self) -> None:
+        next_health_check = time.monotonic() + self.config.health_check_interval
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(
+                    self._stopping.wait(), timeout=self.check_interval
+                )
+                break
+            except TimeoutError:
+                pass
+
+            if self._reload_requested.is_set():
+                self._reload_requested.clear()
+                await self.rolling_restart()
+
+            for slot, worker in list(self.workers.items()):
+                if not worker.running:
+                    await self._restart_worker(slot, worker)
+
+            if time.monotonic() >= next_health_check:
+                next_health_check = time.monotonic() + self.config.health_check_interval
+                try:
+                    if self.composition_root.is_leader:
+                        await self.composition_root.check_backend_health.execute()
+                    await self.composition_root.monitor_processes.execute()
+                except Exception as e:
+                    logger.error(f"Supervisor health check error: {e}", exc_info=True)
+
+            await self.export_worker_state()
+
+    async def _renew_lease(self) -> None:
+        lease = self.composition_root.leader_lease
+        if not lease:
+            return
+        try:
+            await lease.renew()
+        except Exception as e:
+            logger.error(f"Leader lease renewal error: {e}", exc_info=True)
+
+    async def _restart_worker(self, slot: int, worker: WorkerProcess) -> None:
+        if worker.exited_at is None:
+            worker.exited_at = time.monotonic()
+            if worker.exited_at - worker.started_at > self.max_restart_backoff * 2:
+                self.restarts[slot] = 0
+        attempt = self.restarts.get(slot, 0)
+        delay = min(2**attempt - 1, self.max_restart_backoff)
+        if time.monotonic() - worker.exited_at < delay:
+            return
+        self.restarts[slot] = attempt + 1
+        logger.warning(
+            f"Worker {slot} (pid {worker.pid}) exited with code "
+            f"{worker.process.returncode}; restarting"
+        )
+        await self._start_worker(slot)
+
+    async def _start_worker(self, slot: int) -> WorkerProcess:
+        assert self._socket is not None
+        ready_read, ready_write = os.pipe()
+        env = {
+            **os.environ,
+            SOCKET_FD_ENV: str(self._socket.fileno()),
+            READY_FD_ENV: str(ready_write),
+            "MCP_WORKERS": "1",
+            "MCP_BACKENDS_CONFIG": str(self._worker_config.config_path),
+            "MCP_CAPABILITY_SNAPSHOT": str(self.capability_snapshot_path),
+            "MCP_STATE_DB": self.config.state_db_path,
+        }
+        try:
+            process = await asyncio.create_subprocess_exec(
+                sys.executable,
+                "-c",
+                WORKER_COMMAND,
+                env=env,
+                pass_fds=(self._socket.fileno(), ready_write),
+            )
+        finally:
+            os.close(ready_write)
+
+        worker = WorkerProcess(slot=slot, process=process, started_at=time.monotonic())
+        self.workers[slot] = worker
+        worker.ready = await _wait_ready(ready_read, self.ready_timeout)
+        if worker.ready:
+            logger.info(f"Worker {slot} ready (pid {process.pid})")
+        elif worker.running:
+            logger.error(f"Worker {slot} (pid {process.pid}) did not become ready")
+            await self._terminate(worker)
+        return worker
+
+    async def _terminate(self, worker: WorkerProcess) -> None:
+        if not worker.running:
+            return
+        worker.process.terminate()
+        try:
+            await asyncio.wait_for(worker.process.wait(), timeout=self.grace_seconds)
+        except TimeoutError:
+            logger.warning(f"Worker {worker.slot} (pid {worker.pid}) killed")
+            worker.process.kill()
+            await worker.process.wait()
+
+    async def _stop_workers(self) -> None:
+        await asyncio.gather(
+            *(self._terminate(worker) for worker in self.workers.values())
+        )
+
+
+def run_supervisor(config: RouterConfig, host: str, port: int) -> None:
+    workers = config.workers or os.cpu_count() or 1
+    asyncio.run(RouterSupervisor(config, host, port, workers).run())
+
+
+def run_worker() -> None:
+    listener = socket.socket(fileno=int(os.environ[SOCKET_FD_ENV]))
+    ready_fd = int(os.environ[READY_FD_ENV])
+    asyncio.run(_serve_worker(listener, ready_fd))
+
+
+async def _serve_worker(listener: socket.socket, ready_fd: int) -> None:
+    import fastmcp
+    import uvicorn
+
+    from mcp_server.presentation.server_factory import create_router_server
+
+    router = await create_router_server()
+    app = router.http_app(transport="streamable-http", stateless_http=True)
+    server = uvicorn.Server(
+        uvicorn.Config(
+            app,
+            lifespan="on",
+            log_level=fastmcp.settings.log_level.lower(),
+            access_log=False,
+            timeout_graceful_shutdown=30,
+        )
+    )
+    notifier = asyncio.create_task(_notify_ready(server, ready_fd))
+    try:
+        await server.serve(sockets=[listener])
+    finally:
+        notifier.cancel()
+
+
+async def _wait_ready(ready_fd: int, timeout: float) -> bool:
+    reader = asyncio.StreamReader()
+    transport, _ = await asyncio.get_running_loop().connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader), os.fdopen(ready_fd, "rb", 0)
+    )
+    try:
+        return bool(await asyncio.wait_for(reader.read(1), timeout=timeout))
+    except TimeoutError:
+        return False
+    finally:
+        transport.close()
+
+
+async def _notify_ready(server: "uvicorn.Server", ready_fd: int) -> None:
+    try:
+        while not server.started:
+            await asyncio.sleep(0.05)
+        os.write(ready_fd, b"1")
+    finally:
+        os.close(ready_fd)
+
+
+def _listen(host: str, port: int) -> socket.socket:
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    listener = socket.socket(family, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind((host, port))
+    listener.listen(LISTEN_BACKLOG)
+    listener.set_inheritable(True)
+    return listener
+
+
+def _worker_view(backend: Backend) -> BackendConfig:
+    return replace(
+        backend.config,
+        source=BackendSource(
+            source_type=BackendSourceType.HTTP,
+            http_url=backend.config.url,
+        ),
+    )
@@ -61,7 +61,7 @@ class RoutingEngine:
             raise RoutingError(f"No backends available to route tool: {tool_name}")
 
         strategy = strategy or self.default_strategy
-        logger.debug(f"Routing tool {tool_name} using strategy: {strategy}")
+        logger.debug("Routing tool %s using strategy: %s", tool_name, strategy)
 
         if strategy == "path":
             return await self.route_by_path(tool_name, backends)
@@ -89,7 +89,7 @@ class RoutingEngine:
         Raises:
             RoutingError: If no backend pattern matches
         """
-        logger.debug(f"Path-based routing for tool: {tool_name}")
+        logger.debug("Path-based routing for tool: %s", tool_name)
 
         # Find backends with matching route patterns
         candidates = []
@@ -116,9 +116,11 @@ class RoutingEngine:
         selected_backend = candidates[0][0]
         pattern = candidates[0][1]
 
-        logger.info(
-            f"Path-based routing selected {selected_backend.config.name} "
-            f"for tool {tool_name} (pattern: {pattern})"
+        logger.debug(
+            "Path-based routing selected %s for tool %s (pattern: %s)",
+            selected_backend.config.name,
+            tool_name,
+            pattern,
         )
 
         return RoutingDecision(
@@ -145,7 +147,7 @@ class RoutingEngine:
         Raises:
             RoutingError: If no backend has the capability
         """
-        logger.debug(f"Capability-based routing for tool: {tool_name}")
+        logger.debug("Capability-based routing for tool: %s", tool_name)
 
         # Find backends that have this tool
         candidates = []
@@ -164,9 +166,10 @@ class RoutingEngine:
             )
 
         selected_backend = candidates[0]
-        logger.info(
-            f"Capability-based routing selected {selected_backend.config.name} "
-            f"for tool {tool_name}"
+        logger.debug(
+            "Capability-based routing selected %s for tool %s",
+            selected_backend.config.name,
+            tool_name,
         )
 
         return RoutingDecision(
@@ -193,11 +196,11 @@ class RoutingEngine:
         Raises:
             RoutingError: If no healthy backends in chain
         """
-        logger.debug(f"Fallback-based routing for tool: {tool_name}")
+        logger.debug("Fallback-based routing for tool: %s", tool_name)
 
         # Try backends in priority order, skipping unhealthy ones
         for backend in backends:
-            logger.debug(f"Trying fallback backend: {backend.config.name}")
+            logger.debug("Trying fallback backend: %s", backend.config.name)
             # Fallback routing doesn't check if tool exists, tries backend
             return RoutingDecision(
                 backend=backend,
@@ -240,10 +243,10 @@ class RoutingEngine:
 
         for attempt in range(self.max_retry_attempts):
             try:
-                logger.debug(f"Attempt {attempt + 1}/{self.max_retry_attempts}")
+                logger.debug("Attempt %d/%d", attempt + 1, self.max_retry_attempts)
                 result = await func(*args, **kwargs)
                 if attempt > 0:
-                    logger.debug(f"Succeeded on retry {attempt}")
+                    logger.debug("Succeeded on retry %d", attempt)
                 return result
 
             except TimeoutError as e:
@@ -251,21 +254,21 @@ class RoutingEngine:
                     f"Request timed out on attempt {attempt + 1}",
                     original_error=e,
                 )
-                logger.debug(f"Timeout on attempt {attempt + 1}")
+                logger.debug("Timeout on attempt %d", attempt + 1)
 
                 if attempt < self.max_retry_attempts - 1:
                     sleep_time = min(backoff_time, self.max_retry_backoff)
-                    logger.debug(f"Retrying after {sleep_time}s")
+                    logger.debug("Retrying after %ss", sleep_time)
                     await asyncio.sleep(sleep_time)
                     backoff_time *= self.retry_backoff_multiplier
 
             except Exception as e:
                 last_error = e
-                logger.debug(f"Error on attempt {attempt + 1}: {e}")
+                logger.debug("Error on attempt %d: %s", attempt + 1, e)
 
                 if attempt < self.max_retry_attempts - 1:
                     sleep_time = min(backoff_time, self.max_retry_backoff)
-                    logger.debug(f"Retrying after {sleep_time}s")
+                    logger.debug("Retrying after %ss", sleep_time)
                     await asyncio.sleep(sleep_time)
                     backoff_time *= self.retry_backoff_multiplier
 
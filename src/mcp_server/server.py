@@ -1,14 +1,30 @@
 import asyncio
+from typing import TYPE_CHECKING, Any
 
-from fastmcp import FastMCP
+from mcp_server.config import RouterConfig, ServerConfig
 
-from mcp_server.config import ServerConfig
-from mcp_server.presentation.server_factory import create_router_server, create_server
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
 
-mcp = create_server()
+
+def __getattr__(name: str) -> Any:
+    """Load the server factory and build the template server on first use."""
+    if name == "create_server":
+        from mcp_server.presentation.server_factory import create_server
+
+        return create_server
+    if name == "mcp":
+        from mcp_server.presentation.server_factory import create_server
+
+        server = create_server()
+        globals()["mcp"] = server
+        return server
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main() -> None:
+    from mcp_server.presentation.server_factory import create_server
+
     config = ServerConfig.from_env()
     server = create_server(config)
     server.run()
@@ -18,14 +34,27 @@ def main_router() -> None:
     """Run the MCP router with HTTP/SSE transport."""
     import os
 
-    async def _initialize() -> FastMCP:
-        return await create_router_server()
-
-    router = asyncio.run(_initialize())
-
     # Use HTTP/SSE transport when running in container or when MCP_PORT is set
     port = int(os.getenv("MCP_PORT", "0"))
     host = os.getenv("MCP_HOST", "127.0.0.1")
+    config = RouterConfig.from_env()
+
+    if port > 0 and (config.workers != 1 or os.getenv("MCP_WORKER_SOCKET_FD")):
+        # Supervisor with worker processes sharing one listening socket
+        from mcp_server.presentation.supervisor import run_supervisor, run_worker
+
+        if os.getenv("MCP_WORKER_SOCKET_FD"):
+            run_worker()
+        else:
+            run_supervisor(config, host, port)
+        return
+
+    from mcp_server.presentation.server_factory import create_router_server
+
+    async def _initialize() -> "FastMCP":
+        return await create_router_server(config)
+
+    router = asyncio.run(_initialize())
 
     if port > 0:
         # HTTP transport for container deployment
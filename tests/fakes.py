@@ -0,0 +1,92 @@
+from typing import Any
+
+from mcp_server.application.ports import (
+    MCPClientPort,
+    PortAllocatorPort,
+    ProcessManagerPort,
+)
+from mcp_server.domain.value_objects import ProcessConfig
+
+
+class FakeProcessManager(ProcessManagerPort):
+    def __init__(self) -> None:
+        self.started: list[ProcessConfig] = []
+        self.configs: dict[int, ProcessConfig] = {}
+        self.alive: set[int] = set()
+        self.stopped: list[int] = []
+        self._next_pid = 1000
+
+    async def start_process(self, config: ProcessConfig) -> int:
+        self._next_pid += 1
+        self.started.append(config)
+        self.configs[self._next_pid] = config
+        self.alive.add(self._next_pid)
+        return self._next_pid
+
+    async def wait_until_ready(self, pid: int, timeout: float = 30.0) -> None:
+        pass
+
+    async def stop_process(self, pid: int) -> None:
+        self.alive.discard(pid)
+        self.stopped.append(pid)
+
+    async def is_process_alive(self, pid: int) -> bool:
+        return pid in self.alive
+
+    async def restart_process(self, pid: int, config: ProcessConfig) -> int:
+        await self.stop_process(pid)
+        return await self.start_process(config)
+
+    async def shutdown_all(self) -> None:
+        for pid in list(self.alive):
+            await self.stop_process(pid)
+
+
+class FakePortAllocator(PortAllocatorPort):
+    def __init__(self, start_port: int = 9000) -> None:
+        self._next_port = start_port
+        self.released: list[int] = []
+
+    async def allocate_port(self) -> int:
+        self._next_port += 1
+        return self._next_port
+
+    async def release_port(self, port: int) -> None:
+        self.released.append(port)
+
+    def listen_fd(self, port: int) -> int | None:
+        return None
+
+    def unbind_port(self, port: int) -> None:
+        pass
+
+
+class FakeMCPClient(MCPClientPort):
+    def __init__(
+        self, tools: list[dict[str, Any]] | None = None, failures: int = 0
+    ) -> None:
+        self.tools = tools or []
+        self.failures = failures
+        self.calls: list[tuple[str, dict[str, Any]]] = []
+
+    async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
+        self.calls.append((tool_name, arguments))
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("backend unavailable")
+        return {"tool": tool_name, "arguments": arguments}
+
+    async def get_resource(self, uri: str) -> str:
+        return f"contents of {uri}"
+
+    async def get_prompt(self, prompt_name: str, arguments: dict[str, Any]) -> str:
+        return f"prompt {prompt_name}"
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        return self.tools
+
+    async def list_resources(self) -> list[dict[str, Any]]:
+        return []
+
+    async def list_prompts(self) -> list[dict[str, Any]]:
+        return []
@@ -0,0 +1,133 @@
+import asyncio
+import time
+
+from mcp_server.application.dtos import ResourceFetch
+from mcp_server.application.use_cases import ReadResource
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.value_objects import (
+    BackendConfig,
+    BackendSource,
+    BackendSourceType,
+    ResourceCacheRule,
+)
+from mcp_server.infrastructure.adapters import TieredResourceCache
+from mcp_server.infrastructure.repositories import InMemoryBackendRepository
+from tests.fakes import FakeMCPClient
+
+
+class VersionedClient(FakeMCPClient):
+    def __init__(self, etag: str | None = None, delay: float = 0.0) -> None:
+        super().__init__()
+        self.version = 1
+        self.etag = etag
+        self.delay = delay
+        self.fetches: list[tuple[str, str | None]] = []
+
+    async def fetch_resource(
+        self,
+        uri: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> ResourceFetch:
+        self.fetches.append((uri, etag))
+        await asyncio.sleep(self.delay)
+        current_etag = f'"{self.etag}{self.version}"' if self.etag else None
+        if etag and etag == current_etag:
+            return ResourceFetch(content=None, etag=current_etag)
+        return ResourceFetch(content=f"{uri} v{self.version}", etag=current_etag)
+
+
+def _read_resource(client: VersionedClient, *rules: ResourceCacheRule) -> ReadResource:
+    repository = InMemoryBackendRepository()
+    repository.add(
+        Backend(
+            config=BackendConfig(
+                name="alpha",
+                source=BackendSource(
+                    source_type=BackendSourceType.HTTP,
+                    http_url="http://localhost:9001",
+                ),
+                namespace="alpha",
+                resource_cache=rules,
+            )
+        )
+    )
+    return ReadResource(repository, {"alpha": client}, cache=TieredResourceCache())
+
+
+class TestReadResource:
+    async def test_fresh_entries_are_served_without_a_backend_call(self) -> None:
+        client = VersionedClient()
+        read = _read_resource(client, ResourceCacheRule("docs://*", ttl_seconds=60))
+
+        assert await read.execute("alpha", "docs://readme") == "docs://readme v1"
+        client.version = 2
+        assert await read.execute("alpha", "docs://readme") == "docs://readme v1"
+        assert len(client.fetches) == 1
+
+    async def test_expired_entries_are_revalidated_with_etag(self) -> None:
+        client = VersionedClient(etag="rev")
+        read = _read_resource(client)
+
+        assert await read.execute("alpha", "config://app") == "config://app v1"
+        assert await read.execute("alpha", "config://app") == "config://app v1"
+        client.version = 2
+        assert await read.execute("alpha", "config://app") == "config://app v2"
+
+        assert [etag for _, etag in client.fetches] == [None, '"rev1"', '"rev1"']
+
+    async def test_stale_entries_are_served_while_revalidating(self) -> None:
+        client = VersionedClient()
+        read = _read_resource(
+            client,
+            ResourceCacheRule(
+                "docs://*", ttl_seconds=60, stale_while_revalidate_seconds=600
+            ),
+        )
+        await read.execute("alpha", "docs://readme")
+        entry = await read.cache.get("alpha", "docs://readme")
+        entry = type(entry)(
+            content=entry.content,
+            etag=entry.etag,
+            last_modified=entry.last_modified,
+            fresh_until=time.time() - 1,
+            stale_until=time.time() + 600,
+        )
+        await read.cache.put("alpha", "docs://readme", entry)
+        client.version = 2
+
+        assert await read.execute("alpha", "docs://readme") == "docs://readme v1"
+        await asyncio.gather(*read._inflight.values())
+        assert await read.execute("alpha", "docs://readme") == "docs://readme v2"
+        assert len(client.fetches) == 2
+
+    async def test_invalidation_forces_a_new_read(self) -> None:
+        client = VersionedClient()
+        read = _read_resource(client, ResourceCacheRule("*", ttl_seconds=60))
+        await read.execute("alpha", "docs://readme")
+        client.version = 2
+
+        assert await read.invalidate("alpha", "docs://readme") == 1
+
+        assert await read.execute("alpha", "docs://readme") == "docs://readme v2"
+
+    async def test_concurrent_misses_share_one_backend_read(self) -> None:
+        client = VersionedClient(delay=0.01)
+        read = _read_resource(client, ResourceCacheRule("*", ttl_seconds=60))
+
+        results = await asyncio.gather(
+            *(read.execute("alpha", "docs://readme") for _ in range(10))
+        )
+
+        assert set(results) == {"docs://readme v1"}
+        assert len(client.fetches) == 1
+
+    async def test_resources_without_ttl_or_validators_are_not_cached(self) -> None:
+        client = VersionedClient()
+        read = _read_resource(client)
+
+        await read.execute("alpha", "live://status")
+        client.version = 2
+
+        assert await read.execute("alpha", "live://status") == "live://status v2"
+        assert read.cache.entry_count == 0
@@ -0,0 +1,210 @@
+import asyncio
+
+from fastmcp import FastMCP
+
+from mcp_server.presentation import CompositionRoot
+from mcp_server.presentation.capability_registrar import CapabilityRegistrar
+from tests.fakes import FakePortAllocator, FakeProcessManager
+
+CONFIG = """
+backends:
+  - name: alpha
+    source: alpha-pkg
+    port: 9101
+    priority: 10
+  - name: beta
+    source: beta-pkg
+    port: 9102
+"""
+
+
+class StubDiscovery:
+    def __init__(self) -> None:
+        self.discovered: list[str] = []
+
+    async def execute_for_backend(self, backend, client) -> None:
+        self.discovered.append(backend.name)
+
+
+async def _composition_root(tmp_path) -> CompositionRoot:
+    config_path = tmp_path / "backends.yaml"
+    config_path.write_text(CONFIG)
+    root = CompositionRoot(str(config_path))
+    root._process_manager = FakeProcessManager()
+    root._port_allocator = FakePortAllocator()
+    root._discover_capabilities = StubDiscovery()
+    await root.initialize_backends()
+    return root
+
+
+def _rewrite(root: CompositionRoot, old: str, new: str) -> None:
+    path = root.backends_config_path
+    with open(path) as f:
+        content = f.read()
+    with open(path, "w") as f:
+        f.write(content.replace(old, new))
+
+
+class TestReloadBackendsConfig:
+    async def test_unchanged_config_is_a_no_op(self, tmp_path) -> None:
+        root = await _composition_root(tmp_path)
+
+        results = await root.reload_backends.execute()
+
+        assert results["updated"] == []
+        assert results["restarted"] == []
+        assert root.process_manager.stopped == []
+
+    async def test_priority_change_is_applied_in_place(self, tmp_path) -> None:
+        root = await _composition_root(tmp_path)
+        alpha = root.backend_repository.get("alpha")
+        pid = alpha.process_id
+        port = alpha.config.source.process_config.port
+        _rewrite(root, "priority: 10", "priority: 1")
+
+        results = await root.reload_backends.execute()
+
+        assert results["updated"] == ["alpha"]
+        assert results["restarted"] == []
+        assert root.backend_repository.get("alpha") is alpha
+        assert alpha.config.priority == 1
+        assert alpha.process_id == pid
+        assert alpha.config.source.process_config.port == port
+        assert root.process_manager.stopped == []
+        assert root.port_allocator.released == []
+
+    async def test_warm_spare_port_does_not_count_as_a_change(self, tmp_path) -> None:
+        root = await _composition_root(tmp_path)
+        alpha = root.backend_repository.get("alpha")
+        alpha.move_to_port(9201)
+        _rewrite(root, "priority: 10", "priority: 1")
+
+        results = await root.reload_backends.execute()
+
+        assert results["updated"] == ["alpha"]
+        assert results["restarted"] == []
+        assert alpha.config.url == "http://localhost:9201"
+        assert root.process_manager.stopped == []
+
+    async def test_declared_port_change_restarts(self, tmp_path) -> None:
+        root = await _composition_root(tmp_path)
+        root.backend_repository.get("alpha").move_to_port(9201)
+        _rewrite(root, "port: 9101", "port: 9301")
+
+        results = await root.reload_backends.execute()
+
+        assert results["restarted"] == ["alpha"]
+        restarted = root.backend_repository.get("alpha")
+        assert restarted.config.url == "http://localhost:9301"
+
+    async def test_lower_failure_threshold_opens_circuit(self, tmp_path) -> None:
+        root = await _composition_root(tmp_path)
+        alpha = root.backend_repository.get("alpha")
+        alpha.record_failure("boom")
+        alpha.record_failure("boom")
+        _rewrite(
+            root,
+            "priority: 10",
+            "priority: 10\n    circuit_breaker:\n      failure_threshold: 2",
+        )
+
+        await root.reload_backends.execute()
+
+        assert alpha.is_circuit_open
+
+    async def test_source_change_restarts_only_that_backend(self, tmp_path) -> None:
+        root = await _composition_root(tmp_path)
+        alpha_pid = root.backend_repository.get("alpha").process_id
+        beta = root.backend_repository.get("beta")
+        _rewrite(root, "source: beta-pkg", "source: gamma-pkg")
+
+        results = await root.reload_backends.execute()
+
+        assert results["restarted"] == ["beta"]
+        assert root.process_manager.stopped == [beta.process_id]
+        assert root.backend_repository.get("alpha").process_id == alpha_pid
+        restarted = root.backend_repository.get("beta")
+        assert restarted.config.source.process_config.args == ("gamma-pkg",)
+
+    async def test_namespace_change_re_registers_capabilities(self, tmp_path) -> None:
+        root = await _composition_root(tmp_path)
+        server = FastMCP("test-router")
+        registrar = CapabilityRegistrar(
+            server,
+            root.route_tool_call,
+            root.read_resource,
+            root.render_prompt,
+            enable_namespace_prefixing=True,
+        )
+        root.capability_listener = registrar
+        alpha = root.backend_repository.get("alpha")
+        alpha.update_capabilities([{"name": "search"}], [], [])
+        await registrar.capabilities_changed(alpha)
+        assert set(await server.get_tools()) == {"alpha-pkg.search"}
+        _rewrite(root, "priority: 10", "priority: 10\n    namespace: renamed")
+
+        results = await root.reload_backends.execute()
+
+        assert results["updated"] == ["alpha"]
+        assert results["restarted"] == []
+        assert set(await server.get_tools()) == {"renamed.search"}
+
+    async def test_reload_does_not_rewrite_config_file(self, tmp_path) -> None:
+        root = await _composition_root(tmp_path)
+        before = "backends:\n  - name: beta\n    source: gamma-pkg\n    port: 9102\n"
+        (tmp_path / "backends.yaml").write_text(before)
+
+        results = await root.reload_backends.execute()
+
+        assert results["removed"] == ["alpha"]
+        assert (tmp_path / "backends.yaml").read_text() == before
+
+
+class CountingConfigRepository:
+    def __init__(self, inner) -> None:
+        self.inner = inner
+        self.loads = 0
+
+    async def load_configs(self):
+        self.loads += 1
+        await asyncio.sleep(0.05)
+        return await self.inner.load_configs()
+
+
+class TestReloadCoalescing:
+    async def test_overlapping_reloads_are_coalesced(self, tmp_path) -> None:
+        root = await _composition_root(tmp_path)
+        repository = CountingConfigRepository(root.config_repository)
+        root.reload_backends.config_repository = repository
+
+        first = asyncio.create_task(root.reload_backends.execute())
+        await asyncio.sleep(0.01)
+        results = await asyncio.gather(
+            first, *(root.reload_backends.execute() for _ in range(4))
+        )
+
+        assert repository.loads == 2
+        assert all(r == results[0] for r in results)
+
+    async def test_reload_after_completion_runs_again(self, tmp_path) -> None:
+        root = await _composition_root(tmp_path)
+        repository = CountingConfigRepository(root.config_repository)
+        root.reload_backends.config_repository = repository
+
+        await root.reload_backends.execute()
+        await root.reload_backends.execute()
+
+        assert repository.loads == 2
+
+    async def test_watched_configs_are_applied_without_reloading(
+        self, tmp_path
+    ) -> None:
+        root = await _composition_root(tmp_path)
+        repository = CountingConfigRepository(root.config_repository)
+        root.reload_backends.config_repository = repository
+        configs = await root.config_repository.load_configs()
+
+        results = await root.reload_backends.execute(configs[1:])
+
+        assert repository.loads == 0
+        assert results["removed"] == ["alpha"]
@@ -0,0 +1,80 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from mcp_server.application.use_cases import RenderPrompt
+from mcp_server.domain.exceptions import BackendNotFoundError
+from tests.fakes import FakeMCPClient
+
+
+class CountingClient(FakeMCPClient):
+    def __init__(self, delay: float = 0.0) -> None:
+        super().__init__()
+        self.delay = delay
+        self.renders: list[tuple[str, dict[str, Any]]] = []
+
+    async def get_prompt(self, prompt_name: str, arguments: dict[str, Any]) -> str:
+        self.renders.append((prompt_name, arguments))
+        await asyncio.sleep(self.delay)
+        return f"{prompt_name} #{len(self.renders)}"
+
+
+class TestRenderPrompt:
+    async def test_same_arguments_in_any_order_hit_the_cache(self) -> None:
+        client = CountingClient()
+        render = RenderPrompt({"alpha": client})
+
+        first = await render.execute("alpha", "review", {"lang": "py", "depth": 2})
+        second = await render.execute("alpha", "review", {"depth": 2, "lang": "py"})
+        other = await render.execute("alpha", "review", {"lang": "go", "depth": 2})
+
+        assert first == second == "review #1"
+        assert other == "review #2"
+
+    async def test_expired_renders_are_fetched_again(self) -> None:
+        client = CountingClient()
+        render = RenderPrompt({"alpha": client}, ttl_seconds=0.01)
+
+        await render.execute("alpha", "review", {})
+        await asyncio.sleep(0.02)
+
+        assert await render.execute("alpha", "review", {}) == "review #2"
+
+    async def test_zero_ttl_disables_caching(self) -> None:
+        client = CountingClient()
+        render = RenderPrompt({"alpha": client}, ttl_seconds=0)
+
+        await render.execute("alpha", "review", {})
+        await render.execute("alpha", "review", {})
+
+        assert len(client.renders) == 2
+
+    async def test_invalidate_drops_one_backend(self) -> None:
+        alpha, beta = CountingClient(), CountingClient()
+        render = RenderPrompt({"alpha": alpha, "beta": beta})
+        await render.execute("alpha", "review", {})
+        await render.execute("beta", "review", {})
+
+        assert render.invalidate("alpha") == 1
+
+        await render.execute("alpha", "review", {})
+        await render.execute("beta", "review", {})
+        assert (len(alpha.renders), len(beta.renders)) == (2, 1)
+
+    async def test_concurrent_misses_share_one_render(self) -> None:
+        client = CountingClient(delay=0.01)
+        render = RenderPrompt({"alpha": client})
+
+        results = await asyncio.gather(
+            *(render.execute("alpha", "review", {"n": 1}) for _ in range(10))
+        )
+
+        assert set(results) == {"review #1"}
+        assert len(client.renders) == 1
+
+    async def test_unknown_backend_raises(self) -> None:
+        render = RenderPrompt({})
+
+        with pytest.raises(BackendNotFoundError):
+            await render.execute("missing", "review", {})
@@ -0,0 +1,201 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from mcp_server.application.dtos import ToolCallRequest
+from mcp_server.application.use_cases import DiscoverCapabilities, RouteToolCall
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.exceptions import (
+    InvalidToolArgumentsError,
+    RateLimitExceededError,
+)
+from mcp_server.domain.value_objects import (
+    BackendConfig,
+    BackendSource,
+    BackendSourceType,
+    PriorityClass,
+    RateLimitRule,
+    SchedulingSettings,
+)
+from mcp_server.infrastructure.adapters import (
+    FairRequestScheduler,
+    JsonSchemaArgumentValidator,
+    PrometheusMetrics,
+    TokenBucketRateLimiter,
+)
+from mcp_server.infrastructure.repositories import InMemoryBackendRepository
+from tests.fakes import FakeMCPClient
+
+SEARCH_TOOL = {
+    "name": "search",
+    "inputSchema": {
+        "type": "object",
+        "properties": {"query": {"type": "string"}},
+        "required": ["query"],
+    },
+}
+
+
+class GatedClient(FakeMCPClient):
+    def __init__(self, tools: list[dict[str, Any]]) -> None:
+        super().__init__(tools=tools)
+        self.gate = asyncio.Event()
+
+    async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
+        await self.gate.wait()
+        return await super().call_tool(tool_name, arguments)
+
+
+async def _route_tool_call(
+    metrics: PrometheusMetrics | None = None,
+    client: FakeMCPClient | None = None,
+    scheduling: SchedulingSettings | None = None,
+    rate_limits: tuple[RateLimitRule, ...] = (),
+) -> tuple[RouteToolCall, FakeMCPClient]:
+    repository = InMemoryBackendRepository()
+    client = client or FakeMCPClient(tools=[SEARCH_TOOL])
+    client_factory = {"alpha": client}
+    validator = JsonSchemaArgumentValidator()
+    backend = Backend(
+        config=BackendConfig(
+            name="alpha",
+            source=BackendSource(
+                source_type=BackendSourceType.HTTP,
+                http_url="http://localhost:9001",
+            ),
+            namespace="alpha",
+            scheduling=scheduling or SchedulingSettings(),
+            rate_limits=rate_limits,
+        )
+    )
+    repository.add(backend)
+
+    discover = DiscoverCapabilities(
+        repository, client_factory, argument_validator=validator
+    )
+    await discover.execute()
+
+    route = RouteToolCall(
+        repository,
+        client_factory,
+        max_retry_attempts=3,
+        argument_validator=validator,
+        metrics=metrics,
+        scheduler=FairRequestScheduler(metrics=metrics),
+        rate_limiter=TokenBucketRateLimiter(metrics=metrics),
+    )
+    return route, client
+
+
+class TestRouteToolCallValidation:
+    async def test_valid_call_reaches_backend(self) -> None:
+        route, client = await _route_tool_call()
+
+        response = await route.execute(
+            ToolCallRequest(tool_name="search", arguments={"query": "x"})
+        )
+
+        assert response.backend_name == "alpha"
+        assert client.calls == [("search", {"query": "x"})]
+
+    async def test_invalid_call_is_rejected_without_backend_call(self) -> None:
+        route, client = await _route_tool_call()
+
+        with pytest.raises(InvalidToolArgumentsError):
+            await route.execute(ToolCallRequest(tool_name="search", arguments={}))
+
+        assert client.calls == []
+
+
+class TestRouteToolCallMetrics:
+    async def test_outcomes_are_recorded_per_tool(self) -> None:
+        metrics = PrometheusMetrics()
+        route, _ = await _route_tool_call(metrics)
+
+        await route.execute(
+            ToolCallRequest(tool_name="search", arguments={"query": "x"})
+        )
+        with pytest.raises(InvalidToolArgumentsError):
+            await route.execute(ToolCallRequest(tool_name="search", arguments={}))
+
+        text = metrics.render()
+        assert (
+            'mcp_router_requests_total{backend="alpha",tool="search",'
+            'outcome="success"} 1' in text
+        )
+        assert (
+            'mcp_router_requests_total{backend="alpha",tool="search",'
+            'outcome="invalid_arguments"} 1' in text
+        )
+        assert 'mcp_router_requests_in_flight{backend="alpha"} 0' in text
+
+
+class TestRouteToolCallScheduling:
+    async def test_interactive_clients_are_dispatched_before_batch(self) -> None:
+        client = GatedClient(tools=[SEARCH_TOOL])
+        route, _ = await _route_tool_call(
+            client=client,
+            scheduling=SchedulingSettings(
+                max_concurrency=1,
+                classes=(
+                    PriorityClass(
+                        "interactive", weight=4, preemptive=True, clients=("desktop",)
+                    ),
+                    PriorityClass("batch", clients=("batch-*",)),
+                ),
+            ),
+        )
+
+        def call(client_id: str, query: str) -> asyncio.Task:
+            return asyncio.create_task(
+                route.execute(
+                    ToolCallRequest(
+                        tool_name="search",
+                        arguments={"query": query},
+                        client_id=client_id,
+                    )
+                )
+            )
+
+        tasks = [call("batch-1", f"batch{i}") for i in range(3)]
+        await asyncio.sleep(0)
+        tasks.append(call("desktop", "interactive"))
+        await asyncio.sleep(0)
+        client.gate.set()
+        await asyncio.gather(*tasks)
+
+        assert [args["query"] for _, args in client.calls] == [
+            "batch0",
+            "interactive",
+            "batch1",
+            "batch2",
+        ]
+
+
+class TestRouteToolCallRateLimiting:
+    async def test_exhausted_client_is_rejected_before_backend(self) -> None:
+        metrics = PrometheusMetrics()
+        route, client = await _route_tool_call(
+            metrics=metrics,
+            rate_limits=(RateLimitRule("client", rate_per_second=1, burst=2),),
+        )
+
+        def request(client_id: str) -> ToolCallRequest:
+            return ToolCallRequest(
+                tool_name="search", arguments={"query": "x"}, client_id=client_id
+            )
+
+        await route.execute(request("desktop"))
+        await route.execute(request("desktop"))
+        with pytest.raises(RateLimitExceededError) as excinfo:
+            await route.execute(request("desktop"))
+        await route.execute(request("batch"))
+
+        assert len(client.calls) == 3
+        assert excinfo.value.scope == "client"
+        assert 0 < excinfo.value.retry_after_seconds <= 1
+        assert (
+            'mcp_router_rate_limited_total{backend="alpha",scope="client"} 1'
+            in metrics.render()
+        )
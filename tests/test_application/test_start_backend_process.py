@@ -0,0 +1,49 @@
+import asyncio
+
+from mcp_server.application.use_cases import StartBackendProcess
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.value_objects import (
+    BackendConfig,
+    BackendSource,
+    BackendSourceType,
+    ProcessConfig,
+)
+from mcp_server.infrastructure.adapters import WarmProcessPool
+from tests.fakes import FakePortAllocator, FakeProcessManager
+
+
+def _managed_backend(port: int = 8100) -> Backend:
+    source = BackendSource(
+        source_type=BackendSourceType.PACKAGE,
+        package_name="pkg",
+        process_config=ProcessConfig(command="uvx", args=("pkg",)).with_port(port),
+    )
+    return Backend(config=BackendConfig(name="pkg", source=source, namespace="pkg"))
+
+
+class TestStartBackendProcess:
+    async def test_cold_start_without_pool(self) -> None:
+        manager = FakeProcessManager()
+        use_case = StartBackendProcess(manager, FakePortAllocator(), {})
+        backend = _managed_backend()
+
+        from_pool = await use_case.execute(backend)
+
+        assert from_pool is False
+        assert backend.process_id in manager.alive
+        assert backend.config.url == "http://localhost:8100"
+
+    async def test_restart_uses_warm_spare_after_first_crash(self) -> None:
+        manager = FakeProcessManager()
+        allocator = FakePortAllocator()
+        pool = WarmProcessPool(manager, allocator, size=1)
+        use_case = StartBackendProcess(manager, allocator, {}, process_pool=pool)
+        backend = _managed_backend()
+        await use_case.execute(backend)
+
+        assert await use_case.restart(backend) is False
+        await asyncio.sleep(0)
+        assert await use_case.restart(backend) is True
+
+        assert backend.config.url == "http://localhost:9001"
+        assert 8100 in allocator.released
@@ -0,0 +1,88 @@
+import time
+
+from mcp_server.domain.services import ResourceUriTrie
+
+
+def _trie() -> ResourceUriTrie:
+    trie = ResourceUriTrie()
+    trie.index_backend(
+        "data",
+        {
+            "data://items/{item_id}": {"uriTemplate": "items/{item_id}"},
+            "data://items/latest": {"uri": "items/latest"},
+            "data://items/{item_id}/tags/{tag}": {
+                "uriTemplate": "items/{item_id}/tags/{tag}"
+            },
+        },
+    )
+    trie.index_backend("files", {"file:///{path*}": {"uriTemplate": "file:///{path*}"}})
+    return trie
+
+
+class TestResourceUriTrie:
+    def test_concrete_uris_win_over_templates(self) -> None:
+        match = _trie().match("data://items/latest")
+
+        assert match is not None
+        assert (match.backend_name, match.params) == ("data", {})
+        assert match.original_uri == "items/latest"
+
+    def test_parameters_are_captured_and_expanded(self) -> None:
+        match = _trie().match("data://items/42/tags/red")
+
+        assert match is not None
+        assert match.params == {"item_id": "42", "tag": "red"}
+        assert match.original_uri == "items/42/tags/red"
+
+    def test_trailing_parameter_captures_the_rest_of_the_path(self) -> None:
+        match = _trie().match("file:///srv/docs/readme.md")
+
+        assert match is not None
+        assert match.backend_name == "files"
+        assert match.params == {"path": "srv/docs/readme.md"}
+
+    def test_unknown_uris_and_empty_segments_do_not_match(self) -> None:
+        trie = _trie()
+
+        assert trie.match("data://items/") is None
+        assert trie.match("data://orders/1") is None
+        assert trie.match("DATA://items/7") is not None
+
+    def test_reindexing_and_removal_update_routes(self) -> None:
+        trie = _trie()
+        trie.index_backend(
+            "data", {"data://items/{item_id}": {"uriTemplate": "items/{item_id}"}}
+        )
+
+        assert trie.match("data://items/latest").params == {"item_id": "latest"}
+        assert trie.match("data://items/1/tags/x") is None
+        assert len(trie) == 2
+
+        trie.remove_backend("data")
+        assert trie.match("data://items/1") is None
+        assert len(trie) == 1
+
+    def test_first_backend_keeps_a_shared_uri(self) -> None:
+        trie = ResourceUriTrie()
+        trie.index_backend("a", {"docs://readme": {"uri": "readme"}})
+        trie.index_backend("b", {"docs://readme": {"uri": "readme"}})
+
+        assert trie.match("docs://readme").backend_name == "a"
+        assert trie.backend_resources("b") == {}
+
+    def test_lookup_cost_does_not_grow_with_resource_count(self) -> None:
+        small, large = ResourceUriTrie(), ResourceUriTrie()
+        small.index_backend(
+            "a", {f"docs://page/{i}": {"uri": f"{i}"} for i in range(10)}
+        )
+        large.index_backend(
+            "a", {f"docs://page/{i}": {"uri": f"{i}"} for i in range(10_000)}
+        )
+
+        def lookup_seconds(trie: ResourceUriTrie) -> float:
+            started = time.perf_counter()
+            for _ in range(2_000):
+                trie.match("docs://page/7")
+            return time.perf_counter() - started
+
+        assert lookup_seconds(large) < lookup_seconds(small) * 5
@@ -0,0 +1,95 @@
+import random
+import time
+
+from mcp_server.domain.services import ToolSearchIndex
+from mcp_server.domain.services.tool_search_index import tokenize
+
+
+def _tool(name: str, description: str, *parameters: str) -> dict:
+    return {
+        "name": name,
+        "description": description,
+        "inputSchema": {
+            "type": "object",
+            "properties": {p: {"type": "string"} for p in parameters},
+        },
+    }
+
+
+def _index() -> ToolSearchIndex:
+    index = ToolSearchIndex()
+    index.index_backend(
+        "files",
+        {
+            "files.readFile": _tool("readFile", "Read a file from disk", "path"),
+            "files.write_file": _tool("write_file", "Write text to a file", "path"),
+        },
+    )
+    index.index_backend(
+        "web",
+        {
+            "web.fetch": _tool("fetch", "Fetch a URL over HTTP", "url"),
+            "web.search": _tool("search", "Search the web", "query"),
+        },
+    )
+    return index
+
+
+class TestTokenize:
+    def test_splits_camel_case_and_separators(self) -> None:
+        assert tokenize("files.readFile_v2") == ["files", "read", "file", "v2"]
+
+
+class TestToolSearchIndex:
+    def test_ranks_matching_tools(self) -> None:
+        hits = _index().search("read file")
+
+        assert hits[0].name == "files.readFile"
+        assert {hit.name for hit in hits} == {"files.readFile", "files.write_file"}
+
+    def test_matches_parameter_names(self) -> None:
+        hits = _index().search("url")
+
+        assert [hit.name for hit in hits] == ["web.fetch"]
+        assert hits[0].backend_name == "web"
+
+    def test_reindexing_backend_replaces_its_tools(self) -> None:
+        index = _index()
+
+        index.index_backend("web", {"web.crawl": _tool("crawl", "Crawl a site")})
+
+        assert index.search("fetch") == []
+        assert [hit.name for hit in index.search("crawl")] == ["web.crawl"]
+        assert len(index) == 3
+
+    def test_remove_backend(self) -> None:
+        index = _index()
+
+        index.remove_backend("files")
+
+        assert index.search("file") == []
+        assert index.get("files.readFile") is None
+        assert index.get("web.fetch").tool_info["name"] == "fetch"
+
+    def test_search_over_ten_thousand_tools_is_fast(self) -> None:
+        rng = random.Random(7)
+        vocabulary = [f"word{i}" for i in range(3000)]
+        index = ToolSearchIndex()
+        for backend in range(10):
+            index.index_backend(
+                f"b{backend}",
+                {
+                    f"b{backend}.tool{i}": _tool(
+                        f"tool{i}", " ".join(rng.sample(vocabulary, 12)), "id"
+                    )
+                    for i in range(1000)
+                },
+            )
+
+        started = time.perf_counter()
+        for _ in range(100):
+            hits = index.search("word12 word400 word2000", limit=10)
+        elapsed = (time.perf_counter() - started) / 100
+
+        assert len(hits) == 10
+        assert elapsed < 0.005
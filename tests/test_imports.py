@@ -0,0 +1,44 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def _run(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "mcp_server.infrastructure",
+        "mcp_server.infrastructure.adapters",
+        "mcp_server.application",
+        "mcp_server.presentation",
+    ],
+)
+def test_package_imports_on_its_own(module: str) -> None:
+    _run(f"import {module}")
+
+
+def test_importing_server_has_no_side_effects() -> None:
+    output = _run(
+        "import sys, mcp_server.server; "
+        "print('fastmcp' in sys.modules, 'mcp' in vars(mcp_server.server))"
+    )
+    assert output == "False False"
+
+
+def test_lazy_exports_resolve() -> None:
+    output = _run(
+        "from mcp_server.infrastructure.adapters import HTTPMCPClient; "
+        "from mcp_server.server import mcp; "
+        "print(HTTPMCPClient.__name__, type(mcp).__name__)"
+    )
+    assert output == "HTTPMCPClient FastMCP"
@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+
+from mcp_server.domain.value_objects import PriorityClass, SchedulingSettings
+from mcp_server.infrastructure.adapters import FairRequestScheduler, PrometheusMetrics
+
+INTERACTIVE = PriorityClass(
+    name="interactive", weight=4, preemptive=True, clients=("desktop-*",)
+)
+BATCH = PriorityClass(name="batch", weight=1, clients=("batch-*",))
+REPORTS = PriorityClass(name="reports", weight=3, tools=("report_*",))
+SETTINGS = SchedulingSettings(max_concurrency=1, classes=(INTERACTIVE, REPORTS, BATCH))
+
+
+async def _queue(
+    scheduler: FairRequestScheduler,
+    priority_class: PriorityClass,
+    label: str,
+    served: list[str],
+) -> None:
+    release = await scheduler.acquire("alpha", SETTINGS, priority_class)
+    served.append(label)
+    release()
+
+
+async def _drain(scheduler: FairRequestScheduler, *jobs: tuple) -> list[str]:
+    served: list[str] = []
+    release = await scheduler.acquire("alpha", SETTINGS, BATCH)
+    tasks = [
+        asyncio.create_task(_queue(scheduler, priority_class, label, served))
+        for priority_class, label in jobs
+    ]
+    await asyncio.sleep(0)
+    release()
+    await asyncio.gather(*tasks)
+    return served
+
+
+class TestSchedulingSettings:
+    def test_requests_are_classified_by_client_session_or_tool(self) -> None:
+        assert SETTINGS.classify("desktop-app", None, "search") is INTERACTIVE
+        assert SETTINGS.classify(None, None, "report_daily") is REPORTS
+        assert SETTINGS.classify("batch-7", "s1", "search") is BATCH
+        assert SETTINGS.classify(None, None, "search").name == "default"
+
+
+class TestFairRequestScheduler:
+    async def test_unlimited_backends_are_not_queued(self) -> None:
+        scheduler = FairRequestScheduler()
+
+        releases = [
+            await scheduler.acquire("alpha", SchedulingSettings(), BATCH)
+            for _ in range(100)
+        ]
+
+        assert scheduler.in_flight("alpha") == 0
+        for release in releases:
+            release()
+
+    async def test_classes_share_slots_by_weight(self) -> None:
+        scheduler = FairRequestScheduler()
+
+        served = await _drain(
+            scheduler,
+            *[(BATCH, "b") for _ in range(4)],
+            *[(REPORTS, "r") for _ in range(12)],
+        )
+
+        assert served[:8].count("r") == 6
+        assert served[:8].count("b") == 2
+        assert scheduler.in_flight("alpha") == 0
+
+    async def test_preemptive_class_jumps_the_queue(self) -> None:
+        scheduler = FairRequestScheduler()
+
+        served = await _drain(
+            scheduler,
+            *[(BATCH, "b") for _ in range(5)],
+            (INTERACTIVE, "i"),
+        )
+
+        assert served[0] == "i"
+
+    async def test_cancelled_waiters_do_not_leak_slots(self) -> None:
+        scheduler = FairRequestScheduler()
+        release = await scheduler.acquire("alpha", SETTINGS, BATCH)
+        waiter = asyncio.create_task(scheduler.acquire("alpha", SETTINGS, BATCH))
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        release()
+
+        assert scheduler.queue_depth("alpha") == {"batch": 0}
+        assert scheduler.in_flight("alpha") == 0
+        (await scheduler.acquire("alpha", SETTINGS, BATCH))()
+
+    async def test_queue_depth_and_wait_are_exported(self) -> None:
+        metrics = PrometheusMetrics()
+        scheduler = FairRequestScheduler(metrics=metrics)
+
+        await _drain(scheduler, (BATCH, "b"), (INTERACTIVE, "i"))
+
+        rendered = metrics.render()
+        assert (
+            'mcp_router_queue_depth{backend="alpha",priority_class="interactive"} 0'
+            in rendered
+        )
+        assert (
+            'mcp_router_queue_wait_seconds_count{backend="alpha",'
+            'priority_class="batch"} 2' in rendered
+        )
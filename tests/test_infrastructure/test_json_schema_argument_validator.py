@@ -0,0 +1,110 @@
+from typing import Any
+
+import pytest
+
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.exceptions import InvalidToolArgumentsError
+from mcp_server.domain.value_objects import (
+    BackendConfig,
+    BackendSource,
+    BackendSourceType,
+)
+from mcp_server.infrastructure.adapters import JsonSchemaArgumentValidator
+
+SEARCH_SCHEMA = {
+    "type": "object",
+    "properties": {"query": {"type": "string"}, "limit": {"type": "integer"}},
+    "required": ["query"],
+}
+
+
+def _backend(name: str, tools: list[dict[str, Any]]) -> Backend:
+    backend = Backend(
+        config=BackendConfig(
+            name=name,
+            source=BackendSource(
+                source_type=BackendSourceType.HTTP,
+                http_url=f"http://localhost/{name}",
+            ),
+            namespace=name,
+        )
+    )
+    backend.update_capabilities(tools, [], [])
+    return backend
+
+
+class TestJsonSchemaArgumentValidator:
+    def test_valid_arguments_pass(self) -> None:
+        validator = JsonSchemaArgumentValidator()
+        validator.update_backend(
+            _backend("alpha", [{"name": "search", "inputSchema": SEARCH_SCHEMA}])
+        )
+
+        validator.validate("alpha", "search", {"query": "x", "limit": 3})
+
+    def test_invalid_arguments_raise_structured_error(self) -> None:
+        validator = JsonSchemaArgumentValidator()
+        validator.update_backend(
+            _backend("alpha", [{"name": "search", "inputSchema": SEARCH_SCHEMA}])
+        )
+
+        with pytest.raises(InvalidToolArgumentsError) as error:
+            validator.validate("alpha", "search", {"limit": "many"})
+
+        assert error.value.tool_name == "search"
+        assert error.value.errors == [
+            "$.limit: 'many' is not of type 'integer'",
+            "$: 'query' is a required property",
+        ]
+
+    def test_unknown_tools_are_not_validated(self) -> None:
+        validator = JsonSchemaArgumentValidator()
+
+        validator.validate("alpha", "search", {"anything": True})
+
+    def test_validators_are_compiled_once_per_schema(self) -> None:
+        validator = JsonSchemaArgumentValidator()
+        tools = [
+            {"name": "search", "inputSchema": SEARCH_SCHEMA},
+            {"name": "find", "inputSchema": dict(SEARCH_SCHEMA)},
+        ]
+
+        validator.update_backend(_backend("alpha", tools))
+        validator.update_backend(_backend("beta", tools))
+        validator.update_backend(_backend("alpha", tools))
+
+        assert validator.compiled_count == 1
+
+    def test_changed_schema_is_recompiled_and_old_one_evicted(self) -> None:
+        validator = JsonSchemaArgumentValidator()
+        validator.update_backend(
+            _backend("alpha", [{"name": "search", "inputSchema": SEARCH_SCHEMA}])
+        )
+        relaxed = {**SEARCH_SCHEMA, "required": []}
+
+        validator.update_backend(
+            _backend("alpha", [{"name": "search", "inputSchema": relaxed}])
+        )
+
+        validator.validate("alpha", "search", {})
+        assert validator.compiled_count == 2
+        assert len(validator._validators) == 1
+
+    def test_invalid_schema_disables_validation(self) -> None:
+        validator = JsonSchemaArgumentValidator()
+        validator.update_backend(
+            _backend("alpha", [{"name": "odd", "inputSchema": {"type": "nope"}}])
+        )
+
+        validator.validate("alpha", "odd", {"anything": True})
+
+    def test_removed_backend_is_forgotten(self) -> None:
+        validator = JsonSchemaArgumentValidator()
+        validator.update_backend(
+            _backend("alpha", [{"name": "search", "inputSchema": SEARCH_SCHEMA}])
+        )
+
+        validator.remove_backend("alpha")
+
+        validator.validate("alpha", "search", {})
+        assert validator._validators == {}
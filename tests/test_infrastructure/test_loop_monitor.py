@@ -0,0 +1,47 @@
+import asyncio
+import time
+
+from mcp_server.infrastructure.adapters import PrometheusMetrics
+from mcp_server.infrastructure.services import LoopMonitor
+
+
+def parse_yaml_synchronously(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+async def blocking_handler() -> None:
+    parse_yaml_synchronously(0.25)
+
+
+class TestLoopMonitor:
+    async def test_stall_records_task_and_stack(self) -> None:
+        metrics = PrometheusMetrics()
+        monitor = LoopMonitor(
+            metrics=metrics, interval_seconds=0.02, slow_threshold_seconds=0.05
+        )
+        await monitor.start()
+        await asyncio.sleep(0.05)
+
+        await asyncio.create_task(blocking_handler(), name="slow-call")
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+
+        stall = monitor.snapshot()["stalls"][-1]
+        assert stall["duration_seconds"] >= 0.2
+        assert stall["task"] == "slow-call"
+        assert any("parse_yaml_synchronously" in line for line in stall["stack"])
+        assert "mcp_router_event_loop_stall_seconds_count 1" in metrics.render()
+
+    async def test_idle_loop_records_lag_without_stalls(self) -> None:
+        metrics = PrometheusMetrics()
+        monitor = LoopMonitor(
+            metrics=metrics, interval_seconds=0.01, slow_threshold_seconds=0.1
+        )
+        await monitor.start()
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+
+        snapshot = monitor.snapshot()
+        assert snapshot["samples"] > 0
+        assert snapshot["stalls"] == []
+        assert "mcp_router_event_loop_lag_seconds_count" in metrics.render()
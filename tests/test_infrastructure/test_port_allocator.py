@@ -0,0 +1,187 @@
+import socket
+import sys
+
+import pytest
+
+from mcp_server.domain.exceptions import ProcessManagementError
+from mcp_server.domain.value_objects import ProcessConfig
+from mcp_server.infrastructure.adapters import PortAllocator, UvxProcessManager
+
+ACCEPT_ON_INHERITED_FD = """
+import os, socket
+s = socket.socket(fileno=int(os.environ["MCP_LISTEN_FD"]))
+conn, _ = s.accept()
+conn.sendall(b"hello")
+conn.close()
+"""
+
+NEVER_ACCEPTS = "import time; time.sleep(30)"
+
+HTTP_ON_INHERITED_FD = """
+import os, socket
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+class Handler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = b'{"jsonrpc": "2.0", "id": "mcp-router-ready", "result": {}}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+server = HTTPServer(("127.0.0.1", 0), Handler, bind_and_activate=False)
+server.socket.close()
+server.socket = socket.socket(fileno=int(os.environ["MCP_LISTEN_FD"]))
+server.serve_forever()
+"""
+
+
+def _free_range(size: int) -> tuple[int, int]:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        start = s.getsockname()[1]
+    return start, start + size
+
+
+def _can_bind(port: int) -> bool:
+    with socket.socket() as s:
+        try:
+            s.bind(("127.0.0.1", port))
+        except OSError:
+            return False
+        return True
+
+
+class TestPortAllocator:
+    async def test_allocated_port_is_reserved_until_released(self) -> None:
+        allocator = PortAllocator(*_free_range(4))
+
+        port = await allocator.allocate_port()
+
+        assert not _can_bind(port)
+        await allocator.release_port(port)
+        assert _can_bind(port)
+
+    async def test_allocations_are_unique_and_reused_after_release(self) -> None:
+        start, end = _free_range(2)
+        allocator = PortAllocator(start, end)
+
+        first = await allocator.allocate_port()
+        second = await allocator.allocate_port()
+        with pytest.raises(ProcessManagementError):
+            await allocator.allocate_port()
+        await allocator.release_port(first)
+
+        assert first != second
+        assert await allocator.allocate_port() == first
+
+    async def test_skips_ports_taken_by_other_processes(self) -> None:
+        start, end = _free_range(2)
+        allocator = PortAllocator(start, end)
+        with socket.socket() as taken:
+            taken.bind(("127.0.0.1", start))
+
+            port = await allocator.allocate_port()
+
+        assert port == start + 1
+
+    async def test_ephemeral_mode_asks_the_os(self) -> None:
+        allocator = PortAllocator(start_port=0, end_port=0)
+
+        ports = {await allocator.allocate_port() for _ in range(3)}
+
+        assert len(ports) == 3
+        assert all(not _can_bind(port) for port in ports)
+
+    async def test_listen_fd_keeps_the_reservation(self) -> None:
+        allocator = PortAllocator(start_port=0, end_port=0)
+        port = await allocator.allocate_port()
+
+        fd = allocator.listen_fd(port)
+
+        assert fd is not None
+        assert allocator.listen_fd(port) == fd
+        assert not _can_bind(port)
+        await allocator.release_port(port)
+        assert _can_bind(port)
+
+    async def test_listen_fd_rebinds_an_unbound_port(self) -> None:
+        allocator = PortAllocator(*_free_range(1))
+        port = await allocator.allocate_port()
+
+        allocator.unbind_port(port)
+        assert _can_bind(port)
+
+        assert allocator.listen_fd(port) is not None
+        assert not _can_bind(port)
+        await allocator.release_port(port)
+
+    async def test_process_inherits_listening_socket(self) -> None:
+        allocator = PortAllocator(start_port=0, end_port=0)
+        manager = UvxProcessManager(port_allocator=allocator)
+        port = await allocator.allocate_port()
+        config = ProcessConfig(
+            command=sys.executable,
+            args=("-c", ACCEPT_ON_INHERITED_FD),
+            inherit_socket=True,
+        ).with_port(port)
+
+        await manager.start_process(config)
+        with socket.create_connection(("127.0.0.1", port), timeout=5) as conn:
+            assert conn.recv(5) == b"hello"
+        await manager.shutdown_all()
+
+    async def test_restarted_process_inherits_the_socket_again(self) -> None:
+        allocator = PortAllocator(start_port=0, end_port=0)
+        manager = UvxProcessManager(port_allocator=allocator)
+        port = await allocator.allocate_port()
+        config = ProcessConfig(
+            command=sys.executable,
+            args=("-c", ACCEPT_ON_INHERITED_FD),
+            inherit_socket=True,
+        ).with_port(port)
+
+        pid = await manager.start_process(config)
+        with socket.create_connection(("127.0.0.1", port), timeout=5) as conn:
+            assert conn.recv(5) == b"hello"
+        await manager.restart_process(pid, config)
+
+        with socket.create_connection(("127.0.0.1", port), timeout=5) as conn:
+            assert conn.recv(5) == b"hello"
+        await manager.shutdown_all()
+        await allocator.release_port(port)
+
+    async def test_inherited_socket_is_not_ready_until_child_serves(self) -> None:
+        allocator = PortAllocator(start_port=0, end_port=0)
+        manager = UvxProcessManager(port_allocator=allocator)
+        port = await allocator.allocate_port()
+        config = ProcessConfig(
+            command=sys.executable,
+            args=("-c", NEVER_ACCEPTS),
+            inherit_socket=True,
+        ).with_port(port)
+
+        pid = await manager.start_process(config)
+        with pytest.raises(ProcessManagementError, match="not ready"):
+            await manager.wait_until_ready(pid, timeout=0.5)
+        await manager.shutdown_all()
+        await allocator.release_port(port)
+
+    async def test_inherited_socket_is_ready_after_initialize(self) -> None:
+        allocator = PortAllocator(start_port=0, end_port=0)
+        manager = UvxProcessManager(port_allocator=allocator)
+        port = await allocator.allocate_port()
+        config = ProcessConfig(
+            command=sys.executable,
+            args=("-c", HTTP_ON_INHERITED_FD),
+            inherit_socket=True,
+        ).with_port(port)
+
+        pid = await manager.start_process(config)
+        await manager.wait_until_ready(pid, timeout=10)
+
+        assert await manager.is_process_alive(pid)
+        await manager.shutdown_all()
+        await allocator.release_port(port)
@@ -0,0 +1,51 @@
+from mcp_server.infrastructure.adapters import PrometheusMetrics
+
+
+class TestPrometheusMetrics:
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        metrics = PrometheusMetrics()
+        metrics.request_started("alpha")
+        metrics.request_finished("alpha", "search", 0.003, "success")
+        metrics.request_started("alpha")
+        metrics.request_finished("alpha", "search", 0.2, "success")
+
+        text = metrics.render()
+
+        name = "mcp_router_request_duration_seconds"
+        labels = 'backend="alpha",tool="search"'
+        assert f'{name}_bucket{{{labels},le="0.005"}} 1' in text
+        assert f'{name}_bucket{{{labels},le="0.25"}} 2' in text
+        assert f'{name}_bucket{{{labels},le="+Inf"}} 2' in text
+        assert f"{name}_count{{{labels}}} 2" in text
+
+    def test_tool_labels_are_bounded(self) -> None:
+        metrics = PrometheusMetrics(max_tools_per_backend=2)
+
+        for tool in ("a", "b", "c", "d"):
+            metrics.request_finished("alpha", tool, 0.01, "success")
+
+        text = metrics.render()
+        assert 'tool="c"' not in text
+        assert (
+            'mcp_router_requests_total{backend="alpha",tool="__other__",'
+            'outcome="success"} 2' in text
+        )
+
+    def test_cache_hit_ratio(self) -> None:
+        metrics = PrometheusMetrics()
+
+        metrics.record_cache_lookup("catalog", True)
+        metrics.record_cache_lookup("catalog", True)
+        metrics.record_cache_lookup("catalog", True)
+        metrics.record_cache_lookup("catalog", False)
+
+        text = metrics.render()
+        assert 'mcp_router_cache_lookups_total{cache="catalog",result="miss"} 1' in text
+        assert 'mcp_router_cache_hit_ratio{cache="catalog"} 0.75' in text
+
+    def test_label_values_are_escaped(self) -> None:
+        metrics = PrometheusMetrics()
+
+        metrics.record_process_restart('we"ird\nname')
+
+        assert 'backend="we\\"ird\\nname"' in metrics.render()
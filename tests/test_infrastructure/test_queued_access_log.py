@@ -0,0 +1,128 @@
+import json
+import queue
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from mcp_server.application.dtos import AccessLogEntry, ToolCallRequest
+from mcp_server.application.use_cases import DiscoverCapabilities, RouteToolCall
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.value_objects import (
+    BackendConfig,
+    BackendSource,
+    BackendSourceType,
+)
+from mcp_server.infrastructure.adapters import QueuedAccessLog
+from mcp_server.infrastructure.repositories import InMemoryBackendRepository
+from tests.fakes import FakeMCPClient
+
+
+async def _logged_route(
+    access_log: QueuedAccessLog, failures: int = 0, attempts: int = 3
+) -> RouteToolCall:
+    repository = InMemoryBackendRepository()
+    client_factory: dict[str, Any] = {
+        "alpha": FakeMCPClient(tools=[{"name": "search"}], failures=failures)
+    }
+    repository.add(
+        Backend(
+            config=BackendConfig(
+                name="alpha",
+                source=BackendSource(
+                    source_type=BackendSourceType.HTTP,
+                    http_url="http://localhost:9001",
+                ),
+                namespace="alpha",
+            )
+        )
+    )
+    await DiscoverCapabilities(repository, client_factory).execute()
+    return RouteToolCall(
+        repository,
+        client_factory,
+        max_retry_attempts=attempts,
+        max_retry_backoff=0,
+        access_log=access_log,
+    )
+
+
+def _read(path: Path) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def _entry(outcome: str = "success", latency: float = 0.001) -> AccessLogEntry:
+    return AccessLogEntry(
+        tool_name="search",
+        arguments={},
+        timestamp=0.0,
+        strategy="capability",
+        backend_name="alpha",
+        attempts=1,
+        latency_seconds=latency,
+        outcome=outcome,
+    )
+
+
+class TestQueuedAccessLog:
+    async def test_one_record_per_call_with_attempts_and_bytes(
+        self, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "access.jsonl"
+        access_log = QueuedAccessLog(str(path))
+        route = await _logged_route(access_log, failures=1)
+
+        await route.execute(ToolCallRequest(tool_name="search", arguments={"q": "x"}))
+        await access_log.close()
+
+        [record] = _read(path)
+        assert record["tool"] == "search"
+        assert record["backend"] == "alpha"
+        assert record["strategy"] == "capability"
+        assert record["attempts"] == 2
+        assert record["outcome"] == "success"
+        assert record["request_bytes"] == len('{"q":"x"}')
+        assert record["response_bytes"] > 0
+        assert record["latency_ms"] >= 0
+
+    async def test_failed_call_records_error(self, tmp_path: Path) -> None:
+        path = tmp_path / "access.jsonl"
+        access_log = QueuedAccessLog(str(path), sample_rate=0.0)
+        route = await _logged_route(access_log, failures=5, attempts=2)
+
+        with pytest.raises(ConnectionError):
+            await route.execute(ToolCallRequest(tool_name="search", arguments={}))
+        await access_log.close()
+
+        [record] = _read(path)
+        assert record["outcome"] == "error"
+        assert record["attempts"] == 2
+        assert record["response_bytes"] == 0
+        assert record["error"]
+
+    async def test_sampling_keeps_errors_and_slow_calls(self, tmp_path: Path) -> None:
+        path = tmp_path / "access.jsonl"
+        access_log = QueuedAccessLog(
+            str(path), sample_rate=0.0, slow_threshold_seconds=0.5
+        )
+
+        access_log.record(_entry())
+        access_log.record(_entry(outcome="invalid_arguments"))
+        access_log.record(_entry(latency=0.6))
+        await access_log.close()
+
+        records = _read(path)
+        assert [r["outcome"] for r in records] == ["invalid_arguments", "success"]
+        assert access_log.sampled_out == 1
+
+    async def test_full_queue_drops_instead_of_blocking(self, tmp_path: Path) -> None:
+        access_log = QueuedAccessLog(str(tmp_path / "access.jsonl"))
+        writer_queue = access_log._queue
+        access_log._queue = queue.Queue(maxsize=1)
+
+        access_log.record(_entry(outcome="error"))
+        access_log.record(_entry(outcome="error"))
+
+        assert access_log.dropped == 1
+        access_log._queue = writer_queue
+        await access_log.close()
@@ -0,0 +1,69 @@
+import asyncio
+import time
+
+import pytest
+
+from mcp_server.infrastructure.services import (
+    ProfilingInProgressError,
+    RuntimeProfiler,
+)
+
+
+def busy_router_work(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(1000))
+
+
+async def busy_task() -> None:
+    for _ in range(20):
+        busy_router_work(0.01)
+        await asyncio.sleep(0)
+
+
+async def idle_task() -> None:
+    await asyncio.sleep(10)
+
+
+class TestRuntimeProfiler:
+    async def test_cpu_profile_finds_hot_function(self, tmp_path) -> None:
+        profiler = RuntimeProfiler(str(tmp_path))
+        idle = asyncio.create_task(idle_task(), name="idle")
+
+        profile, _ = await asyncio.gather(
+            profiler.profile_cpu(0.3, interval_ms=2, top=10),
+            busy_task(),
+        )
+        idle.cancel()
+
+        assert profile["samples"] > 0
+        frames = [entry["frame"] for entry in profile["top_self"]]
+        assert any(frame.startswith("busy_router_work") for frame in frames)
+        folded = (tmp_path / profile["file"].rsplit("/", 1)[1]).read_text()
+        assert "event-loop;" in folded
+        assert "task:idle;idle_task" in folded
+
+    async def test_heap_profile_reports_growth(self, tmp_path) -> None:
+        profiler = RuntimeProfiler(str(tmp_path))
+        retained: list[bytes] = []
+
+        async def allocate() -> None:
+            await asyncio.sleep(0.05)
+            retained.extend(bytes(1024) for _ in range(500))
+
+        profile, _ = await asyncio.gather(profiler.profile_heap(0.2, top=5), allocate())
+
+        assert profile["top_growth"][0]["size_diff_bytes"] >= 500 * 1024
+        assert "test_runtime_profiler.py" in profile["top_growth"][0]["location"]
+        assert retained
+
+    async def test_only_one_session_runs_at_a_time(self, tmp_path) -> None:
+        profiler = RuntimeProfiler(str(tmp_path))
+        first = asyncio.create_task(profiler.profile_cpu(0.2))
+        await asyncio.sleep(0.05)
+
+        with pytest.raises(ProfilingInProgressError):
+            await profiler.profile_heap(0.1)
+
+        await first
+        assert profiler.active_session is None
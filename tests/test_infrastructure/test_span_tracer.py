@@ -0,0 +1,155 @@
+import json
+from typing import Any
+
+import httpx
+import respx
+
+from mcp_server.application.dtos import ToolCallRequest
+from mcp_server.application.use_cases import DiscoverCapabilities, RouteToolCall
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.value_objects import (
+    BackendConfig,
+    BackendSource,
+    BackendSourceType,
+)
+from mcp_server.infrastructure.adapters import (
+    HTTPMCPClient,
+    JsonLinesSpanExporter,
+    OtlpHttpSpanExporter,
+    Span,
+    SpanExporter,
+    SpanTracer,
+)
+from mcp_server.infrastructure.repositories import InMemoryBackendRepository
+from tests.fakes import FakeMCPClient
+
+
+class RecordingExporter(SpanExporter):
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    async def export(self, spans: list[Span]) -> None:
+        self.spans.extend(spans)
+
+
+async def _traced_route(tracer: SpanTracer, failures: int = 0) -> RouteToolCall:
+    repository = InMemoryBackendRepository()
+    client_factory: dict[str, Any] = {
+        "alpha": FakeMCPClient(tools=[{"name": "search"}], failures=failures)
+    }
+    repository.add(
+        Backend(
+            config=BackendConfig(
+                name="alpha",
+                source=BackendSource(
+                    source_type=BackendSourceType.HTTP,
+                    http_url="http://localhost:9001",
+                ),
+                namespace="alpha",
+            )
+        )
+    )
+    await DiscoverCapabilities(repository, client_factory).execute()
+    return RouteToolCall(
+        repository,
+        client_factory,
+        max_retry_attempts=3,
+        max_retry_backoff=0,
+        tracer=tracer,
+    )
+
+
+class TestSpanTracer:
+    async def test_call_produces_one_trace_with_retry_spans(self) -> None:
+        exporter = RecordingExporter()
+        tracer = SpanTracer(exporter)
+        route = await _traced_route(tracer, failures=1)
+
+        await route.execute(ToolCallRequest(tool_name="search", arguments={}))
+        await tracer.flush()
+
+        names = [span.name for span in exporter.spans]
+        assert sorted(names) == sorted(
+            [
+                "routing_decision",
+                "backend_request",
+                "attempt",
+                "backoff",
+                "backend_request",
+                "attempt",
+                "route_tool_call",
+            ]
+        )
+        assert len({span.trace_id for span in exporter.spans}) == 1
+        root = next(s for s in exporter.spans if s.name == "route_tool_call")
+        assert root.parent_id is None
+        failed = [s for s in exporter.spans if s.name == "attempt" and s.error]
+        assert len(failed) == 1
+        assert failed[0].attributes["attempt"] == 1
+
+    async def test_unsampled_calls_record_nothing(self) -> None:
+        exporter = RecordingExporter()
+        tracer = SpanTracer(exporter, sample_rate=0.0)
+        route = await _traced_route(tracer)
+
+        await route.execute(ToolCallRequest(tool_name="search", arguments={}))
+        await tracer.flush()
+
+        assert exporter.spans == []
+
+    @respx.mock
+    async def test_backend_request_carries_traceparent(self) -> None:
+        route = respx.post("http://backend/tools/search").mock(
+            return_value=httpx.Response(200, json={"ok": True})
+        )
+        tracer = SpanTracer(RecordingExporter())
+        client = HTTPMCPClient("http://backend")
+
+        with tracer.span("backend_request") as span:
+            await client.call_tool("search", {})
+
+        assert route.calls.last.request.headers["traceparent"] == span.traceparent
+        assert span.traceparent.startswith(f"00-{span.trace_id}-{span.span_id}")
+
+    @respx.mock
+    async def test_untraced_request_has_no_traceparent(self) -> None:
+        route = respx.post("http://backend/tools/search").mock(
+            return_value=httpx.Response(200, json={"ok": True})
+        )
+
+        await HTTPMCPClient("http://backend").call_tool("search", {})
+
+        assert "traceparent" not in route.calls.last.request.headers
+
+
+class TestSpanExporters:
+    async def test_json_lines_exporter_appends_spans(self, tmp_path) -> None:
+        path = tmp_path / "traces.jsonl"
+        tracer = SpanTracer(JsonLinesSpanExporter(str(path)))
+
+        with tracer.span("outer", tool="search"):
+            with tracer.span("inner"):
+                pass
+        await tracer.flush()
+
+        lines = [json.loads(line) for line in path.read_text().splitlines()]
+        inner, outer = lines
+        assert inner["parent_id"] == outer["span_id"]
+        assert outer["attributes"] == {"tool": "search"}
+
+    def test_otlp_encoding(self) -> None:
+        tracer = SpanTracer(RecordingExporter())
+        try:
+            with tracer.span("call", attempt=2):
+                raise ConnectionError("boom")
+        except ConnectionError:
+            pass
+        span = tracer._pending[0]
+
+        payload = OtlpHttpSpanExporter().encode([span])
+
+        encoded = payload["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+        assert encoded["traceId"] == span.trace_id
+        assert encoded["attributes"] == [{"key": "attempt", "value": {"intValue": "2"}}]
+        assert encoded["status"] == {"code": 2, "message": "ConnectionError: boom"}
+        assert "parentSpanId" not in encoded
@@ -0,0 +1,188 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from mcp_server.application.dtos import ToolCallRequest
+from mcp_server.application.use_cases import RouteToolCall
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.exceptions import RoutingError
+from mcp_server.domain.value_objects import (
+    BackendConfig,
+    BackendSource,
+    BackendSourceType,
+    CircuitState,
+)
+from mcp_server.infrastructure.repositories import SqliteBackendRepository
+from mcp_server.infrastructure.repositories.sqlite_backend_repository import (
+    open_state_db,
+)
+from tests.fakes import FakeMCPClient
+
+
+def _backend() -> Backend:
+    return Backend(
+        config=BackendConfig(
+            name="alpha",
+            source=BackendSource(
+                source_type=BackendSourceType.HTTP,
+                http_url="http://localhost:9001",
+            ),
+            namespace="alpha",
+        ),
+        tools=[{"name": "search"}],
+    )
+
+
+async def _workers(
+    tmp_path: Path, owner: bool = True
+) -> tuple[SqliteBackendRepository, SqliteBackendRepository]:
+    path = str(tmp_path / "state.db")
+    first = SqliteBackendRepository(path, sync_interval_ms=0)
+    second = SqliteBackendRepository(path, owner=owner, sync_interval_ms=0)
+    first.add(_backend())
+    second.add(_backend())
+    await _written(first)
+    await _written(second)
+    return first, second
+
+
+async def _written(repository: SqliteBackendRepository) -> None:
+    if repository._writer:
+        await repository._writer
+
+
+class TestSqliteBackendRepository:
+    async def test_failures_from_all_workers_count_towards_the_circuit(
+        self, tmp_path: Path
+    ) -> None:
+        first, second = await _workers(tmp_path)
+
+        for _ in range(3):
+            await first.update_health(
+                first.get("alpha"), lambda b: b.record_failure("x")
+            )
+        for _ in range(2):
+            await second.update_health(
+                second.get("alpha"), lambda b: b.record_failure("y")
+            )
+
+        for repository in (first, second):
+            status = repository.get("alpha").health_status
+            assert status.error_count == 5
+            assert status.circuit_state == CircuitState.OPEN
+            assert repository.get_healthy() == []
+
+    async def test_success_and_latency_are_shared(self, tmp_path: Path) -> None:
+        first, second = await _workers(tmp_path)
+        await first.update_health(first.get("alpha"), lambda b: b.record_failure("x"))
+
+        await second.update_health(second.get("alpha"), lambda b: b.record_success(0.2))
+        await first.update_health(first.get("alpha"), lambda b: b.record_success(0.1))
+
+        alpha = second.get("alpha")
+        assert alpha.is_healthy
+        assert alpha.health_status.error_count == 0
+        assert alpha.latency.count == 2
+        assert alpha.latency.max_seconds == pytest.approx(0.2)
+
+    async def test_added_backend_takes_existing_shared_state(
+        self, tmp_path: Path
+    ) -> None:
+        first, _ = await _workers(tmp_path)
+        await first.update_health(first.get("alpha"), Backend.open_circuit)
+
+        restarted = SqliteBackendRepository(str(tmp_path / "state.db"))
+        restarted.add(_backend())
+        await _written(restarted)
+
+        assert restarted.get("alpha").is_circuit_open
+
+    async def test_only_the_owner_deletes_shared_state(self, tmp_path: Path) -> None:
+        owner, worker = await _workers(tmp_path, owner=False)
+        await owner.update_health(owner.get("alpha"), Backend.open_circuit)
+
+        worker.remove("alpha")
+        await _written(worker)
+        assert owner.get("alpha").is_circuit_open
+
+        owner.remove("alpha")
+        await _written(owner)
+        owner.add(_backend())
+        await _written(owner)
+        assert not owner.get("alpha").is_circuit_open
+
+    async def test_shared_state_is_polled_at_most_once_per_interval(
+        self, tmp_path: Path
+    ) -> None:
+        first, _ = await _workers(tmp_path)
+        path = str(tmp_path / "state.db")
+        throttled = SqliteBackendRepository(path, sync_interval_ms=60_000)
+        throttled.add(_backend())
+        await _written(throttled)
+        throttled.get("alpha")
+
+        await first.update_health(first.get("alpha"), Backend.open_circuit)
+
+        assert not throttled.get("alpha").is_circuit_open
+        throttled._next_sync = 0.0
+        assert throttled.get("alpha").is_circuit_open
+
+    async def test_concurrent_updates_are_coalesced(self, tmp_path: Path) -> None:
+        first, second = await _workers(tmp_path)
+        batches = []
+        write_batch = first._write_batch
+
+        def counting_write_batch(batch, deleted):
+            batches.append(batch)
+            return write_batch(batch, deleted)
+
+        first._write_batch = counting_write_batch
+        alpha = first.get("alpha")
+
+        await asyncio.gather(
+            *(
+                first.update_health(alpha, lambda b: b.record_success(0.1))
+                for _ in range(50)
+            )
+        )
+
+        assert len(batches) < 50
+        assert alpha.latency.count == 50
+        assert second.get("alpha").latency.count == 50
+
+    async def test_locked_database_does_not_block_the_loop(
+        self, tmp_path: Path
+    ) -> None:
+        first, _ = await _workers(tmp_path)
+        blocker = open_state_db(str(tmp_path / "state.db"))
+        blocker.execute("BEGIN IMMEDIATE")
+
+        update = asyncio.create_task(
+            first.update_health(first.get("alpha"), lambda b: b.record_failure("x"))
+        )
+        await asyncio.sleep(0.05)
+
+        assert not update.done()
+        blocker.execute("COMMIT")
+        await update
+        assert first.get("alpha").health_status.error_count == 1
+
+    async def test_circuit_opened_by_one_worker_stops_routing_on_another(
+        self, tmp_path: Path
+    ) -> None:
+        first, second = await _workers(tmp_path)
+        route = RouteToolCall(
+            first,
+            {"alpha": FakeMCPClient(failures=5)},
+            max_retry_attempts=5,
+            max_retry_backoff=0,
+        )
+        with pytest.raises(ConnectionError):
+            await route.execute(ToolCallRequest(tool_name="search", arguments={}))
+
+        client = FakeMCPClient()
+        other = RouteToolCall(second, {"alpha": client})
+        with pytest.raises(RoutingError):
+            await other.execute(ToolCallRequest(tool_name="search", arguments={}))
+        assert client.calls == []
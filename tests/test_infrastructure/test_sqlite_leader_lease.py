@@ -0,0 +1,49 @@
+import asyncio
+import time
+from pathlib import Path
+
+from mcp_server.infrastructure.adapters import SqliteLeaderLease
+from mcp_server.infrastructure.repositories.sqlite_backend_repository import (
+    open_state_db,
+)
+
+
+class TestSqliteLeaderLease:
+    async def test_only_one_holder_until_released(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "state.db")
+        first, second = SqliteLeaderLease(path), SqliteLeaderLease(path)
+
+        assert await first.renew()
+        assert not await second.renew()
+        assert await first.renew()
+
+        first.release()
+        assert await second.renew()
+        assert second.is_leader
+
+    async def test_expired_lease_is_taken_over(self, tmp_path: Path) -> None:
+        path = str(tmp_path / "state.db")
+        first = SqliteLeaderLease(path, ttl_seconds=0.05)
+        second = SqliteLeaderLease(path, ttl_seconds=0.05)
+        assert await first.renew()
+
+        time.sleep(0.1)
+
+        assert not first.is_leader
+        assert await second.renew()
+        assert not await first.renew()
+
+    async def test_locked_database_does_not_block_the_loop(
+        self, tmp_path: Path
+    ) -> None:
+        path = str(tmp_path / "state.db")
+        lease = SqliteLeaderLease(path)
+        blocker = open_state_db(path)
+        blocker.execute("BEGIN IMMEDIATE")
+
+        renewal = asyncio.create_task(lease.renew())
+        await asyncio.sleep(0.05)
+
+        assert not renewal.done()
+        blocker.execute("COMMIT")
+        assert await renewal
@@ -0,0 +1,73 @@
+import time
+from pathlib import Path
+
+from mcp_server.application.dtos import CachedResource
+from mcp_server.infrastructure.adapters import TieredResourceCache
+
+
+def _entry(content: str, etag: str | None = None) -> CachedResource:
+    now = time.time()
+    return CachedResource(
+        content=content,
+        etag=etag,
+        last_modified=None,
+        fresh_until=now + 60,
+        stale_until=now + 60,
+    )
+
+
+class TestTieredResourceCache:
+    async def test_memory_tier_evicts_least_recently_used_by_bytes(self) -> None:
+        cache = TieredResourceCache(max_bytes=10)
+        await cache.put("alpha", "a", _entry("aaaa"))
+        await cache.put("alpha", "b", _entry("bbbb"))
+        await cache.get("alpha", "a")
+
+        await cache.put("alpha", "c", _entry("cccc"))
+
+        assert await cache.get("alpha", "b") is None
+        assert (await cache.get("alpha", "a")).content == "aaaa"
+        assert cache.memory_bytes == 8
+
+    async def test_disk_tier_survives_restart_and_keeps_validators(
+        self, tmp_path: Path
+    ) -> None:
+        cache = TieredResourceCache(disk_dir=str(tmp_path))
+        await cache.put("alpha", "docs://readme", _entry("hello\nworld", '"v1"'))
+
+        restarted = TieredResourceCache(disk_dir=str(tmp_path))
+        entry = await restarted.get("alpha", "docs://readme")
+
+        assert entry.content == "hello\nworld"
+        assert entry.etag == '"v1"'
+        assert restarted.memory_bytes == entry.size
+
+    async def test_entries_evicted_from_memory_are_read_from_disk(
+        self, tmp_path: Path
+    ) -> None:
+        cache = TieredResourceCache(max_bytes=4, disk_dir=str(tmp_path))
+        await cache.put("alpha", "a", _entry("aaaa"))
+        await cache.put("alpha", "b", _entry("bbbb"))
+
+        assert (await cache.get("alpha", "a")).content == "aaaa"
+
+    async def test_invalidate_removes_both_tiers(self, tmp_path: Path) -> None:
+        cache = TieredResourceCache(disk_dir=str(tmp_path))
+        await cache.put("alpha", "a", _entry("aaaa"))
+        await cache.put("alpha", "b", _entry("bbbb"))
+        await cache.put("beta", "a", _entry("cccc"))
+
+        assert await cache.invalidate("alpha") == 2
+
+        assert len(list(tmp_path.iterdir())) == 1
+        restarted = TieredResourceCache(disk_dir=str(tmp_path))
+        assert await restarted.get("alpha", "a") is None
+        assert (await restarted.get("beta", "a")).content == "cccc"
+
+    async def test_disk_tier_respects_its_budget(self, tmp_path: Path) -> None:
+        cache = TieredResourceCache(disk_dir=str(tmp_path), disk_max_bytes=400)
+        for name in "abcdef":
+            await cache.put("alpha", name, _entry(name * 100))
+
+        assert cache.disk_bytes <= 400
+        assert len(list(tmp_path.iterdir())) == len(cache._disk)
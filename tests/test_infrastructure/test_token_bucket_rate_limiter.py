@@ -0,0 +1,102 @@
+import pytest
+
+from mcp_server.domain.exceptions import RateLimitExceededError
+from mcp_server.domain.value_objects import RateLimitRule
+from mcp_server.infrastructure.adapters import (
+    TokenBucketRateLimiter,
+    token_bucket_rate_limiter,
+)
+
+BACKEND = RateLimitRule("backend", rate_per_second=10, burst=3)
+EXPORTS = RateLimitRule("tool", rate_per_second=1, burst=1, pattern="export_*")
+CLIENTS = RateLimitRule("client", rate_per_second=2, burst=2)
+
+
+@pytest.fixture
+def clock(monkeypatch) -> list[float]:
+    now = [1000.0]
+    monkeypatch.setattr(token_bucket_rate_limiter.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestRateLimitRule:
+    def test_rejects_invalid_values(self) -> None:
+        with pytest.raises(ValueError):
+            RateLimitRule("global", rate_per_second=1)
+        with pytest.raises(ValueError):
+            RateLimitRule("backend", rate_per_second=0)
+        with pytest.raises(ValueError):
+            RateLimitRule("backend", rate_per_second=1, burst=0.5)
+
+    def test_subject_depends_on_scope(self) -> None:
+        assert BACKEND.subject("search", "desktop") == ""
+        assert EXPORTS.subject("search", "desktop") is None
+        assert EXPORTS.subject("export_csv", "desktop") == ""
+        assert CLIENTS.subject("search", "desktop") == "desktop"
+        batch_only = RateLimitRule("client", rate_per_second=1, pattern="batch-*")
+        assert batch_only.subject("search", "desktop") is None
+
+
+class TestTokenBucketRateLimiter:
+    def test_burst_then_reject_with_retry_after(self, clock) -> None:
+        limiter = TokenBucketRateLimiter()
+        for _ in range(3):
+            limiter.acquire("alpha", (BACKEND,), "search", None)
+
+        with pytest.raises(RateLimitExceededError) as excinfo:
+            limiter.acquire("alpha", (BACKEND,), "search", None)
+
+        assert excinfo.value.scope == "backend"
+        assert excinfo.value.retry_after_seconds == pytest.approx(0.1)
+        assert "retry after 0.10s" in str(excinfo.value)
+
+    def test_tokens_refill_over_time(self, clock) -> None:
+        limiter = TokenBucketRateLimiter()
+        for _ in range(3):
+            limiter.acquire("alpha", (BACKEND,), "search", None)
+
+        clock[0] += 0.1
+        limiter.acquire("alpha", (BACKEND,), "search", None)
+        with pytest.raises(RateLimitExceededError):
+            limiter.acquire("alpha", (BACKEND,), "search", None)
+
+    def test_rejection_does_not_consume_other_buckets(self, clock) -> None:
+        limiter = TokenBucketRateLimiter()
+        rules = (BACKEND, EXPORTS)
+        limiter.acquire("alpha", rules, "export_csv", None)
+
+        for _ in range(3):
+            with pytest.raises(RateLimitExceededError) as excinfo:
+                limiter.acquire("alpha", rules, "export_csv", None)
+            assert excinfo.value.scope == "tool"
+
+        limiter.acquire("alpha", rules, "search", None)
+        limiter.acquire("alpha", rules, "search", None)
+
+    def test_clients_and_backends_are_isolated(self, clock) -> None:
+        limiter = TokenBucketRateLimiter()
+        for _ in range(2):
+            limiter.acquire("alpha", (CLIENTS,), "search", "desktop")
+        with pytest.raises(RateLimitExceededError):
+            limiter.acquire("alpha", (CLIENTS,), "search", "desktop")
+
+        limiter.acquire("alpha", (CLIENTS,), "search", "batch")
+        limiter.acquire("beta", (CLIENTS,), "search", "desktop")
+
+    def test_idle_buckets_are_evicted(self, clock) -> None:
+        limiter = TokenBucketRateLimiter()
+        for client_id in ("a", "b", "c"):
+            limiter.acquire("alpha", (CLIENTS,), "search", client_id)
+        assert limiter.bucket_count == 3
+
+        clock[0] += 1.0
+        limiter.acquire("alpha", (CLIENTS,), "search", "d")
+
+        assert limiter.bucket_count == 1
+
+    def test_key_count_is_capped(self, clock) -> None:
+        limiter = TokenBucketRateLimiter(max_keys=2)
+        for client_id in ("a", "b", "c"):
+            limiter.acquire("alpha", (CLIENTS,), "search", client_id)
+
+        assert limiter.bucket_count == 2
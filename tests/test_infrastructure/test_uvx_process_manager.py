@@ -0,0 +1,125 @@
+import socket
+import sys
+import time
+
+import pytest
+
+from mcp_server.domain.exceptions import ProcessManagementError
+from mcp_server.domain.value_objects import ProcessConfig
+from mcp_server.infrastructure.adapters import UvxProcessManager
+
+LISTENER = """
+import os, socket, time
+time.sleep(0.2)
+s = socket.socket()
+s.bind(("127.0.0.1", int(os.environ["PORT"])))
+s.listen()
+time.sleep(30)
+"""
+
+STDIO_SERVER = """
+import json, sys, time
+request = json.loads(sys.stdin.readline())
+print("starting up", flush=True)
+time.sleep(0.1)
+print(json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": {}}), flush=True)
+time.sleep(30)
+"""
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class TestUvxProcessManagerReadiness:
+    async def test_ready_when_port_accepts(self) -> None:
+        manager = UvxProcessManager()
+        config = ProcessConfig(
+            command=sys.executable, args=("-c", LISTENER)
+        ).with_port(_free_port())
+
+        pid = await manager.start_process(config)
+        started = time.monotonic()
+        await manager.wait_until_ready(pid, timeout=10)
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 2
+        assert await manager.is_process_alive(pid)
+        await manager.shutdown_all()
+
+    async def test_ready_on_output_line(self) -> None:
+        manager = UvxProcessManager()
+        config = ProcessConfig(
+            command=sys.executable,
+            args=("-c", "import time; print('ready', flush=True); time.sleep(30)"),
+            ready_pattern=r"^ready$",
+        )
+
+        pid = await manager.start_process(config)
+        await manager.wait_until_ready(pid, timeout=10)
+
+        assert await manager.is_process_alive(pid)
+        await manager.shutdown_all()
+
+    async def test_fails_fast_when_process_exits(self) -> None:
+        manager = UvxProcessManager()
+        config = ProcessConfig(
+            command=sys.executable, args=("-c", "raise SystemExit(3)")
+        ).with_port(_free_port())
+
+        pid = await manager.start_process(config)
+        started = time.monotonic()
+        with pytest.raises(ProcessManagementError, match="exited with code 3"):
+            await manager.wait_until_ready(pid, timeout=10)
+
+        assert time.monotonic() - started < 5
+        await manager.shutdown_all()
+
+    async def test_times_out_when_never_ready(self) -> None:
+        manager = UvxProcessManager()
+        config = ProcessConfig(
+            command=sys.executable,
+            args=("-c", "import time; time.sleep(30)"),
+            ready_pattern=r"never",
+        )
+
+        pid = await manager.start_process(config)
+        with pytest.raises(ProcessManagementError, match="not ready"):
+            await manager.wait_until_ready(pid, timeout=0.2)
+        await manager.shutdown_all()
+
+    async def test_ready_after_stdio_initialize(self) -> None:
+        manager = UvxProcessManager()
+        config = ProcessConfig(command=sys.executable, args=("-c", STDIO_SERVER))
+
+        pid = await manager.start_process(config)
+        started = time.monotonic()
+        await manager.wait_until_ready(pid, timeout=10)
+
+        assert time.monotonic() - started >= 0.1
+        assert await manager.is_process_alive(pid)
+        await manager.shutdown_all()
+
+    async def test_silent_stdio_process_is_not_ready(self) -> None:
+        manager = UvxProcessManager()
+        config = ProcessConfig(
+            command=sys.executable, args=("-c", "import time; time.sleep(30)")
+        )
+
+        pid = await manager.start_process(config)
+        with pytest.raises(ProcessManagementError, match="not ready"):
+            await manager.wait_until_ready(pid, timeout=0.3)
+        await manager.shutdown_all()
+
+    async def test_initialize_fails_fast_when_process_exits(self) -> None:
+        manager = UvxProcessManager()
+        config = ProcessConfig(
+            command=sys.executable, args=("-c", "raise SystemExit(4)")
+        )
+
+        pid = await manager.start_process(config)
+        with pytest.raises(ProcessManagementError, match="exited with code 4"):
+            await manager.wait_until_ready(pid, timeout=10)
+        await manager.shutdown_all()
@@ -0,0 +1,92 @@
+import asyncio
+
+from mcp_server.domain.value_objects import ProcessConfig
+from mcp_server.infrastructure.adapters import WarmProcessPool
+from tests.fakes import FakePortAllocator, FakeProcessManager
+
+
+class StalledProcessManager(FakeProcessManager):
+    async def wait_until_ready(self, pid: int, timeout: float = 30.0) -> None:
+        await asyncio.Event().wait()
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestWarmProcessPool:
+    async def test_acquire_unknown_package_returns_none(self) -> None:
+        manager = FakeProcessManager()
+        pool = WarmProcessPool(manager, FakePortAllocator(), size=2)
+
+        spare = await pool.acquire(ProcessConfig(command="uvx", args=("pkg",)))
+
+        assert spare is None
+        assert manager.started == []
+
+    async def test_prewarm_spawns_spares_on_own_ports(self) -> None:
+        manager = FakeProcessManager()
+        config = ProcessConfig(command="uvx", args=("pkg",))
+        pool = WarmProcessPool(manager, FakePortAllocator(), size=2)
+
+        await pool.prewarm(config)
+        await _settle()
+
+        assert pool.spare_count(config) == 2
+        assert {c.port for c in manager.started} == {9001, 9002}
+        assert all(c.env["PORT"] == str(c.port) for c in manager.started)
+
+    async def test_acquire_hands_out_spare_and_refills(self) -> None:
+        manager = FakeProcessManager()
+        config = ProcessConfig(command="uvx", args=("pkg",), port=8100)
+        pool = WarmProcessPool(manager, FakePortAllocator(), size=1)
+        await pool.prewarm(config)
+        await _settle()
+
+        spare = await pool.acquire(config.with_port(8200))
+        await _settle()
+
+        assert spare is not None
+        assert spare.pid in manager.alive
+        assert pool.spare_count(config) == 1
+        assert len(manager.started) == 2
+
+    async def test_acquire_discards_dead_spares(self) -> None:
+        manager = FakeProcessManager()
+        allocator = FakePortAllocator()
+        config = ProcessConfig(command="uvx", args=("pkg",))
+        pool = WarmProcessPool(manager, allocator, size=1)
+        await pool.prewarm(config)
+        await _settle()
+        manager.alive.clear()
+
+        spare = await pool.acquire(config)
+
+        assert spare is None
+        assert allocator.released == [9001]
+
+    async def test_shutdown_stops_spares(self) -> None:
+        manager = FakeProcessManager()
+        config = ProcessConfig(command="uvx", args=("pkg",))
+        pool = WarmProcessPool(manager, FakePortAllocator(), size=2)
+        await pool.prewarm(config)
+        await _settle()
+
+        await pool.shutdown()
+
+        assert manager.alive == set()
+        assert pool.spare_count(config) == 0
+
+    async def test_shutdown_releases_spares_still_warming(self) -> None:
+        manager = StalledProcessManager()
+        allocator = FakePortAllocator()
+        config = ProcessConfig(command="uvx", args=("pkg",))
+        pool = WarmProcessPool(manager, allocator, size=1)
+        await pool.prewarm(config)
+        await _settle()
+
+        await pool.shutdown()
+
+        assert allocator.released == [9001]
+        assert manager.alive == set()
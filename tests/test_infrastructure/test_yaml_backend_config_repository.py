@@ -0,0 +1,133 @@
+import asyncio
+
+from mcp_server.infrastructure.config.yaml_backend_config_repository import (
+    YamlBackendConfigRepository,
+)
+
+CONFIG = """
+backends:
+  - name: alpha
+    source: alpha-pkg
+    port: 9101
+"""
+
+
+async def _next_change(repository: YamlBackendConfigRepository, changes: list) -> None:
+    async for configs in repository.watch_changes():
+        changes.append([c.name for c in configs])
+
+
+async def _watch(repository: YamlBackendConfigRepository, edit) -> list:
+    changes: list = []
+    task = asyncio.create_task(_next_change(repository, changes))
+    await asyncio.sleep(0.2)
+    await edit()
+    await asyncio.sleep(0.6)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    return changes
+
+
+def _repository(tmp_path) -> YamlBackendConfigRepository:
+    config_path = tmp_path / "backends.yaml"
+    config_path.write_text(CONFIG)
+    return YamlBackendConfigRepository(str(config_path), debounce_ms=50)
+
+
+class TestWatchChanges:
+    async def test_own_writes_are_not_reported(self, tmp_path) -> None:
+        repository = _repository(tmp_path)
+        configs = await repository.load_configs()
+
+        async def edit() -> None:
+            await repository.remove_config("alpha")
+            await repository.save_config(configs[0])
+
+        assert await _watch(repository, edit) == []
+
+    async def test_external_edit_burst_is_reported_once(self, tmp_path) -> None:
+        repository = _repository(tmp_path)
+        await repository.load_configs()
+
+        async def edit() -> None:
+            for i in range(3):
+                (tmp_path / "backends.yaml").write_text(
+                    CONFIG + f"  - name: beta{i}\n    source: beta-pkg\n"
+                )
+                await asyncio.sleep(0.01)
+
+        assert await _watch(repository, edit) == [["alpha", "beta2"]]
+
+    async def test_touch_without_content_change_is_ignored(self, tmp_path) -> None:
+        repository = _repository(tmp_path)
+        await repository.load_configs()
+
+        async def edit() -> None:
+            (tmp_path / "backends.yaml").write_text(CONFIG)
+
+        assert await _watch(repository, edit) == []
+
+    async def test_external_edit_survives_interleaved_own_write(
+        self, tmp_path
+    ) -> None:
+        repository = _repository(tmp_path)
+        configs = await repository.load_configs()
+
+        async def edit() -> None:
+            (tmp_path / "backends.yaml").write_text(
+                CONFIG + "  - name: beta\n    source: beta-pkg\n"
+            )
+            await repository.save_config(configs[0])
+
+        assert await _watch(repository, edit) == [["beta", "alpha"]]
+
+
+class TestResourceCacheRules:
+    async def test_rules_round_trip(self, tmp_path) -> None:
+        config_path = tmp_path / "backends.yaml"
+        config_path.write_text(
+            CONFIG
+            + """    resource_cache:
+      - pattern: "docs://*"
+        ttl_seconds: 300
+        stale_while_revalidate_seconds: 60
+"""
+        )
+        repository = YamlBackendConfigRepository(str(config_path))
+        configs = await repository.load_configs()
+        await repository.replace_configs(configs)
+
+        (config,) = await repository.load_configs()
+
+        rule = config.resource_cache_rule("docs://guide/intro")
+        assert rule is not None
+        assert (rule.ttl_seconds, rule.stale_while_revalidate_seconds) == (300, 60)
+        assert config.resource_cache_rule("files://notes") is None
+
+
+class TestRateLimitRules:
+    async def test_rules_round_trip(self, tmp_path) -> None:
+        config_path = tmp_path / "backends.yaml"
+        config_path.write_text(
+            CONFIG
+            + """    rate_limits:
+      - scope: backend
+        rate_per_second: 50
+        burst: 100
+      - scope: tool
+        pattern: "export_*"
+        rate_per_second: 0.5
+"""
+        )
+        repository = YamlBackendConfigRepository(str(config_path))
+        configs = await repository.load_configs()
+        await repository.replace_configs(configs)
+
+        (config,) = await repository.load_configs()
+
+        assert [
+            (r.scope, r.pattern, r.rate_per_second, r.burst) for r in config.rate_limits
+        ] == [
+            ("backend", "*", 50, 100),
+            ("tool", "export_*", 0.5, 1),
+        ]
@@ -0,0 +1,58 @@
+import httpx
+from fastmcp import FastMCP
+
+from mcp_server.presentation.server_factory import _register_backend_notifications
+
+UPDATED = {
+    "jsonrpc": "2.0",
+    "method": "notifications/resources/updated",
+    "params": {"uri": "docs://readme"},
+}
+
+
+class RecordingRegistrar:
+    def __init__(self) -> None:
+        self.updated: list[tuple[str, str]] = []
+
+    async def resource_updated(self, backend_name: str, uri: str) -> None:
+        self.updated.append((backend_name, uri))
+
+
+async def _post(
+    token: str, client: tuple[str, int], headers: dict[str, str] | None = None
+) -> tuple[httpx.Response, RecordingRegistrar]:
+    server = FastMCP("test-router")
+    registrar = RecordingRegistrar()
+    _register_backend_notifications(server, registrar, token)
+    transport = httpx.ASGITransport(app=server.http_app(), client=client)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://router") as http:
+        response = await http.post(
+            "/backends/alpha/notifications", json=UPDATED, headers=headers
+        )
+    return response, registrar
+
+
+class TestBackendNotifications:
+    async def test_loopback_clients_are_accepted_without_token(self) -> None:
+        response, registrar = await _post("", ("127.0.0.1", 5000))
+
+        assert response.status_code == 202
+        assert registrar.updated == [("alpha", "docs://readme")]
+
+    async def test_remote_clients_are_rejected_without_token(self) -> None:
+        response, registrar = await _post("", ("10.0.0.5", 5000))
+
+        assert response.status_code == 401
+        assert registrar.updated == []
+
+    async def test_token_is_required_when_configured(self) -> None:
+        rejected, registrar = await _post("s3cret", ("127.0.0.1", 5000))
+        accepted, other = await _post(
+            "s3cret", ("10.0.0.5", 5000), {"Authorization": "Bearer s3cret"}
+        )
+
+        assert rejected.status_code == 401
+        assert registrar.updated == []
+        assert accepted.status_code == 202
+        assert other.updated == [("alpha", "docs://readme")]
@@ -0,0 +1,76 @@
+import httpx
+from fastmcp import FastMCP
+
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.value_objects import (
+    BackendConfig,
+    BackendSource,
+    BackendSourceType,
+)
+from mcp_server.infrastructure.repositories import InMemoryBackendRepository
+from mcp_server.presentation.capability_catalog import CapabilityCatalog
+from mcp_server.presentation.server_factory import _register_catalog
+
+
+def _backend(name: str) -> Backend:
+    return Backend(
+        config=BackendConfig(
+            name=name,
+            source=BackendSource(
+                source_type=BackendSourceType.HTTP,
+                http_url=f"http://localhost/{name}",
+            ),
+            namespace=name,
+        )
+    )
+
+
+def _catalog() -> tuple[CapabilityCatalog, Backend]:
+    repository = InMemoryBackendRepository()
+    backend = _backend("alpha")
+    backend.update_capabilities([{"name": "search"}], [{"uri": "docs://a"}], [])
+    repository.add(backend)
+    return CapabilityCatalog(repository, enable_namespace_prefixing=True), backend
+
+
+class TestCapabilityCatalog:
+    def test_snapshot_is_reused_until_capabilities_change(self) -> None:
+        catalog, backend = _catalog()
+        first = catalog.snapshot()
+
+        assert backend.update_capabilities(
+            [{"name": "search"}], [{"uri": "docs://a"}], []
+        ) is False
+        assert catalog.snapshot() is first
+
+        assert backend.update_capabilities([{"name": "fetch"}], [], []) is True
+        second = catalog.snapshot()
+        assert second.version != first.version
+        assert [t["name"] for t in second.data["tools"]] == ["alpha.fetch"]
+
+    def test_body_is_preserialized_catalog(self) -> None:
+        catalog, _ = _catalog()
+
+        snapshot = catalog.snapshot()
+
+        assert httpx.Response(200, content=snapshot.body).json() == snapshot.data
+        assert catalog.is_current(snapshot.etag)
+        assert not catalog.is_current("stale")
+
+    async def test_http_route_honours_if_none_match(self) -> None:
+        catalog, _ = _catalog()
+        server = FastMCP("test-router")
+        _register_catalog(server, catalog)
+        transport = httpx.ASGITransport(app=server.http_app())
+
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://router"
+        ) as client:
+            response = await client.get("/catalog")
+            etag = response.headers["etag"]
+            cached = await client.get("/catalog", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()["version"] == catalog.snapshot().version
+        assert cached.status_code == 304
+        assert cached.content == b""
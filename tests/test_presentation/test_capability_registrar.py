@@ -0,0 +1,240 @@
+import asyncio
+from typing import Any
+
+import pytest
+from fastmcp import Client, FastMCP
+from fastmcp.client.messages import MessageHandler
+from mcp.shared.exceptions import McpError
+
+from mcp_server.application.ports import MCPClientPort
+from mcp_server.application.use_cases import ReadResource, RenderPrompt, RouteToolCall
+from mcp_server.domain.entities import Backend
+from mcp_server.domain.services import ToolSearchIndex
+from mcp_server.domain.value_objects import (
+    BackendConfig,
+    BackendSource,
+    BackendSourceType,
+)
+from mcp_server.infrastructure.repositories import InMemoryBackendRepository
+from mcp_server.presentation.capability_registrar import (
+    CapabilityRegistrar,
+    SessionTracker,
+)
+
+
+class EchoClient(MCPClientPort):
+    def __init__(self) -> None:
+        self.prompt_renders = 0
+
+    async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> Any:
+        return {"tool": tool_name, "arguments": arguments}
+
+    async def get_resource(self, uri: str) -> str:
+        return f"contents of {uri}"
+
+    async def get_prompt(self, prompt_name: str, arguments: dict[str, Any]) -> str:
+        self.prompt_renders += 1
+        return f"{prompt_name} for {arguments.get('topic')}"
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        return []
+
+    async def list_resources(self) -> list[dict[str, Any]]:
+        return []
+
+    async def list_prompts(self) -> list[dict[str, Any]]:
+        return []
+
+
+class ListChangedRecorder(MessageHandler):
+    def __init__(self) -> None:
+        self.tools_changed = asyncio.Event()
+
+    async def on_tool_list_changed(self, message) -> None:
+        self.tools_changed.set()
+
+
+def _tool(name: str, description: str = "") -> dict[str, Any]:
+    return {
+        "name": name,
+        "description": description,
+        "inputSchema": {"type": "object", "properties": {"q": {"type": "string"}}},
+    }
+
+
+def _setup(**options: Any) -> tuple[FastMCP, CapabilityRegistrar, Backend]:
+    server = FastMCP("test-router")
+    tracker = SessionTracker()
+    server.add_middleware(tracker)
+
+    repository = InMemoryBackendRepository()
+    client_factory: dict[str, MCPClientPort] = {"alpha": EchoClient()}
+    backend = Backend(
+        config=BackendConfig(
+            name="alpha",
+            source=BackendSource(
+                source_type=BackendSourceType.HTTP,
+                http_url="http://localhost:9001",
+            ),
+            namespace="alpha",
+        )
+    )
+    repository.add(backend)
+
+    registrar = CapabilityRegistrar(
+        server=server,
+        route_tool_call=RouteToolCall(repository, client_factory),
+        read_resource=ReadResource(repository, client_factory),
+        render_prompt=RenderPrompt(client_factory),
+        enable_namespace_prefixing=True,
+        session_tracker=tracker,
+        **options,
+    )
+    return server, registrar, backend
+
+
+async def _tool_names(client: Client) -> set[str]:
+    return {tool.name for tool in await client.list_tools()}
+
+
+class TestCapabilityRegistrar:
+    async def test_tools_and_resources_are_proxied(self) -> None:
+        server, registrar, backend = _setup()
+        backend.update_capabilities(
+            [_tool("search")], [{"uri": "docs://readme", "name": "readme"}], []
+        )
+
+        await registrar.capabilities_changed(backend)
+
+        async with Client(server) as client:
+            assert await _tool_names(client) == {"alpha.search"}
+            result = await client.call_tool("alpha.search", {"q": "x"})
+            assert '"arguments":{"q":"x"}' in result.content[0].text
+            contents = await client.read_resource("alpha://docs://readme")
+            assert contents[0].text == "contents of docs://readme"
+
+    async def test_resource_templates_route_through_one_trie(self) -> None:
+        server, registrar, backend = _setup()
+        backend.update_capabilities(
+            [],
+            [
+                {"uri": "data://items/latest", "name": "latest"},
+                {"uriTemplate": "data://items/{item_id}", "name": "item"},
+            ],
+            [],
+        )
+
+        await registrar.capabilities_changed(backend)
+
+        assert server._resource_manager._resources == {}
+        assert server._resource_manager._templates == {}
+        async with Client(server) as client:
+            (template,) = await client.list_resource_templates()
+            assert template.uriTemplate == "alpha://data//items/{item_id}"
+            contents = await client.read_resource("alpha://data://items/42")
+            assert contents[0].text == "contents of data://items/42"
+            contents = await client.read_resource("alpha://data://items/latest")
+            assert contents[0].text == "contents of data://items/latest"
+        assert registrar.resource_count == 2
+
+    async def test_only_changed_tools_are_replaced(self) -> None:
+        server, registrar, backend = _setup()
+        backend.update_capabilities([_tool("a"), _tool("b")], [], [])
+        await registrar.capabilities_changed(backend)
+        original_a = await server.get_tool("alpha.a")
+
+        backend.update_capabilities([_tool("a"), _tool("c", "new")], [], [])
+        await registrar.capabilities_changed(backend)
+
+        async with Client(server) as client:
+            assert await _tool_names(client) == {"alpha.a", "alpha.c"}
+        assert await server.get_tool("alpha.a") is original_a
+
+    async def test_backend_removal_unregisters_everything(self) -> None:
+        server, registrar, backend = _setup()
+        backend.update_capabilities(
+            [_tool("a")], [{"uri": "docs://readme"}], [{"name": "summarize"}]
+        )
+        await registrar.capabilities_changed(backend)
+
+        await registrar.backend_removed("alpha")
+
+        async with Client(server) as client:
+            assert await _tool_names(client) == set()
+            assert await client.list_resources() == []
+            assert await client.list_prompts() == []
+        assert registrar.tool_count == 0
+        assert registrar.prompt_count == 0
+
+    async def test_prompts_are_proxied_and_renders_cached(self) -> None:
+        server, registrar, backend = _setup()
+        prompt = {
+            "name": "summarize",
+            "description": "Summarize a topic",
+            "arguments": [{"name": "topic", "required": True}],
+        }
+        backend.update_capabilities([], [], [prompt])
+        await registrar.capabilities_changed(backend)
+        echo = registrar.render_prompt.client_factory["alpha"]
+
+        async with Client(server) as client:
+            (listed,) = await client.list_prompts()
+            assert listed.name == "alpha.summarize"
+            assert [(a.name, a.required) for a in listed.arguments] == [
+                ("topic", True)
+            ]
+            for _ in range(3):
+                result = await client.get_prompt("alpha.summarize", {"topic": "x"})
+            assert result.messages[0].content.text == "summarize for x"
+            assert echo.prompt_renders == 1
+
+            backend.update_capabilities([], [], [{**prompt, "description": "new"}])
+            await registrar.capabilities_changed(backend)
+            await client.get_prompt("alpha.summarize", {"topic": "x"})
+            assert echo.prompt_renders == 2
+
+    async def test_removed_prompts_are_unregistered(self) -> None:
+        server, registrar, backend = _setup()
+        backend.update_capabilities(
+            [], [], [{"name": "summarize"}, {"name": "translate"}]
+        )
+        await registrar.capabilities_changed(backend)
+
+        backend.update_capabilities([], [], [{"name": "translate"}])
+        await registrar.capabilities_changed(backend)
+
+        assert set(await server.get_prompts()) == {"alpha.translate"}
+        async with Client(server) as client:
+            assert [p.name for p in await client.list_prompts()] == ["alpha.translate"]
+            with pytest.raises(McpError):
+                await client.get_prompt("alpha.summarize", {})
+
+        await registrar.backend_removed("alpha")
+        assert await server.get_prompts() == {}
+        assert registrar.prompt_count == 0
+
+    async def test_connected_clients_are_notified(self) -> None:
+        server, registrar, backend = _setup()
+        recorder = ListChangedRecorder()
+
+        async with Client(server, message_handler=recorder) as client:
+            await client.list_tools()
+            backend.update_capabilities([_tool("late")], [], [])
+            await registrar.capabilities_changed(backend)
+
+            await asyncio.wait_for(recorder.tools_changed.wait(), timeout=2)
+            assert await _tool_names(client) == {"alpha.late"}
+
+    async def test_search_mode_indexes_without_listing(self) -> None:
+        index = ToolSearchIndex()
+        server, registrar, backend = _setup(search_index=index, expose_tools=False)
+        backend.update_capabilities([_tool("search", "Find documents")], [], [])
+
+        await registrar.capabilities_changed(backend)
+
+        async with Client(server) as client:
+            assert await _tool_names(client) == set()
+        assert [hit.name for hit in index.search("documents")] == ["alpha.search"]
+
+        await registrar.backend_removed("alpha")
+        assert len(index) == 0
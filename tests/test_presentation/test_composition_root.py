@@ -0,0 +1,106 @@
+import asyncio
+import time
+
+from mcp_server.domain.exceptions import ProcessManagementError
+from mcp_server.presentation import CompositionRoot
+from tests.fakes import FakeProcessManager
+
+CONFIG = """
+backends:
+  - name: alpha
+    source: alpha-pkg
+    port: 9101
+  - name: beta
+    source: beta-pkg
+    port: 9102
+  - name: broken
+    source: broken-pkg
+    port: 9103
+"""
+
+
+class SlowProcessManager(FakeProcessManager):
+    async def wait_until_ready(self, pid: int, timeout: float = 30.0) -> None:
+        if "broken-pkg" in self.configs[pid].args:
+            raise ProcessManagementError("exited with code 1 before becoming ready")
+        await asyncio.sleep(0.2)
+
+
+class StubDiscovery:
+    async def execute_for_backend(self, backend, client) -> None:
+        backend.update_capabilities([{"name": f"{backend.name}_tool"}], [], [])
+
+
+class FailingDiscovery(StubDiscovery):
+    async def execute_for_backend(self, backend, client) -> None:
+        if backend.name == "beta":
+            raise RuntimeError("discovery crashed")
+        await super().execute_for_backend(backend, client)
+
+
+def _composition_root(tmp_path, concurrency: int) -> CompositionRoot:
+    config_path = tmp_path / "backends.yaml"
+    config_path.write_text(CONFIG)
+    root = CompositionRoot(str(config_path), startup_concurrency=concurrency)
+    root._process_manager = SlowProcessManager()
+    root._discover_capabilities = StubDiscovery()
+    return root
+
+
+class TestParallelInitialization:
+    async def test_startup_time_tracks_slowest_backend(self, tmp_path) -> None:
+        root = _composition_root(tmp_path, concurrency=8)
+
+        started = time.perf_counter()
+        await root.initialize_backends()
+
+        assert time.perf_counter() - started < 0.35
+
+    async def test_concurrency_limit_serializes_starts(self, tmp_path) -> None:
+        root = _composition_root(tmp_path, concurrency=1)
+
+        started = time.perf_counter()
+        await root.initialize_backends()
+
+        assert time.perf_counter() - started >= 0.4
+
+    async def test_failures_are_isolated_and_reported(self, tmp_path) -> None:
+        root = _composition_root(tmp_path, concurrency=8)
+
+        timelines = await root.initialize_backends()
+
+        by_name = {t.backend_name: t for t in timelines}
+        assert by_name["alpha"].succeeded
+        assert by_name["alpha"].ready_seconds >= by_name["alpha"].spawned_seconds
+        assert by_name["alpha"].discovered_seconds >= by_name["alpha"].ready_seconds
+        assert "exited" in by_name["broken"].error
+        assert [b.name for b in root.backend_repository.get_all()] == ["alpha", "beta"]
+
+    async def test_discovery_errors_are_isolated(self, tmp_path) -> None:
+        root = _composition_root(tmp_path, concurrency=8)
+        root._discover_capabilities = FailingDiscovery()
+
+        timelines = await root.initialize_backends()
+
+        by_name = {t.backend_name: t for t in timelines}
+        assert by_name["alpha"].succeeded
+        assert by_name["beta"].error == "discovery crashed"
+        assert "beta" not in root.client_factory
+        assert [b.name for b in root.backend_repository.get_all()] == ["alpha"]
+        assert len(root.process_manager.alive) == 1
+
+    async def test_client_errors_are_isolated(self, tmp_path) -> None:
+        config_path = tmp_path / "backends.yaml"
+        config_path.write_text(
+            CONFIG + "  - name: idle\n    source: idle-pkg\n    auto_start: false\n"
+        )
+        root = CompositionRoot(str(config_path))
+        root._process_manager = SlowProcessManager()
+        root._discover_capabilities = StubDiscovery()
+
+        timelines = await root.initialize_backends()
+
+        by_name = {t.backend_name: t for t in timelines}
+        assert "no accessible URL" in by_name["idle"].error
+        assert by_name["alpha"].succeeded
+        assert by_name["beta"].succeeded
@@ -0,0 +1,233 @@
+import asyncio
+import json
+import shutil
+
+from mcp_server.config import RouterConfig
+from mcp_server.domain.value_objects import BackendSourceType
+from mcp_server.infrastructure.config.yaml_backend_config_repository import (
+    YamlBackendConfigRepository,
+)
+from mcp_server.presentation import CompositionRoot
+from mcp_server.presentation.supervisor import RouterSupervisor, WorkerProcess
+from tests.fakes import FakeProcessManager
+
+CONFIG = """
+backends:
+  - name: alpha
+    source: alpha-pkg
+    port: 9101
+  - name: remote
+    url: http://localhost:9200
+    namespace: remote
+"""
+
+
+class StubDiscovery:
+    async def execute_for_backend(self, backend, client) -> None:
+        backend.update_capabilities([{"name": f"{backend.name}_tool"}], [], [])
+
+
+class StubProcess:
+    def __init__(self, pid: int) -> None:
+        self.pid = pid
+        self.returncode: int | None = None
+
+
+def _worker(slot: int, pid: int, ready: bool = True) -> WorkerProcess:
+    return WorkerProcess(
+        slot=slot, process=StubProcess(pid), started_at=0.0, ready=ready
+    )
+
+
+def _supervisor(tmp_path) -> RouterSupervisor:
+    config_path = tmp_path / "backends.yaml"
+    config_path.write_text(CONFIG)
+    supervisor = RouterSupervisor(
+        RouterConfig(backends_config_path=str(config_path)),
+        host="127.0.0.1",
+        port=0,
+        workers=2,
+    )
+    supervisor.composition_root._process_manager = FakeProcessManager()
+    supervisor.composition_root._discover_capabilities = StubDiscovery()
+    return supervisor
+
+
+def _worker_root(supervisor: RouterSupervisor) -> CompositionRoot:
+    return CompositionRoot(
+        str(supervisor.state_dir / "backends.yaml"),
+        config_debounce_ms=50,
+        capability_snapshot_path=str(supervisor.capability_snapshot_path),
+        state_db_path=supervisor.config.state_db_path,
+    )
+
+
+class TestWorkerState:
+    async def test_export_points_workers_at_running_backends(self, tmp_path) -> None:
+        supervisor = _supervisor(tmp_path)
+        try:
+            await supervisor.composition_root.initialize_backends()
+
+            assert await supervisor.export_worker_state()
+
+            configs = await YamlBackendConfigRepository(
+                str(supervisor.state_dir / "backends.yaml")
+            ).load_configs()
+            assert {c.name: c.source.source_type for c in configs} == {
+                "alpha": BackendSourceType.HTTP,
+                "remote": BackendSourceType.HTTP,
+            }
+            assert {c.name: c.url for c in configs}["alpha"] == "http://localhost:9101"
+            snapshot = json.loads(supervisor.capability_snapshot_path.read_text())
+            assert snapshot["backends"]["alpha"]["tools"] == [{"name": "alpha_tool"}]
+        finally:
+            shutil.rmtree(supervisor.state_dir)
+
+    async def test_export_is_skipped_when_nothing_changed(self, tmp_path) -> None:
+        supervisor = _supervisor(tmp_path)
+        try:
+            await supervisor.composition_root.initialize_backends()
+            await supervisor.export_worker_state()
+
+            assert not await supervisor.export_worker_state()
+
+            backend = supervisor.composition_root.backend_repository.get("alpha")
+            backend.update_capabilities([{"name": "renamed"}], [], [])
+            assert await supervisor.export_worker_state()
+        finally:
+            shutil.rmtree(supervisor.state_dir)
+
+    async def test_workers_load_snapshot_instead_of_discovering(self, tmp_path) -> None:
+        supervisor = _supervisor(tmp_path)
+        try:
+            await supervisor.composition_root.initialize_backends()
+            await supervisor.export_worker_state()
+
+            worker = CompositionRoot(
+                str(supervisor.state_dir / "backends.yaml"),
+                capability_snapshot_path=str(supervisor.capability_snapshot_path),
+            )
+            await worker.initialize_backends()
+
+            remote = worker.backend_repository.get("remote")
+            assert remote is not None
+            assert remote.tools == [{"name": "remote_tool"}]
+            assert remote.is_healthy
+        finally:
+            shutil.rmtree(supervisor.state_dir)
+
+    async def test_workers_apply_capability_changes(self, tmp_path) -> None:
+        supervisor = _supervisor(tmp_path)
+        try:
+            await supervisor.composition_root.initialize_backends()
+            await supervisor.export_worker_state()
+            worker = _worker_root(supervisor)
+            await worker.initialize_backends()
+            await worker.capability_snapshot_watcher.start()
+            await asyncio.sleep(0.2)
+
+            backend = supervisor.composition_root.backend_repository.get("remote")
+            backend.update_capabilities([{"name": "renamed"}], [], [])
+            await supervisor.export_worker_state()
+            await asyncio.sleep(0.6)
+            await worker.capability_snapshot_watcher.stop()
+
+            remote = worker.backend_repository.get("remote")
+            assert remote.tools == [{"name": "renamed"}]
+        finally:
+            shutil.rmtree(supervisor.state_dir)
+
+    async def test_workers_register_from_snapshot(self, tmp_path) -> None:
+        supervisor = _supervisor(tmp_path)
+        try:
+            await supervisor.composition_root.initialize_backends()
+            await supervisor.export_worker_state()
+            configs = await YamlBackendConfigRepository(
+                str(supervisor.state_dir / "backends.yaml")
+            ).load_configs()
+            worker = _worker_root(supervisor)
+
+            remote = next(c for c in configs if c.name == "remote")
+            await worker.register_backend.execute_config(remote, persist=False)
+
+            backend = worker.backend_repository.get("remote")
+            assert backend.tools == [{"name": "remote_tool"}]
+            assert backend.is_healthy
+        finally:
+            shutil.rmtree(supervisor.state_dir)
+
+    def test_workers_leave_the_lease_to_the_supervisor(self, tmp_path) -> None:
+        supervisor = _supervisor(tmp_path)
+        try:
+            worker = _worker_root(supervisor)
+
+            assert worker.leader_lease is None
+            assert not worker.is_leader
+            assert supervisor.composition_root.leader_lease is not None
+        finally:
+            shutil.rmtree(supervisor.state_dir)
+
+
+class TestRollingRestart:
+    def _stub_workers(self, supervisor: RouterSupervisor, ready: bool, delay=0.0):
+        supervisor.workers = {0: _worker(0, 100), 1: _worker(1, 101)}
+        terminated: list[int] = []
+
+        async def start_worker(slot: int) -> WorkerProcess:
+            await asyncio.sleep(delay)
+            worker = supervisor.workers[slot] = _worker(slot, 200 + slot, ready)
+            return worker
+
+        async def terminate(worker: WorkerProcess) -> None:
+            terminated.append(worker.pid)
+
+        supervisor._start_worker = start_worker
+        supervisor._terminate = terminate
+        return terminated
+
+    async def test_ready_replacements_take_over(self, tmp_path) -> None:
+        supervisor = _supervisor(tmp_path)
+        try:
+            terminated = self._stub_workers(supervisor, ready=True)
+
+            assert await supervisor.rolling_restart()
+
+            assert terminated == [100, 101]
+            assert [w.pid for w in supervisor.workers.values()] == [200, 201]
+        finally:
+            shutil.rmtree(supervisor.state_dir)
+
+    async def test_failed_replacement_keeps_old_workers(self, tmp_path) -> None:
+        supervisor = _supervisor(tmp_path)
+        try:
+            terminated = self._stub_workers(supervisor, ready=False)
+
+            assert not await supervisor.rolling_restart()
+
+            assert terminated == []
+            assert [w.pid for w in supervisor.workers.values()] == [100, 101]
+        finally:
+            shutil.rmtree(supervisor.state_dir)
+
+    async def test_lease_is_renewed_during_a_slow_restart(self, tmp_path) -> None:
+        supervisor = _supervisor(tmp_path)
+        try:
+            self._stub_workers(supervisor, ready=True, delay=0.2)
+            supervisor.check_interval = 0.01
+            renewals: list[int] = []
+
+            async def renew_lease() -> None:
+                renewals.append(len(renewals))
+
+            supervisor._renew_lease = renew_lease
+            supervisor._reload_requested.set()
+
+            task = asyncio.create_task(supervisor._supervise())
+            await asyncio.sleep(0.15)
+            during_restart = len(renewals)
+            supervisor._stopping.set()
+            await task
+
+            assert during_restart >= 5
+        finally:
+            shutil.rmtree(supervisor.state_dir)